@@ -28,7 +28,7 @@ Expected output:
 import os
 import sys
 
-from ticktick_sdk import TickTickClient
+from ticktick_sdk import Task, TickTickClient
 
 
 def main() -> None:
@@ -65,36 +65,45 @@ def main() -> None:
     client.task.batch_create(task_specs)
     print(f"\nBatch-created {len(task_specs)} tasks.")
 
-    # Reload to get server-assigned IDs
-    all_tasks = client.task.get_all()
-    titles = {s["title"] for s in task_specs}
-    created = [t for t in all_tasks if t.title in titles]
+    # batch_create fills in each spec's id, so no re-fetch is needed
+    created = Task.from_dicts(task_specs)
 
-    # 2. Tag individual tasks
+    # 2. Tag individual tasks and 3. move one task between projects.
+    # Both are plain field changes, so they share a single batch request.
+    tagged = []
     for task in created:
         if task.project_id == personal_project.id and "grocery" in task.title.lower():
             task.tags = ["personal", "errands"]
-            client.task.update(task)
-            print(f"Tagged \"{task.title}\" with {task.tags}.")
+            tagged.append(task)
         elif task.project_id == work_project.id and "Q2" in task.title:
             task.tags = ["work", "quarterly"]
-            client.task.update(task)
-            print(f"Tagged \"{task.title}\" with {task.tags}.")
+            tagged.append(task)
+    updates = [{"id": t.id, "projectId": t.project_id, "tags": t.tags} for t in tagged]
 
-    # 3. Move one task between projects
     standup = next((t for t in created if "standup" in t.title.lower()), None)
     if standup:
-        client.task.move(standup.id, work_project.id, personal_project.id)
+        standup.project_id = personal_project.id
+        updates.append({"id": standup.id, "projectId": standup.project_id})
+
+    if updates:
+        client.task.batch_update(updates)
+    for task in tagged:
+        print(f"Tagged \"{task.title}\" with {task.tags}.")
+    if standup:
         print(f"\nMoved \"{standup.title}\" -> {personal_project.name} (was {work_project.name}).")
 
-    # 4. Batch-complete the first three tasks
-    to_complete = created[:3]
-    updates = [{"id": t.id, "projectId": t.project_id, "status": 2} for t in to_complete]
-    client.task.batch_update(updates)
-    print(f"\nCompleted {len(to_complete)} tasks.")
+    # 4. Batch-complete the first three tasks and 5. batch-delete everything
+    # created in this demo; both payloads come from one pass over the tasks
+    completions = []
+    to_delete = []
+    for i, t in enumerate(created):
+        to_delete.append({"taskId": t.id, "projectId": t.project_id})
+        if i < 3:
+            completions.append({"id": t.id, "projectId": t.project_id, "status": 2})
+
+    client.task.batch_update(completions)
+    print(f"\nCompleted {len(completions)} tasks.")
 
-    # 5. Batch-delete everything created in this demo
-    to_delete = [{"taskId": t.id, "projectId": t.project_id} for t in created]
     client.task.batch_delete(to_delete)
     print(f"\nDeleted {len(to_delete)} tasks. Done.")
 
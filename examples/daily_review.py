@@ -32,24 +32,21 @@ Expected output:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 
-from ticktick_sdk import TickTickClient
-
 PRIORITY_LABEL = {0: "none", 1: "low", 3: "medium", 5: "high"}
 
 
-def parse_due(due_str: str | None) -> datetime | None:
-    """Parse a TickTick due-date string into a timezone-aware datetime."""
-    if not due_str:
+def parse_due(due: datetime | None) -> datetime | None:
+    """Normalise a task's due date into a timezone-aware UTC datetime.
+
+    ``Task.from_dict`` already parses ``dueDate``, so only the timezone
+    needs settling here.
+    """
+    if due is None:
         return None
-    for fmt in ("%Y-%m-%dT%H:%M:%S.000+0000", "%Y-%m-%dT%H:%M:%S+0000"):
-        try:
-            dt = datetime.strptime(due_str, fmt)
-            return dt.replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
-    return None
+    return due.replace(tzinfo=timezone.utc) if due.tzinfo is None else due.astimezone(timezone.utc)
 
 
 def main() -> None:
@@ -62,74 +59,86 @@ def main() -> None:
         )
         sys.exit(1)
 
+    # Imported only once a token is known so that the missing-token exit path
+    # doesn't pay for loading requests and the SDK.
+    from ticktick_sdk import TickTickClient
+
     client = TickTickClient(token=token)
 
     today = date.today()
-    today_str = today.strftime("%Y-%m-%d")
+    today_str = today.isoformat()
     now = datetime.now(timezone.utc)
 
-    print(f"\n=== Daily Review: {today_str} ===")
+    start_of_day = f"{today_str} 00:00:00"
+    end_of_day   = f"{today_str} 23:59:59"
+
+    # The four reads are independent, so issue them concurrently over the
+    # client's shared connection pool instead of paying for each round trip.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        projects_f = ex.submit(client.project.get_all)
+        due_f = ex.submit(client.search.filter_tasks, status=0, has_due_date=True)
+        completed_f = ex.submit(client.task.get_completed, from_date=start_of_day, to_date=end_of_day, limit=200)
+        habits_f = ex.submit(client.habit.get_active)
+
+    # Collect the report and write it in one go rather than line by line
+    lines = [f"\n=== Daily Review: {today_str} ==="]
 
     # Build a project name lookup for display
-    projects = client.project.get_all()
+    projects = projects_f.result()
     project_name = {p.id: p.name for p in projects}
 
     # 1. All open tasks (status=0) that have a due date
-    due_tasks = client.search.filter_tasks(status=0, has_due_date=True)
-
-    tasks_due_today = [
-        t for t in due_tasks
-        if parse_due(t.due_date) and parse_due(t.due_date).date() == today
-    ]
-    overdue_tasks = [
-        t for t in due_tasks
-        if parse_due(t.due_date) and parse_due(t.due_date) < now
-        and parse_due(t.due_date).date() < today
-    ]
-
-    print(f"\nDue today ({len(tasks_due_today)}):")
-    if tasks_due_today:
-        for t in tasks_due_today:
-            pname = project_name.get(t.project_id, t.project_id)
-            print(f"  [ ] {t.title:<35} [{pname}]  priority={PRIORITY_LABEL.get(t.priority, t.priority)}")
-    else:
-        print("  (none)")
-
-    print(f"\nOverdue ({len(overdue_tasks)}):")
-    if overdue_tasks:
-        for t in sorted(overdue_tasks, key=lambda t: t.due_date or ""):
-            due_dt = parse_due(t.due_date)
-            due_label = due_dt.strftime("%Y-%m-%d") if due_dt else "unknown"
-            print(f"  [ ] {t.title:<35} due {due_label}")
-    else:
-        print("  (none)")
+    due_tasks = due_f.result()
+
+    # Partition in a single pass, parsing each due date once and keeping it
+    # alongside overdue tasks for sorting and display
+    tasks_due_today = []
+    overdue = []
+    for t in due_tasks:
+        d = parse_due(t.due_date)
+        if not d:
+            continue
+        dd = d.date()
+        if dd == today:
+            tasks_due_today.append(t)
+        elif dd < today and d < now:
+            overdue.append((t, d))
+    overdue.sort(key=lambda pair: pair[1])
+
+    lines.append(f"\nDue today ({len(tasks_due_today)}):")
+    lines += [
+        f"  [ ] {t.title:<35} [{project_name.get(t.project_id, t.project_id)}]"
+        f"  priority={PRIORITY_LABEL.get(t.priority, t.priority)}"
+        for t in tasks_due_today
+    ] or ["  (none)"]
+
+    lines.append(f"\nOverdue ({len(overdue)}):")
+    lines += [f"  [ ] {t.title:<35} due {due_dt.strftime('%Y-%m-%d')}" for t, due_dt in overdue] or ["  (none)"]
 
     # 2. Completed today
-    start_of_day = today.strftime("%Y-%m-%d 00:00:00")
-    end_of_day   = today.strftime("%Y-%m-%d 23:59:59")
-    completed_today = client.task.get_completed(
-        from_date=start_of_day,
-        to_date=end_of_day,
-        limit=200,
-    )
-    print(f"\nCompleted today: {len(completed_today)} tasks")
+    completed_today = completed_f.result()
+    lines.append(f"\nCompleted today: {len(completed_today)} tasks")
 
     # 3. Active habits with today's check-in status
-    active_habits = client.habit.get_active()
-    today_stamp = today.strftime("%Y%m%d")
-    checkins = client.habit.get_checkins(
-        habit_ids=[h.id for h in active_habits] if active_habits else None,
-        after_stamp=today_stamp,
-    )
-    checked_today = {c.habit_id for c in checkins if c.checkin_stamp == today_stamp and c.status == 2}
-
-    print(f"\nActive habits ({len(active_habits)}):")
+    active_habits = habits_f.result()
+    today_stamp = today_str.replace("-", "")
+    checked_today: set[str] = set()
+    # Without habit IDs the query returns every habit's history, so skip it
+    # entirely when nothing is active. afterStamp has no upper bound, hence
+    # the date comparison to drop any future-dated records.
     if active_habits:
-        for h in active_habits:
-            status = "yes" if h.id in checked_today else "no"
-            print(f"  - {h.name:<26} checked-in today: {status}")
-    else:
-        print("  (no active habits)")
+        checkins = client.habit.get_checkins(
+            habit_ids=[h.id for h in active_habits],
+            after_stamp=today_stamp,
+        )
+        checked_today = {c.habit_id for c in checkins if c.status == 2 and c.checkin_date == today}
+
+    lines.append(f"\nActive habits ({len(active_habits)}):")
+    lines += [
+        f"  - {h.name:<26} checked-in today: {'yes' if h.id in checked_today else 'no'}" for h in active_habits
+    ] or ["  (no active habits)"]
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
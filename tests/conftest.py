@@ -0,0 +1,77 @@
+"""Shared helpers and fixtures for the manager tests."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ticktick_sdk.client import TickTickClient
+from ticktick_sdk.managers.batch import BatchManager
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+# Shared read-only payloads; MappingProxyType stops a test from mutating them
+EMPTY: Mapping = MappingProxyType({})
+EMPTY_BATCH_RESP: Mapping = MappingProxyType({"id2etag": {}, "id2error": {}})
+DUMMY_TASK: Mapping = MappingProxyType({"id": "x", "projectId": "p1", "title": "T"})
+
+
+def make_response(json_data=None, status_code: int = 200, text: str = ""):
+    """Build a stand-in for requests.Response.
+
+    Managers only read status_code/text and call .json(), so a plain
+    namespace is enough and far cheaper than a spec'd MagicMock.
+    """
+    data = json_data if json_data is not None else {}
+    return SimpleNamespace(status_code=status_code, ok=status_code < 400, text=text, json=lambda: data)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _wire(client: MagicMock, batch: MagicMock) -> MagicMock:
+    client.inbox_id = "inbox123"
+    # Wire up the batch manager with a real-ish mock; an empty snapshot
+    # falls through to a full sync like the real one
+    batch.snapshot.side_effect = lambda: batch.check(0)
+
+    async def asnapshot():
+        return await batch.acheck(0)
+
+    batch.asnapshot.side_effect = asnapshot
+    client.batch = batch
+    return client
+
+
+@pytest.fixture
+def mock_client():
+    """Return a MagicMock standing in for TickTickClient.
+
+    Not spec'd: the tests only check call arguments, and unspec'd mocks are
+    much cheaper to build and to access.
+    """
+    return _wire(MagicMock(), MagicMock())
+
+
+@pytest.fixture(scope="module")
+def _shared_strict_client():
+    # Spec'ing against TickTickClient is comparatively slow, so build it once
+    # per module and let strict_mock_client reset it for each test.
+    return MagicMock(spec=TickTickClient)
+
+
+@pytest.fixture
+def strict_mock_client(_shared_strict_client):
+    """Like mock_client, but spec'd so unknown client attributes raise."""
+    client = _shared_strict_client
+    client.reset_mock(return_value=True, side_effect=True)
+    return _wire(client, MagicMock(spec=BatchManager))
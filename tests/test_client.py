@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import requests
 
-from ticktick_sdk.client import TickTickClient, BASE_URL, MAX_RETRIES
+from ticktick_sdk.client import (
+    TickTickClient,
+    BASE_URL,
+    MAX_RETRIES,
+    POOL_MAXSIZE,
+    _SENSITIVE_PREFIX_RE,
+    _TokenBucket,
+    _X_DEVICE,
+)
 from ticktick_sdk.exceptions import (
     TickTickAuthError,
     TickTickForbiddenError,
@@ -23,8 +37,13 @@ from ticktick_sdk.exceptions import (
 
 
 def make_response(status_code: int, json_data=None, text: str = "", headers=None):
-    """Build a mock requests.Response."""
-    resp = MagicMock(spec=requests.Response)
+    """Build a mock requests.Response.
+
+    A bare MagicMock is used because spec'ing against requests.Response
+    introspects the class on every call, and these tests only read a handful
+    of attributes.
+    """
+    resp = MagicMock()
     resp.status_code = status_code
     resp.ok = status_code < 400
     resp.text = text or ""
@@ -52,6 +71,98 @@ def client(mock_session):
     return TickTickClient(session=mock_session)
 
 
+# ---------------------------------------------------------------------------
+# session setup
+# ---------------------------------------------------------------------------
+
+
+def test_default_session_mounts_pooled_adapter():
+    client = TickTickClient()
+    adapter = client.session.get_adapter(BASE_URL)
+    assert adapter._pool_maxsize == POOL_MAXSIZE
+    assert adapter.max_retries.connect is None and adapter.max_retries.total == MAX_RETRIES
+    assert adapter.max_retries.read is False
+
+
+def test_session_gets_default_headers_with_compact_device_json():
+    client = TickTickClient()
+    device = client.session.headers["x-device"]
+    assert json.loads(device) == _X_DEVICE
+    assert " " not in device.replace("macOS 10.15.7", "").replace("Chrome 120", "")
+
+
+def test_pool_size_sets_adapter_pool_maxsize():
+    client = TickTickClient(pool_size=64)
+    assert client.session.get_adapter(BASE_URL)._pool_maxsize == 64
+
+
+def test_managers_are_created_once_on_first_access(mock_session):
+    fresh = TickTickClient(session=mock_session)
+    assert "task" not in fresh.__dict__
+
+    manager = fresh.task
+
+    assert fresh.task is manager
+    assert manager._c is fresh
+
+
+def test_http2_without_httpx_raises_import_error():
+    with patch.dict(sys.modules, {"httpx": None}), pytest.raises(ImportError, match="httpx"):
+        TickTickClient(http2=True)
+
+
+def test_httpx_session_gets_body_as_content_and_no_stream_flag():
+    fake_httpx = MagicMock(Client=type("Client", (), {"headers": None, "cookies": None, "request": None}))
+    session = MagicMock(spec=fake_httpx.Client)
+    session.request.return_value = make_response(200)
+    with patch.dict(sys.modules, {"httpx": fake_httpx}):
+        client = TickTickClient(session=session)
+
+    client.post("/api/v2/batch/task", json={"add": []})
+    client.get("/api/v3/batch/check/0", stream=True)
+
+    post, get = session.request.call_args_list
+    assert post.kwargs["content"] == b'{"add":[]}' and post.kwargs["data"] is None
+    assert "stream" not in get.kwargs
+
+
+def test_duck_typed_session_is_driven_like_requests():
+    session = MagicMock()  # a wrapper that is neither requests.Session nor httpx.Client
+    session.request.return_value = make_response(200)
+    client = TickTickClient(session=session)
+
+    client.post("/api/v2/batch/task", json={"add": []})
+    client.get("/api/v3/batch/check/0", stream=True)
+
+    post, get = session.request.call_args_list
+    assert "content" not in post.kwargs
+    assert get.kwargs["stream"] is True
+
+
+def test_cache_without_requests_cache_raises_import_error():
+    with patch.dict(sys.modules, {"requests_cache": None}), pytest.raises(ImportError, match="requests-cache"):
+        TickTickClient(cache=True)
+
+
+def test_cache_uses_cached_session_cleared_by_writes():
+    session = requests.Session()
+    session.cache = MagicMock()
+    fake = MagicMock(CachedSession=MagicMock(return_value=session), DO_NOT_CACHE=-1)
+    with patch.dict(sys.modules, {"requests_cache": fake}):
+        client = TickTickClient(cache=True)
+
+    kwargs = fake.CachedSession.call_args.kwargs
+    assert kwargs["expire_after"] == -1 and kwargs["match_headers"] == ["Cookie"]
+    assert kwargs["urls_expire_after"]["*/api/v3/batch/check/0"] == 0  # stored, always revalidated
+    assert client.session.get_adapter(BASE_URL)._pool_maxsize == POOL_MAXSIZE
+
+    with patch.object(session, "request", side_effect=[make_response(200), make_response(200)]):
+        client.request("GET", "/api/v2/column/project/p1")
+        session.cache.clear.assert_not_called()
+        client.request("POST", "/api/v2/column", json={})
+    session.cache.clear.assert_called_once_with()
+
+
 # ---------------------------------------------------------------------------
 # set_token
 # ---------------------------------------------------------------------------
@@ -87,7 +198,8 @@ def test_request_passes_params_and_json(client, mock_session):
     ok_resp = make_response(200, json_data={})
     mock_session.request.return_value = ok_resp
 
-    client.request("POST", "/api/v2/task", params={"p": "1"}, json={"title": "t"})
+    with patch("ticktick_sdk.client.orjson", None):
+        client.request("POST", "/api/v2/task", params={"p": "1"}, json={"title": "t"})
 
     mock_session.request.assert_called_once_with(
         "POST",
@@ -98,6 +210,97 @@ def test_request_passes_params_and_json(client, mock_session):
     )
 
 
+def test_request_encodes_json_body_with_orjson(client, mock_session):
+    mock_session.request.return_value = make_response(200)
+
+    client.request("POST", "/api/v2/batch/task", json={"add": [{"title": "t", "priority": 5}]})
+
+    kwargs = mock_session.request.call_args.kwargs
+    assert kwargs["json"] is None
+    assert kwargs["data"] == b'{"add":[{"title":"t","priority":5}]}'
+
+
+def test_request_leaves_body_orjson_rejects_to_requests(client, mock_session):
+    mock_session.request.return_value = make_response(200)
+
+    client.request("POST", "/api/v2/something", json={"big": 2**70})
+
+    assert mock_session.request.call_args.kwargs["json"] == {"big": 2**70}
+
+
+def _raw_response(body: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    return resp
+
+
+def test_request_decodes_json_with_orjson(client, mock_session):
+    mock_session.request.return_value = _raw_response(b'{"key": "value"}')
+
+    with patch("ticktick_sdk.client.orjson") as fake_orjson:
+        fake_orjson.loads.return_value = {"key": "value"}
+        resp = client.request("GET", "/api/v2/something")
+        assert resp.json() == {"key": "value"}
+
+    fake_orjson.loads.assert_called_once_with(b'{"key": "value"}')
+
+
+def test_request_orjson_decode_error_is_requests_json_error(client, mock_session):
+    pytest.importorskip("orjson")
+    mock_session.request.return_value = _raw_response(b"<html>busy</html>")
+
+    resp = client.request("GET", "/api/v2/something")
+
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        resp.json()
+
+
+def test_request_keeps_stdlib_json_without_orjson(client, mock_session):
+    mock_session.request.return_value = _raw_response(b'{"key": "value"}')
+
+    with patch("ticktick_sdk.client.orjson", None):
+        resp = client.request("GET", "/api/v2/something")
+
+    assert resp.json() == {"key": "value"}
+
+
+# ---------------------------------------------------------------------------
+# request() – conditional GETs
+# ---------------------------------------------------------------------------
+
+
+def test_cacheable_get_revalidates_with_etag(client, mock_session):
+    first = make_response(200, json_data=[{"id": "t1"}], headers={"ETag": '"v1"'})
+    mock_session.request.side_effect = [first, make_response(304)]
+
+    client.request("GET", "/api/v2/project/all/completed/", params={"limit": 50}, cacheable=True)
+    resp = client.request("GET", "/api/v2/project/all/completed/", params={"limit": 50}, cacheable=True)
+
+    assert resp is first
+    assert mock_session.request.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_non_cacheable_get_sends_no_validator(client, mock_session):
+    mock_session.request.return_value = make_response(200, headers={"ETag": '"v1"'})
+
+    client.request("GET", "/api/v2/foo")
+    client.request("GET", "/api/v2/foo")
+
+    assert "headers" not in mock_session.request.call_args[1]
+
+
+def test_etag_cache_is_bounded(client, mock_session):
+    mock_session.request.return_value = make_response(200, headers={"ETag": '"v"'})
+
+    with patch("ticktick_sdk.client.ETAG_CACHE_SIZE", 2):
+        for i in range(3):
+            client.request("GET", f"/api/v2/item/{i}", cacheable=True)
+
+    assert len(client._etag_cache) == 2
+    assert not any("/item/0" in key for key in client._etag_cache)
+
+
 # ---------------------------------------------------------------------------
 # request() – HTTP error handling
 # ---------------------------------------------------------------------------
@@ -141,6 +344,14 @@ def test_request_raises_api_error_with_non_json_body(client, mock_session):
     with pytest.raises(TickTickAPIError) as exc_info:
         client.request("GET", "/api/v2/error")
     assert exc_info.value.status_code == 500
+    assert exc_info.value.error_message == "Internal Server Error"
+
+
+def test_request_raises_api_error_with_non_object_json_body(client, mock_session):
+    mock_session.request.return_value = make_response(400, json_data=["bad"], text='["bad"]')
+    with pytest.raises(TickTickAPIError) as exc_info:
+        client.request("POST", "/api/v2/error", json={})
+    assert (exc_info.value.error_code, exc_info.value.error_message) == ("", '["bad"]')
 
 
 # ---------------------------------------------------------------------------
@@ -185,9 +396,8 @@ def test_request_raises_rate_limit_after_max_retries(client, mock_session):
 
     mock_session.request.side_effect = [rate_limited] * MAX_RETRIES
 
-    with patch("ticktick_sdk.client.time.sleep"):
-        with pytest.raises(TickTickRateLimitError):
-            client.request("GET", "/api/v2/something")
+    with patch("ticktick_sdk.client.time.sleep"), pytest.raises(TickTickRateLimitError):
+        client.request("GET", "/api/v2/something")
 
     assert mock_session.request.call_count == MAX_RETRIES
 
@@ -199,9 +409,8 @@ def test_rate_limit_error_carries_retry_after(client, mock_session):
 
     mock_session.request.side_effect = [rate_limited] * MAX_RETRIES
 
-    with patch("ticktick_sdk.client.time.sleep"):
-        with pytest.raises(TickTickRateLimitError) as exc_info:
-            client.request("GET", "/api/v2/something")
+    with patch("ticktick_sdk.client.time.sleep"), pytest.raises(TickTickRateLimitError) as exc_info:
+        client.request("GET", "/api/v2/something")
 
     assert exc_info.value.retry_after == 30
 
@@ -212,13 +421,117 @@ def test_rate_limit_error_retry_after_none_when_no_header(client, mock_session):
 
     mock_session.request.side_effect = [rate_limited] * MAX_RETRIES
 
-    with patch("ticktick_sdk.client.time.sleep"):
-        with pytest.raises(TickTickRateLimitError) as exc_info:
-            client.request("GET", "/api/v2/something")
+    with patch("ticktick_sdk.client.time.sleep"), pytest.raises(TickTickRateLimitError) as exc_info:
+        client.request("GET", "/api/v2/something")
 
     assert exc_info.value.retry_after is None
 
 
+def test_request_accepts_http_date_retry_after(client, mock_session):
+    rate_limited = make_response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:10 GMT"})
+    mock_session.request.side_effect = [rate_limited, make_response(200)]
+
+    now = datetime(2015, 10, 21, 7, 28, 0, tzinfo=timezone.utc)
+    with patch("ticktick_sdk.client.datetime") as mock_dt, patch("ticktick_sdk.client.time.sleep") as mock_sleep:
+        mock_dt.now.return_value = now
+        client.request("GET", "/api/v2/something")
+
+    mock_sleep.assert_called_once_with(10)
+
+
+def test_request_backoff_is_jittered(client, mock_session):
+    mock_session.request.side_effect = [make_response(429), make_response(200)]
+
+    with (
+        patch("ticktick_sdk.client.random.random", return_value=0.0),
+        patch("ticktick_sdk.client.time.sleep") as mock_sleep,
+    ):
+        client.request("GET", "/api/v2/something")
+
+    mock_sleep.assert_called_once_with(0.5)
+
+
+def test_gateway_error_retried_for_idempotent_method(client, mock_session):
+    mock_session.request.side_effect = [make_response(503, text="unavailable"), make_response(200)]
+
+    with patch("ticktick_sdk.client.time.sleep"):
+        client.request("GET", "/api/v2/something")
+
+    assert mock_session.request.call_count == 2
+
+
+def test_gateway_error_not_retried_for_post(client, mock_session):
+    mock_session.request.return_value = make_response(503, text="unavailable")
+
+    with pytest.raises(TickTickAPIError) as exc_info:
+        client.request("POST", "/api/v2/batch/task", json={})
+
+    assert exc_info.value.status_code == 503
+    assert mock_session.request.call_count == 1
+
+
+def test_token_bucket_allows_burst_then_paces():
+    with patch("ticktick_sdk.client.time.monotonic", return_value=100.0):
+        bucket = _TokenBucket(rate=2.0, burst=3)
+        waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+
+def test_token_bucket_halves_rate_on_429_and_recovers():
+    bucket = _TokenBucket(rate=10.0, burst=2)
+    bucket.record(429)
+    assert bucket.rate == 5.0
+
+    bucket.record(200)
+    bucket.record(200)
+    assert bucket.rate == 6.0
+
+
+def test_rate_limited_client_waits_and_records_responses(mock_session):
+    mock_session.request.side_effect = [make_response(429), make_response(200)]
+    client = TickTickClient(session=mock_session, rate_limit=4.0)
+    client._bucket._tokens = 0.0
+
+    with patch("ticktick_sdk.client.time.sleep") as mock_sleep:
+        client.request("GET", "/api/v2/something")
+
+    assert mock_sleep.call_args_list[0].args[0] == pytest.approx(0.25, abs=0.01)
+    assert client._bucket.rate == 2.0
+
+
+def test_concurrent_identical_gets_share_one_request(client, mock_session):
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_request(*args, **kwargs):
+        entered.set()
+        release.wait(5)
+        return make_response(200, json_data={"ok": True})
+
+    mock_session.request.side_effect = slow_request
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get("/api/v2/habits"))) for _ in range(2)]
+    threads[0].start()
+    entered.wait(5)
+    threads[1].start()
+    time.sleep(0.1)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert mock_session.request.call_count == 1
+    assert results[0] is results[1]
+    assert client._inflight == {}
+
+
+def test_failed_get_is_not_remembered_for_later_calls(client, mock_session):
+    mock_session.request.side_effect = [make_response(404, text="missing"), make_response(200)]
+
+    with pytest.raises(TickTickNotFoundError):
+        client.get("/api/v2/habits")
+    assert client.get("/api/v2/habits").status_code == 200
+
+
 # ---------------------------------------------------------------------------
 # request() – sensitive endpoint log redaction
 # ---------------------------------------------------------------------------
@@ -229,9 +542,8 @@ def test_sensitive_endpoint_response_is_redacted(client, mock_session):
     bad_resp = make_response(401, text="bad credentials")
     mock_session.request.return_value = bad_resp
 
-    with patch("ticktick_sdk.client.logger") as mock_logger:
-        with pytest.raises(TickTickAuthError):
-            client.request("POST", "/api/v2/user/signon", json={"username": "u", "password": "p"})
+    with patch("ticktick_sdk.client.logger") as mock_logger, pytest.raises(TickTickAuthError):
+        client.request("POST", "/api/v2/user/signon", json={"username": "u", "password": "p"})
 
     # The error log call for sensitive endpoints must include "<redacted>"
     # and must NOT include the raw response text.
@@ -249,24 +561,59 @@ def test_mfa_endpoint_response_is_redacted(client, mock_session):
     bad_resp = make_response(401, text="bad mfa code")
     mock_session.request.return_value = bad_resp
 
-    with patch("ticktick_sdk.client.logger") as mock_logger:
-        with pytest.raises(TickTickAuthError):
-            client.request("POST", "/api/v2/user/sign/mfa/code/verify", json={"code": "123456"})
+    with patch("ticktick_sdk.client.logger") as mock_logger, pytest.raises(TickTickAuthError):
+        client.request("POST", "/api/v2/user/sign/mfa/code/verify", json={"code": "123456"})
 
     log_calls = [str(c) for c in mock_logger.error.call_args_list]
     assert any("<redacted>" in c for c in log_calls)
     assert not any("bad mfa code" in c for c in log_calls)
 
 
+def test_other_mfa_routes_are_redacted(client, mock_session):
+    """Sign-on routes outside the exact-match set are caught by the prefix check."""
+    mock_session.request.return_value = make_response(401, text="mfa secret")
+
+    with patch("ticktick_sdk.client.logger") as mock_logger, pytest.raises(TickTickAuthError):
+        client.request("GET", "/api/v2/user/sign/mfa/setting")
+
+    log_calls = [str(c) for c in mock_logger.error.call_args_list]
+    assert not any("mfa secret" in c for c in log_calls)
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/v2/user/signon?wc=true&remember=true",
+        "/api/v2/user/signon/",
+        "//api/v2/user/signon",
+    ],
+)
+def test_sign_on_spellings_are_redacted(client, mock_session, endpoint):
+    """Query strings and stray slashes don't bypass redaction."""
+    mock_session.request.return_value = make_response(401, text="bad credentials")
+
+    with patch("ticktick_sdk.client.logger") as mock_logger, pytest.raises(TickTickAuthError):
+        client.request("POST", endpoint, json={"username": "u", "password": "p"})
+
+    log_calls = [str(c) for c in mock_logger.error.call_args_list]
+    assert not any("bad credentials" in c for c in log_calls)
+
+
+def test_sign_on_prefix_is_matched_per_path_component():
+    assert _SENSITIVE_PREFIX_RE.search("https://api.ticktick.com/api/v2/user/signon")
+    assert _SENSITIVE_PREFIX_RE.search("api/v2/user/sign/mfa/code/verify")
+    assert not _SENSITIVE_PREFIX_RE.search("/api/v2/user/signonHistory")
+    assert not _SENSITIVE_PREFIX_RE.search("/api/v2/xapi/v2/user/signon")
+
+
 def test_non_sensitive_endpoint_logs_response_body(client, mock_session):
     """Non-sensitive error responses ARE logged."""
     bad_resp = make_response(500, text="internal server error details")
     bad_resp.json.return_value = {"errorCode": "", "errorMessage": ""}
     mock_session.request.return_value = bad_resp
 
-    with patch("ticktick_sdk.client.logger") as mock_logger:
-        with pytest.raises(TickTickAPIError):
-            client.request("GET", "/api/v2/tasks")
+    with patch("ticktick_sdk.client.logger") as mock_logger, pytest.raises(TickTickAPIError):
+        client.request("GET", "/api/v2/tasks")
 
     log_calls = [str(c) for c in mock_logger.error.call_args_list]
     assert any("internal server error details" in c for c in log_calls)
@@ -346,7 +693,7 @@ def test_post_delegates_to_request(client, mock_session):
     mock_session.request.return_value = ok_resp
     client.post("/api/v2/task", json={"title": "T"})
     mock_session.request.assert_called_once_with(
-        "POST", f"{BASE_URL}/api/v2/task", params=None, json={"title": "T"}, data=None
+        "POST", f"{BASE_URL}/api/v2/task", params=None, json=None, data=b'{"title":"T"}'
     )
 
 
@@ -355,7 +702,7 @@ def test_put_delegates_to_request(client, mock_session):
     mock_session.request.return_value = ok_resp
     client.put("/api/v2/project/p1", json={"name": "Updated"})
     mock_session.request.assert_called_once_with(
-        "PUT", f"{BASE_URL}/api/v2/project/p1", params=None, json={"name": "Updated"}, data=None
+        "PUT", f"{BASE_URL}/api/v2/project/p1", params=None, json=None, data=b'{"name":"Updated"}'
     )
 
 
@@ -366,3 +713,161 @@ def test_delete_delegates_to_request(client, mock_session):
     mock_session.request.assert_called_once_with(
         "DELETE", f"{BASE_URL}/api/v2/project/p1", params=None, json=None, data=None
     )
+
+
+# ---------------------------------------------------------------------------
+# submit() / close()
+# ---------------------------------------------------------------------------
+
+
+def test_submit_runs_retries_on_worker_thread(mock_session):
+    client = TickTickClient(session=mock_session)
+    mock_session.request.side_effect = [make_response(429), make_response(200, json_data={"ok": True})]
+    slept_on = []
+
+    with patch("ticktick_sdk.client.time.sleep", side_effect=lambda _: slept_on.append(threading.current_thread())):
+        future = client.submit(client.get, "/api/v2/habits")
+        resp = future.result(5)
+
+    assert resp.json() == {"ok": True}
+    assert slept_on and slept_on[0] is not threading.current_thread()
+    assert slept_on[0].name.startswith("ticktick")
+    client.close()
+
+
+def test_close_shuts_down_executor_and_session(mock_session):
+    client = TickTickClient(session=mock_session)
+    client.submit(lambda: None).result(5)
+    executor = client._executor
+
+    client.close()
+
+    assert client._executor is None
+    assert executor._shutdown
+    mock_session.close.assert_called_once_with()
+
+
+def test_context_manager_closes_client(mock_session):
+    with TickTickClient(session=mock_session) as client:
+        assert isinstance(client, TickTickClient)
+    mock_session.close.assert_called_once_with()
+
+
+# ---------------------------------------------------------------------------
+# async requests
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def async_session(client):
+    """Stand-in for the httpx.AsyncClient the client creates on first use."""
+    session = MagicMock()
+    session.request = AsyncMock()
+    client._aclient = session
+    return session
+
+
+def test_arequest_returns_successful_response(client, async_session):
+    async_session.request.return_value = make_response(200, json_data={"ok": True})
+
+    resp = asyncio.run(client.aget("/api/v2/habits", params={"a": 1}))
+
+    assert resp.json() == {"ok": True}
+    async_session.request.assert_awaited_once_with(
+        "GET", f"{BASE_URL}/api/v2/habits", params={"a": 1}, json=None, data=None
+    )
+
+
+def test_arequest_decodes_json_with_orjson(client, async_session):
+    async_session.request.return_value = MagicMock(status_code=200, content=b'{"ok": true}')
+
+    with patch("ticktick_sdk.client.orjson") as fake_orjson:
+        fake_orjson.loads.return_value = {"ok": True}
+        resp = asyncio.run(client.aget("/api/v2/habits"))
+        assert resp.json() == {"ok": True}
+
+    fake_orjson.loads.assert_called_once_with(b'{"ok": true}')
+
+
+def test_concurrent_identical_agets_share_one_request(client, async_session):
+    async def slow_response(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return make_response(200, json_data={"ok": True})
+
+    async_session.request.side_effect = slow_response
+
+    async def main():
+        return await client.gather(client.aget("/api/v2/habits"), client.aget("/api/v2/habits"))
+
+    first, second = asyncio.run(main())
+
+    assert first is second
+    async_session.request.assert_awaited_once()
+    assert client._ainflight == {}
+
+
+def test_cancelling_one_aget_does_not_cancel_the_shared_request(client, async_session):
+    async def slow_response(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return make_response(200, json_data={"ok": True})
+
+    async_session.request.side_effect = slow_response
+
+    async def main():
+        leader = asyncio.ensure_future(client.aget("/api/v2/habits"))
+        follower = asyncio.ensure_future(client.aget("/api/v2/habits"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return leader, await follower
+
+    leader, resp = asyncio.run(main())
+
+    assert leader.cancelled()
+    assert resp.json() == {"ok": True}
+    async_session.request.assert_awaited_once()
+    assert client._ainflight == {}
+
+
+def test_arequest_retries_on_429_without_blocking(client, async_session):
+    async_session.request.side_effect = [
+        make_response(429, headers={"Retry-After": "2"}),
+        make_response(200, json_data={}),
+    ]
+
+    with patch("ticktick_sdk.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        asyncio.run(client.apost("/api/v2/batch/task", json={}))
+
+    mock_sleep.assert_awaited_once_with(2)
+    assert async_session.request.await_count == 2
+
+
+def test_arequest_raises_same_errors_as_request(client, async_session):
+    async_session.request.return_value = make_response(404, text="missing")
+
+    with pytest.raises(TickTickNotFoundError):
+        asyncio.run(client.aget("/api/v2/task/x"))
+
+
+def test_async_writes_clear_disk_cache(client, async_session):
+    async_session.request.return_value = make_response(200, json_data={})
+
+    with patch.object(client, "_disk_cache") as disk_cache:
+        asyncio.run(client.aget("/api/v2/column/project/p1"))
+        disk_cache.clear.assert_not_called()
+        asyncio.run(client.apost("/api/v2/column", json={}))
+
+    disk_cache.clear.assert_called_once_with()
+
+
+def test_gather_returns_results_in_order(client):
+    async def value(v, delay):
+        await asyncio.sleep(delay)
+        return v
+
+    assert asyncio.run(client.gather(value("a", 0.01), value("b", 0))) == ["a", "b"]
+
+
+def test_async_requests_require_httpx():
+    client = TickTickClient()
+    with patch.dict(sys.modules, {"httpx": None}), pytest.raises(ImportError, match="httpx"):
+        asyncio.run(client.aget("/api/v2/habits"))
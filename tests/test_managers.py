@@ -2,47 +2,34 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import requests
 
-from ticktick_sdk.client import TickTickClient
 from ticktick_sdk.managers.task import TaskManager
 from ticktick_sdk.managers.project import ProjectManager
 from ticktick_sdk.managers.tag import TagManager
 from ticktick_sdk.managers.filter import FilterManager
 from ticktick_sdk.managers.habit import HabitManager
+from ticktick_sdk.managers.search import SearchManager
+from ticktick_sdk.managers.user import UserManager
 from ticktick_sdk.managers.column import ColumnManager
 from ticktick_sdk.managers.batch import BatchManager
+from ticktick_sdk.exceptions import TickTickAPIError
+from ticktick_sdk.models import Column, Habit, Project, Task
+from tests.conftest import DUMMY_TASK, EMPTY, EMPTY_BATCH_RESP, make_response
 
+pytestmark = pytest.mark.unit
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def make_response(json_data=None, status_code: int = 200, text: str = ""):
-    resp = MagicMock(spec=requests.Response)
-    resp.status_code = status_code
-    resp.ok = status_code < 400
-    resp.text = text
-    if json_data is not None:
-        resp.json.return_value = json_data
-    else:
-        resp.json.return_value = {}
-    return resp
-
-
-@pytest.fixture
-def mock_client():
-    """Return a MagicMock that mimics TickTickClient's interface."""
-    client = MagicMock(spec=TickTickClient)
-    client.inbox_id = "inbox123"
-    # Wire up the batch manager with a real-ish mock
-    batch = MagicMock(spec=BatchManager)
-    client.batch = batch
-    return client
+# Expected batch delete bodies, compared directly against call_args.kwargs
+_DELETE_BATCH_TASK = {"delete": [{"taskId": "task123", "projectId": "proj1"}]}
+_DELETE_BATCH_SUBTAG = {"delete": ["parent/child"]}
+_DELETE_BATCH_FILTER = {"delete": ["filt123"]}
 
 
 # ---------------------------------------------------------------------------
@@ -68,8 +55,7 @@ class TestTaskManager:
         manager.create("New task", project_id="proj1")
 
         mock_client.post.assert_called_once()
-        call_kwargs = mock_client.post.call_args
-        payload = call_kwargs[1]["json"]
+        payload = mock_client.post.call_args.kwargs["json"]
 
         assert "id" in payload
         assert len(payload["id"]) == 24  # os.urandom(12).hex()
@@ -77,46 +63,29 @@ class TestTaskManager:
         assert payload["title"] == "New task"
         assert payload["status"] == 0
 
-    def test_create_uses_inbox_when_no_project_id(self, manager, mock_client):
-        mock_client.inbox_id = "inbox123"
-        mock_client.post.return_value = make_response(
-            {
-                "id": "x",
-                "projectId": "inbox123",
-                "title": "T",
-            }
-        )
-
-        manager.create("T")
-
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["projectId"] == "inbox123"
+    @pytest.mark.parametrize(
+        "inbox_id,project_id,expected",
+        [
+            ("inbox123", None, "inbox123"),  # no project -> client's inbox
+            ("", None, "inbox"),  # no inbox id known -> literal "inbox"
+            ("inbox123", "p1", "p1"),  # explicit project wins
+        ],
+    )
+    def test_create_project_id_resolution(self, manager, mock_client, inbox_id, project_id, expected):
+        mock_client.inbox_id = inbox_id
+        mock_client.post.return_value = make_response({"id": "x", "projectId": expected, "title": "T"})
 
-    def test_create_falls_back_to_inbox_literal_when_no_inbox_id(self, manager, mock_client):
-        mock_client.inbox_id = ""
-        mock_client.post.return_value = make_response(
-            {
-                "id": "x",
-                "projectId": "inbox",
-                "title": "T",
-            }
-        )
+        manager.create("T", project_id=project_id)
 
-        manager.create("T")
-
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["projectId"] == "inbox"
+        mock_client.post.assert_called_once()
+        call = mock_client.post.call_args
+        endpoint = call.args[0]
+        payload = call.kwargs["json"]
+        assert endpoint == "/api/v2/task"
+        assert payload["projectId"] == expected
 
     def test_create_includes_optional_fields(self, manager, mock_client):
-        from datetime import datetime, timezone
-
-        mock_client.post.return_value = make_response(
-            {
-                "id": "x",
-                "projectId": "p1",
-                "title": "T",
-            }
-        )
+        mock_client.post.return_value = make_response(DUMMY_TASK)
 
         dt = datetime(2024, 3, 15, 9, 0, tzinfo=timezone.utc)
         manager.create(
@@ -135,31 +104,30 @@ class TestTaskManager:
             kind="NOTE",
         )
 
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["content"] == "body"
-        assert payload["priority"] == 3
-        assert payload["tags"] == ["work"]
-        assert "startDate" in payload
-        assert "dueDate" in payload
+        payload = mock_client.post.call_args.kwargs["json"]
+        expected = {
+            "content": "body",
+            "priority": 3,
+            "tags": ["work"],
+            "isAllDay": True,
+            "timeZone": "America/New_York",
+            "repeatFlag": "RRULE:FREQ=DAILY;INTERVAL=1",
+            "parentId": "parent1",
+            "columnId": "col1",
+            "kind": "NOTE",
+            "startDate": "2024-03-15T09:00:00.000+0000",
+            "dueDate": "2024-03-15T09:00:00.000+0000",
+        }
+        assert expected.items() <= payload.items()
         assert payload["isAllDay"] is True
-        assert payload["timeZone"] == "America/New_York"
-        assert payload["repeatFlag"] == "RRULE:FREQ=DAILY;INTERVAL=1"
-        assert payload["parentId"] == "parent1"
-        assert payload["columnId"] == "col1"
-        assert payload["kind"] == "NOTE"
+        assert {"startDate", "dueDate"} <= payload.keys()
 
     def test_create_with_items_builds_subtasks(self, manager, mock_client):
-        mock_client.post.return_value = make_response(
-            {
-                "id": "x",
-                "projectId": "p1",
-                "title": "T",
-            }
-        )
+        mock_client.post.return_value = make_response(DUMMY_TASK)
 
         manager.create("T", project_id="p1", items=[{"title": "Sub 1"}, {"title": "Sub 2"}])
 
-        payload = mock_client.post.call_args[1]["json"]
+        payload = mock_client.post.call_args.kwargs["json"]
         assert len(payload["items"]) == 2
         assert payload["items"][0]["title"] == "Sub 1"
         assert payload["items"][1]["title"] == "Sub 2"
@@ -169,36 +137,175 @@ class TestTaskManager:
             assert "status" in item
             assert "sortOrder" in item
 
-    def test_create_posts_to_correct_endpoint(self, manager, mock_client):
-        mock_client.post.return_value = make_response({"id": "x", "projectId": "p1", "title": "T"})
-        manager.create("T", project_id="p1")
-        mock_client.post.assert_called_once()
-        endpoint = mock_client.post.call_args[0][0]
-        assert endpoint == "/api/v2/task"
-
     # -- delete() -----------------------------------------------------------
 
     def test_delete_uses_batch_endpoint(self, manager, mock_client):
-        mock_client.post.return_value = make_response({})
+        mock_client.post.return_value = make_response(EMPTY)
 
         manager.delete("task123", "proj1")
 
-        mock_client.post.assert_called_once_with(
-            "/api/v2/batch/task",
-            json={"delete": [{"taskId": "task123", "projectId": "proj1"}]},
-        )
+        assert mock_client.post.call_count == 1
+        call = mock_client.post.call_args
+        assert call.args == ("/api/v2/batch/task",)
+        assert call.kwargs == {"json": _DELETE_BATCH_TASK}
 
     def test_batch_delete_sends_all_tasks(self, manager, mock_client):
-        mock_client.post.return_value = make_response({})
+        mock_client.post.return_value = make_response(EMPTY)
         tasks = [
             {"taskId": "t1", "projectId": "p1"},
             {"taskId": "t2", "projectId": "p2"},
         ]
         manager.batch_delete(tasks)
-        mock_client.post.assert_called_once_with(
-            "/api/v2/batch/task",
-            json={"delete": tasks},
+        assert mock_client.post.call_count == 1
+        call = mock_client.post.call_args
+        assert call.args == ("/api/v2/batch/task",)
+        assert call.kwargs == {"json": {"delete": tasks}}
+
+    # -- batch_create() -----------------------------------------------------
+
+    def test_batch_create_assigns_missing_ids(self, manager, mock_client):
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+        tasks = [
+            {"title": "A", "projectId": "p1"},
+            {"id": "keep_me", "title": "B", "projectId": "p1"},
+        ]
+
+        manager.batch_create(tasks)
+
+        sent = mock_client.post.call_args.kwargs["json"]["add"]
+        assert len(sent[0]["id"]) == 24
+        assert sent[0]["title"] == "A"
+        assert sent[1] is tasks[1]
+        assert tasks[0] == {"title": "A", "projectId": "p1"}
+
+    def test_generate_ids_returns_distinct_hex_ids(self, manager):
+        ids = manager.generate_ids(3)
+        assert len(set(ids)) == 3
+        assert all(len(i) == 24 and int(i, 16) >= 0 for i in ids)
+        assert manager.generate_ids(0) == []
+
+    # -- complete_many() ----------------------------------------------------
+
+    def test_complete_many_uses_one_sync_and_one_batch(self, manager, mock_client):
+        open_task = {"id": "t1", "projectId": "p1", "title": "Open", "status": 0, "tags": ["x"]}
+        mock_client.batch.check.return_value = {"syncTaskBean": {"update": [open_task]}}
+        mock_client.get.return_value = make_response({"id": "t2", "projectId": "p2", "title": "Elsewhere"})
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        with patch("ticktick_sdk.managers.task.COMPLETE_MANY_SYNC_MIN", 2):
+            manager.complete_many([("t1", "p1"), ("t2", "p2")])
+
+        mock_client.batch.check.assert_called_once_with(0)
+        mock_client.get.assert_called_once_with("/api/v2/task/t2", params={"projectId": "p2"})
+        updates = mock_client.post.call_args.kwargs["json"]["update"]
+        assert updates[0] == {**open_task, "status": 2}
+        assert (updates[1]["id"], updates[1]["status"]) == ("t2", 2)
+        assert open_task["status"] == 0
+
+    def test_complete_many_fetches_few_tasks_without_client_workers(self, manager, mock_client):
+        mock_client.get.side_effect = lambda endpoint, params: make_response(
+            {"id": endpoint.rsplit("/", 1)[1], "projectId": params["projectId"], "title": "T"}
         )
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        # Run from a saturated one-worker pool, as client.submit(client.task.complete_many, ...) would
+        with ThreadPoolExecutor(1) as outer:
+            outer.submit(manager.complete_many, [("t1", "p1"), ("t2", "p2")]).result(timeout=5)
+
+        mock_client.submit.assert_not_called()
+        mock_client.batch.check.assert_not_called()
+        updates = mock_client.post.call_args.kwargs["json"]["update"]
+        assert [(u["id"], u["projectId"], u["status"]) for u in updates] == [("t1", "p1", 2), ("t2", "p2", 2)]
+
+    # -- mutate_subtasks() --------------------------------------------------
+
+    def test_mutate_subtasks_fetches_and_updates_once(self, manager, mock_client):
+        parent = {
+            "id": "t1",
+            "projectId": "p1",
+            "title": "Parent",
+            "items": [
+                {"id": "s1", "title": "One", "sortOrder": 0},
+                {"id": "s2", "title": "Two", "sortOrder": 1099511627776},
+            ],
+        }
+        mock_client.get.return_value = make_response(parent)
+        mock_client.post.return_value = make_response(parent)
+
+        manager.mutate_subtasks("t1", "p1", complete_ids=["s1"], remove_ids=["s2"], add_titles=["A", "B"])
+
+        mock_client.get.assert_called_once()
+        mock_client.post.assert_called_once()
+        items = mock_client.post.call_args.kwargs["json"]["items"]
+        assert [i["title"] for i in items] == ["One", "A", "B"]
+        assert items[0]["status"] == 2 and "completedTime" in items[0]
+        assert [i["sortOrder"] for i in items] == [0, 1099511627776, 2 * 1099511627776]
+
+    # -- update_batched() ---------------------------------------------------
+
+    def test_update_batched_coalesces_into_one_request(self, manager, mock_client):
+        mock_client.post.return_value = make_response({"id2etag": {"t1": "e1", "t2": "e2"}, "id2error": {}})
+
+        futures = [
+            manager.update_batched(Task(id="t1", project_id="p1", title="A")),
+            manager.update_batched(Task(id="t2", project_id="p1", title="B")),
+        ]
+        mock_client.post.assert_not_called()
+        manager.flush_batched()
+        results = [f.result(timeout=0) for f in futures]
+
+        assert results[0]["id2etag"] == {"t1": "e1", "t2": "e2"}
+        mock_client.post.assert_called_once()
+        sent = mock_client.post.call_args.kwargs["json"]["update"]
+        assert [t["id"] for t in sent] == ["t1", "t2"]
+
+    def test_update_batched_sends_when_queue_is_full(self, manager, mock_client):
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        with patch("ticktick_sdk.managers.task.BATCH_MAX_SIZE", 2):
+            first = manager.update_batched(Task(id="t1", project_id="p1", title="A"))
+            assert not first.done()
+            manager.update_batched(Task(id="t2", project_id="p1", title="B"))
+
+        assert first.done()
+        mock_client.post.assert_called_once()
+
+    def test_update_batched_raises_for_rejected_task(self, manager, mock_client):
+        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {"t1": "NOT_EXISTED"}})
+
+        future = manager.update_batched(Task(id="t1", project_id="p1", title="A"))
+        manager.flush_batched()
+
+        with pytest.raises(TickTickAPIError, match="NOT_EXISTED"):
+            future.result(timeout=0)
+
+    def test_flush_batched_fails_futures_and_raises_on_request_error(self, manager, mock_client):
+        mock_client.post.side_effect = TickTickAPIError(500)
+
+        future = manager.update_batched(Task(id="t1", project_id="p1", title="A"))
+        with pytest.raises(TickTickAPIError):
+            manager.flush_batched()
+
+        assert isinstance(future.exception(timeout=0), TickTickAPIError)
+
+    def test_update_batched_skips_cancelled_futures(self, manager, mock_client):
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        cancelled = manager.update_batched(Task(id="t1", project_id="p1", title="A"))
+        assert cancelled.cancel()
+        manager.update_batched(Task(id="t2", project_id="p1", title="B"))
+        manager.flush_batched()
+
+        sent = mock_client.post.call_args.kwargs["json"]["update"]
+        assert [t["id"] for t in sent] == ["t2"]
+
+    def test_close_flushes_queued_updates(self, manager, mock_client):
+        mock_client.post.return_value = make_response({"id2etag": {"t1": "e1"}, "id2error": {}})
+
+        future = manager.update_batched(Task(id="t1", project_id="p1", title="A"))
+        manager.close()
+
+        assert future.done()
 
     # -- get_completed() ---------------------------------------------------
 
@@ -209,7 +316,7 @@ class TestTaskManager:
         tasks = manager.get_completed("p1")
 
         mock_client.get.assert_called_once()
-        endpoint = mock_client.get.call_args[0][0]
+        endpoint = mock_client.get.call_args.args[0]
         assert "/api/v2/project/p1/completed/" in endpoint
         assert len(tasks) == 1
         assert tasks[0].id == "t1"
@@ -219,7 +326,7 @@ class TestTaskManager:
 
         manager.get_completed()
 
-        endpoint = mock_client.get.call_args[0][0]
+        endpoint = mock_client.get.call_args.args[0]
         assert "/api/v2/project/all/completed/" in endpoint
 
     def test_get_completed_skips_empty_date_params(self, manager, mock_client):
@@ -228,7 +335,7 @@ class TestTaskManager:
 
         manager.get_completed("p1", from_date="", to_date="")
 
-        params = mock_client.get.call_args[1]["params"]
+        params = mock_client.get.call_args.kwargs["params"]
         assert "from" not in params
         assert "to" not in params
         assert "limit" in params
@@ -238,14 +345,38 @@ class TestTaskManager:
 
         manager.get_completed("p1", from_date="2024-03-01 00:00:00", to_date="2024-03-31 23:59:59")
 
-        params = mock_client.get.call_args[1]["params"]
+        params = mock_client.get.call_args.kwargs["params"]
         assert params["from"] == "2024-03-01 00:00:00"
         assert params["to"] == "2024-03-31 23:59:59"
 
     # -- get_all() ----------------------------------------------------------
 
-    def test_get_all_extracts_tasks_from_sync_bean(self, manager, mock_client):
-        sync_data = {
+    @pytest.mark.parametrize(
+        "sync,expected_ids",
+        [
+            (
+                {
+                    "syncTaskBean": {
+                        "update": [
+                            {"id": "t1", "projectId": "p1", "title": "Task 1"},
+                            {"id": "t2", "projectId": "p2", "title": "Task 2"},
+                        ]
+                    }
+                },
+                ["t1", "t2"],
+            ),
+            ({}, []),
+            ({"syncTaskBean": {}}, []),
+        ],
+        ids=["extracts_sync_bean", "empty_sync", "missing_update_key"],
+    )
+    def test_get_all(self, manager, mock_client, sync, expected_ids):
+        mock_client.batch.check.return_value = sync
+        tasks = manager.get_all()
+        assert [t.id for t in tasks] == expected_ids
+
+    def test_get_by_project_filters_before_parsing(self, manager, mock_client):
+        mock_client.batch.check.return_value = {
             "syncTaskBean": {
                 "update": [
                     {"id": "t1", "projectId": "p1", "title": "Task 1"},
@@ -253,23 +384,53 @@ class TestTaskManager:
                 ]
             }
         }
-        mock_client.batch.check.return_value = sync_data
 
-        tasks = manager.get_all()
+        with patch("ticktick_sdk.managers.task.Task.from_dict", wraps=Task.from_dict) as from_dict:
+            tasks = manager.get_by_project("p2")
 
-        assert len(tasks) == 2
-        assert tasks[0].id == "t1"
-        assert tasks[1].id == "t2"
+        assert [t.id for t in tasks] == ["t2"]
+        assert from_dict.call_count == 1
 
-    def test_get_all_handles_empty_sync_bean(self, manager, mock_client):
-        mock_client.batch.check.return_value = {}
-        tasks = manager.get_all()
-        assert tasks == []
+    # -- async --------------------------------------------------------------
 
-    def test_get_all_handles_missing_update_key(self, manager, mock_client):
-        mock_client.batch.check.return_value = {"syncTaskBean": {}}
-        tasks = manager.get_all()
-        assert tasks == []
+    def test_aget_all_reads_async_sync(self, manager, mock_client):
+        sync = {"syncTaskBean": {"update": [{"id": "t1", "projectId": "p"}]}}
+        mock_client.batch.acheck = AsyncMock(return_value=sync)
+        tasks = asyncio.run(manager.aget_all())
+        assert [t.id for t in tasks] == ["t1"]
+        mock_client.batch.acheck.assert_awaited_once_with(0)
+
+    def test_aget_completed_matches_sync_query(self, manager, mock_client):
+        mock_client.aget = AsyncMock(return_value=make_response([{"id": "t9", "projectId": "p1"}]))
+        tasks = asyncio.run(manager.aget_completed("p1", from_date="2024-01-01 00:00:00", limit=5))
+        assert [t.id for t in tasks] == ["t9"]
+        mock_client.aget.assert_awaited_once_with(
+            "/api/v2/project/p1/completed/", params={"limit": 5, "from": "2024-01-01 00:00:00"}
+        )
+
+    def test_search_filter_tasks_combines_criteria(self, mock_client):
+        raw = [
+            {"id": "t1", "projectId": "p1", "title": "A", "tags": ["work"], "dueDate": "2026-01-01T00:00:00.000+0000"},
+            {"id": "t2", "projectId": "p1", "title": "B", "tags": ["work"]},
+            {"id": "t3", "projectId": "p2", "title": "C", "tags": ["work"]},
+        ]
+        mock_client.batch.check.return_value = {"syncTaskBean": {"update": raw}}
+        tasks = SearchManager(mock_client).filter_tasks(project_id="p1", tag="work", has_due_date=False)
+        assert [t.id for t in tasks] == ["t2"]
+
+    def test_search_afilter_tasks_narrows_async_listing(self, mock_client):
+        raw = [{"id": "t1", "projectId": "p1", "title": "A", "priority": 5}, {"id": "t2", "projectId": "p1"}]
+        mock_client.batch.acheck = AsyncMock(return_value={"syncTaskBean": {"update": raw}})
+        tasks = asyncio.run(SearchManager(mock_client).afilter_tasks(priority=5))
+        assert [t.id for t in tasks] == ["t1"]
+
+    def test_user_aget_dashboard_gathers_account_reads(self, mock_client):
+        mock_client.aget = AsyncMock(side_effect=lambda endpoint, **kw: make_response({"from": endpoint}))
+        mock_client.gather = lambda *calls: asyncio.gather(*calls)
+        dashboard = asyncio.run(UserManager(mock_client).aget_dashboard())
+        assert dashboard["status"] == {"from": "/api/v2/user/status"}
+        assert dashboard["limits"] == {"from": "/api/v2/configs/limits"}
+        assert mock_client.aget.await_count == 4
 
 
 # ---------------------------------------------------------------------------
@@ -282,54 +443,62 @@ class TestTagManager:
     def manager(self, mock_client):
         return TagManager(mock_client)
 
-    # -- create() -----------------------------------------------------------
-
-    def test_create_uses_batch_endpoint(self, manager, mock_client):
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
-        mock_client.batch.full_sync.return_value = {
-            "tags": [{"name": "newtag", "label": "newtag", "sortOrder": 0, "color": ""}]
-        }
-
-        manager.create("newtag")
-
-        # First post should go to /api/v2/batch/tag
-        first_call = mock_client.post.call_args
-        assert first_call[0][0] == "/api/v2/batch/tag"
-        payload = first_call[1]["json"]
-        assert "add" in payload
-        assert len(payload["add"]) == 1
-        assert payload["add"][0]["name"] == "newtag"
-
-    def test_create_prefixes_parent_name(self, manager, mock_client):
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
+    @pytest.fixture(autouse=True)
+    def _stub(self, mock_client):
+        """Default batch reply and an empty sync; tests override as needed."""
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
         mock_client.batch.full_sync.return_value = {"tags": []}
 
-        manager.create("child", parent="parent")
+    # -- listing cache ------------------------------------------------------
 
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["add"][0]["name"] == "parent/child"
-
-    def test_create_does_not_double_prefix(self, manager, mock_client):
-        """If name already contains '/', parent is not prepended."""
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
-        mock_client.batch.full_sync.return_value = {"tags": []}
+    def test_reads_share_cached_listing_until_delete(self, manager, mock_client):
+        mock_client.batch.check.return_value = {"tags": [{"name": "a"}, {"name": "a/b"}, {"name": "a/b/c"}]}
+        assert manager.get("a/b").parent == "a"
+        assert [t.name for t in manager.get_children("a")] == ["a/b"]
+        assert [t.name for t in manager.get_children("")] == ["a"]
+        mock_client.batch.check.assert_called_once_with(0)
 
-        manager.create("parent/child", parent="parent")
+        manager.delete("a")
+        manager.get_all()
+        assert mock_client.batch.check.call_count == 2
 
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["add"][0]["name"] == "parent/child"
+    def test_get_many_resolves_names_from_one_listing(self, manager, mock_client):
+        mock_client.batch.check.return_value = {"tags": [{"name": "work"}, {"name": "home"}]}
+        found = manager.get_many(["home", "missing", "work"])
+        assert list(found) == ["home", "work"]
+        assert found["work"].name == "work"
+        mock_client.batch.check.assert_called_once_with(0)
 
-    def test_create_label_defaults_to_name(self, manager, mock_client):
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
-        mock_client.batch.full_sync.return_value = {"tags": []}
+    def test_aget_all_shares_cache_with_get(self, manager, mock_client):
+        mock_client.batch.acheck = AsyncMock(return_value={"tags": [{"name": "work"}]})
+        assert [t.name for t in asyncio.run(manager.aget_all())] == ["work"]
+        assert manager.get("work") is not None
+        mock_client.batch.check.assert_not_called()
 
-        manager.create("mytag")
+    # -- create() -----------------------------------------------------------
 
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["add"][0]["label"] == "mytag"
+    @pytest.mark.parametrize(
+        "name,parent,exp_name,exp_label",
+        [
+            ("newtag", None, "newtag", "newtag"),
+            ("child", "parent", "parent/child", "parent/child"),
+            # name already contains '/', so parent is not prepended again
+            ("parent/child", "parent", "parent/child", "parent/child"),
+            ("mytag", None, "mytag", "mytag"),  # label defaults to name
+        ],
+    )
+    def test_create_name_building(self, manager, mock_client, name, parent, exp_name, exp_label):
+        manager.create(name, parent=parent or "")
+
+        call = mock_client.post.call_args
+        endpoint = call.args[0]
+        payload = call.kwargs["json"]
+        assert endpoint == "/api/v2/batch/tag"
+        assert len(payload["add"]) == 1
+        assert payload["add"][0]["name"] == exp_name
+        assert payload["add"][0]["label"] == exp_label
 
     def test_create_returns_tag_from_sync_if_found(self, manager, mock_client):
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
         mock_client.batch.full_sync.return_value = {
             "tags": [{"name": "work", "label": "Work", "color": "#FF0000", "sortOrder": 0}]
         }
@@ -341,30 +510,30 @@ class TestTagManager:
     # -- delete() -----------------------------------------------------------
 
     def test_delete_simple_tag_uses_delete_endpoint(self, manager, mock_client):
-        mock_client.delete.return_value = make_response({})
+        mock_client.delete.return_value = make_response(EMPTY)
 
         manager.delete("work")
 
         mock_client.delete.assert_called_once()
-        endpoint = mock_client.delete.call_args[0][0]
+        endpoint = mock_client.delete.call_args.args[0]
         assert "/api/v2/tag/" in endpoint
         assert "work" in endpoint
 
     def test_delete_subtag_uses_batch_endpoint(self, manager, mock_client):
         """Sub-tags (names with '/') must use the batch endpoint."""
-        mock_client.post.return_value = make_response({})
+        mock_client.post.return_value = make_response(EMPTY)
 
         manager.delete("parent/child")
 
-        mock_client.post.assert_called_once_with(
-            "/api/v2/batch/tag",
-            json={"delete": ["parent/child"]},
-        )
+        assert mock_client.post.call_count == 1
+        call = mock_client.post.call_args
+        assert call.args == ("/api/v2/batch/tag",)
+        assert call.kwargs == {"json": _DELETE_BATCH_SUBTAG}
         # Direct DELETE should not be called
         mock_client.delete.assert_not_called()
 
     def test_delete_subtag_does_not_call_direct_delete(self, manager, mock_client):
-        mock_client.post.return_value = make_response({})
+        mock_client.post.return_value = make_response(EMPTY)
         manager.delete("a/b")
         mock_client.delete.assert_not_called()
 
@@ -379,6 +548,24 @@ class TestFilterManager:
     def manager(self, mock_client):
         return FilterManager(mock_client)
 
+    @pytest.fixture(autouse=True)
+    def _stub(self, mock_client):
+        """Default batch reply and an empty sync; tests override as needed."""
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+        mock_client.batch.full_sync.return_value = {"filters": []}
+
+    # -- listing cache ------------------------------------------------------
+
+    def test_get_reuses_cached_listing_until_delete(self, manager, mock_client):
+        mock_client.batch.check_partial.return_value = {"filters": [{"id": "f1", "name": "Mine"}]}
+        assert manager.get("f1").name == "Mine"
+        assert manager.get("f2") is None
+        mock_client.batch.check_partial.assert_called_once_with({"filters"}, 0)
+
+        manager.delete("f1")
+        manager.get_all()
+        assert mock_client.batch.check_partial.call_count == 2
+
     # -- create() -----------------------------------------------------------
 
     def test_create_uses_batch_endpoint(self, manager, mock_client):
@@ -392,56 +579,118 @@ class TestFilterManager:
         manager.create("My Filter", rule={"type": 0, "and": []})
 
         mock_client.post.assert_called_once()
-        endpoint = mock_client.post.call_args[0][0]
-        assert endpoint == "/api/v2/batch/filter"
-        payload = mock_client.post.call_args[1]["json"]
+        call = mock_client.post.call_args
+        assert call.args[0] == "/api/v2/batch/filter"
+        payload = call.kwargs["json"]
         assert "add" in payload
         assert payload["add"][0]["name"] == "My Filter"
 
     def test_create_serialises_dict_rule_to_json(self, manager, mock_client):
-        import json
-
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
-
         manager.create("F", rule={"type": 0})
 
-        payload = mock_client.post.call_args[1]["json"]
+        payload = mock_client.post.call_args.kwargs["json"]
         rule_str = payload["add"][0]["rule"]
         assert isinstance(rule_str, str)
         assert json.loads(rule_str) == {"type": 0}
 
     def test_create_accepts_string_rule(self, manager, mock_client):
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
-
         manager.create("F", rule='{"type":0}')
 
-        payload = mock_client.post.call_args[1]["json"]
+        payload = mock_client.post.call_args.kwargs["json"]
         assert payload["add"][0]["rule"] == '{"type":0}'
 
-    def test_create_returns_filter_from_sync_when_id2etag_has_entry(self, manager, mock_client):
+    def test_create_sends_no_id_and_returns_payload_with_server_id(self, manager, mock_client):
         mock_client.post.return_value = make_response({"id2etag": {"filt_abc": "etag1"}, "id2error": {}})
-        mock_client.batch.full_sync.return_value = {
+
+        result = manager.create("Test", rule="{}")
+
+        assert "id" not in mock_client.post.call_args.kwargs["json"]["add"][0]
+        assert result == {
+            "id": "filt_abc",
+            "name": "Test",
+            "rule": "{}",
+            "sortType": "sortOrder",
+            "sortOrder": 0,
+            "viewMode": "list",
+        }
+        mock_client.batch.full_sync.assert_not_called()
+        mock_client.batch.check_partial.assert_not_called()
+
+    def test_create_refresh_returns_filter_from_sync(self, manager, mock_client):
+        mock_client.post.return_value = make_response({"id2etag": {"filt_abc": "etag1"}, "id2error": {}})
+        mock_client.batch.check_partial.return_value = {
             "filters": [
-                {"id": "filt_abc", "name": "Test", "rule": "{}", "sortOrder": 0, "sortType": "", "viewMode": "list"}
+                {"id": "filt_abc", "name": "Test", "rule": "{}", "sortOrder": -1, "sortType": "", "viewMode": "list"}
             ]
         }
 
-        result = manager.create("Test", rule="{}")
-        # create() returns a raw dict when found in full_sync
-        assert result["id"] == "filt_abc"
+        result = manager.create("Test", rule="{}", refresh=True)
 
-    # -- delete() -----------------------------------------------------------
+        assert result["sortOrder"] == -1
+        mock_client.batch.check_partial.assert_called_once_with({"filters"}, 0)
 
-    def test_delete_uses_batch_endpoint(self, manager, mock_client):
-        mock_client.post.return_value = make_response({})
+    def test_create_raises_with_error_fields_when_rejected(self, manager, mock_client):
+        error = {"errorCode": "NAME_EXISTED", "errorMessage": "name already used"}
+        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {"Dup": error}})
 
-        manager.delete("filt123")
+        with pytest.raises(TickTickAPIError) as excinfo:
+            manager.create("Dup", rule="{}")
+
+        assert (excinfo.value.error_code, excinfo.value.error_message) == ("NAME_EXISTED", "name already used")
+
+    def test_bulk_create_posts_once(self, manager, mock_client):
+        mock_client.post.return_value = make_response({"id2etag": {"f2": "e2", "f1": "e1"}, "id2error": {}})
+        mock_client.batch.check_partial.return_value = {
+            "filters": [
+                {"id": "f2", "name": "B", "rule": "{}", "viewMode": "kanban"},
+                {"id": "f1", "name": "A", "rule": '{"type":0}', "viewMode": "list"},
+            ]
+        }
+
+        result = manager.bulk_create(
+            [{"name": "A", "rule": {"type": 0}}, {"name": "B", "rule": "{}", "viewMode": "kanban"}]
+        )
+
+        assert mock_client.post.call_count == 1
+        added = mock_client.post.call_args.kwargs["json"]["add"]
+        assert added[0]["rule"] == '{"type": 0}' and added[0]["viewMode"] == "list"
+        assert added[1]["viewMode"] == "kanban"
+        assert [(f["id"], f["name"]) for f in result] == [("f1", "A"), ("f2", "B")]
+
+    def test_bulk_create_leaves_out_rejected_filters(self, manager, mock_client):
+        mock_client.post.return_value = make_response(
+            {"id2etag": {"f3": "e3", "f1": "e1"}, "id2error": {"B": "NAME_EXISTED"}}
+        )
+        mock_client.batch.check_partial.return_value = {
+            "filters": [{"id": "f1", "name": "A", "rule": "{}"}, {"id": "f3", "name": "C", "rule": "{}"}]
+        }
+
+        result = manager.bulk_create(
+            [{"name": "A", "rule": "{}"}, {"name": "B", "rule": "{}"}, {"name": "C", "rule": "{}"}]
+        )
+
+        assert [(f["id"], f["name"]) for f in result] == [("f1", "A"), ("f3", "C")]
+
+    def test_bulk_combines_operations_in_one_request(self, manager, mock_client):
+        manager.bulk(add=[{"name": "A", "rule": "{}"}], update=[{"id": "f1", "name": "B"}], delete=["f2"])
 
         mock_client.post.assert_called_once_with(
             "/api/v2/batch/filter",
-            json={"delete": ["filt123"]},
+            json={"add": [{"name": "A", "rule": "{}"}], "update": [{"id": "f1", "name": "B"}], "delete": ["f2"]},
         )
 
+    # -- delete() -----------------------------------------------------------
+
+    def test_delete_uses_batch_endpoint(self, manager, mock_client):
+        mock_client.post.return_value = make_response(EMPTY)
+
+        manager.delete("filt123")
+
+        assert mock_client.post.call_count == 1
+        call = mock_client.post.call_args
+        assert call.args == ("/api/v2/batch/filter",)
+        assert call.kwargs == {"json": _DELETE_BATCH_FILTER}
+
 
 # ---------------------------------------------------------------------------
 # ProjectManager
@@ -455,38 +704,139 @@ class TestProjectManager:
 
     # -- get_all() ----------------------------------------------------------
 
-    def test_get_all_returns_projects(self, manager, mock_client):
+    @pytest.mark.parametrize(
+        "sync,expected",
+        [
+            ({"projectProfiles": [{"id": "p1", "name": "Work"}, {"id": "p2", "name": "Personal"}]}, ["Work", "Personal"]),
+            # delta sync omits unchanged profiles with None
+            ({"projectProfiles": None}, []),
+            ({}, []),
+        ],
+        ids=["returns_projects", "none_from_delta_sync", "missing_key"],
+    )
+    def test_get_all(self, manager, mock_client, sync, expected):
+        mock_client.batch.check.return_value = sync
+        projects = manager.get_all()
+        assert [p.name for p in projects] == expected
+
+    def test_get_all_uses_checkpoint_zero(self, manager, mock_client):
+        """get_all() must do a full sync (checkpoint=0)."""
+        mock_client.batch.check.return_value = {"projectProfiles": []}
+        manager.get_all()
+        mock_client.batch.check.assert_called_once_with(0)
+
+    def test_get_all_reuses_cached_sync(self, manager, mock_client):
         mock_client.batch.check.return_value = {
-            "projectProfiles": [
-                {"id": "p1", "name": "Work"},
-                {"id": "p2", "name": "Personal"},
-            ]
+            "projectProfiles": [{"id": "p1", "name": "Work"}],
+            "projectGroups": [{"id": "g1", "name": "Folder"}],
         }
+        manager.get_all()
+        manager.get_all()
+        manager.get_groups()
+        mock_client.batch.check.assert_called_once_with(0)
 
-        projects = manager.get_all()
+    def test_get_looks_up_cached_listing_by_id(self, manager, mock_client):
+        profiles = [{"id": "p1", "name": "A"}, {"id": "p2", "name": "B"}]
+        mock_client.batch.check.return_value = {"projectProfiles": profiles}
+        assert manager.get("p2").name == "B"
+        with pytest.raises(ValueError):
+            manager.get("p3")
+        mock_client.batch.check.assert_called_once_with(0)
 
-        assert len(projects) == 2
-        assert projects[0].id == "p1"
-        assert projects[1].name == "Personal"
+    def test_get_many_skips_unknown_ids(self, manager, mock_client):
+        profiles = [{"id": "p1", "name": "A"}, {"id": "p2", "name": "B"}]
+        mock_client.batch.check.return_value = {"projectProfiles": profiles}
+        found = manager.get_many(["p2", "p3", "p1"])
+        assert {pid: p.name for pid, p in found.items()} == {"p2": "B", "p1": "A"}
+        mock_client.batch.check.assert_called_once_with(0)
 
-    def test_get_all_handles_none_from_delta_sync(self, manager, mock_client):
-        """If projectProfiles is None (delta sync omits unchanged), return []."""
-        mock_client.batch.check.return_value = {"projectProfiles": None}
+    def test_get_all_refetches_after_ttl(self, manager, mock_client):
+        mock_client.batch.check.return_value = {"projectProfiles": []}
+        with patch("ticktick_sdk.managers._cache.time.monotonic", side_effect=[0.0, 1000.0, 1000.0]):
+            manager.get_all()
+            manager.get_all()
+        assert mock_client.batch.check.call_count == 2
+
+    def test_aget_all_shares_cache_with_get_all(self, manager, mock_client):
+        mock_client.batch.acheck = AsyncMock(return_value={"projectProfiles": [{"id": "p1", "name": "Work"}]})
+        projects = asyncio.run(manager.aget_all())
+        assert [p.name for p in projects] == ["Work"]
+        assert manager.get_all()[0].id == "p1"
+        mock_client.batch.acheck.assert_awaited_once_with(0)
+        mock_client.batch.check.assert_not_called()
+
+    def test_delete_invalidates_cache(self, manager, mock_client):
+        mock_client.batch.check.return_value = {"projectProfiles": [{"id": "p1", "name": "Work"}]}
+        mock_client.delete.return_value = make_response(EMPTY)
+        manager.get_all()
+        manager.delete("p1")
+        mock_client.batch.check.return_value = {"projectProfiles": []}
+        assert manager.get_all() == []
 
-        projects = manager.get_all()
+    def test_get_templates_revalidates_with_etag(self, manager, mock_client):
+        mock_client.get.return_value = make_response([])
+        manager.get_templates()
+        mock_client.get.assert_called_once_with("/api/v2/templates", cacheable=True)
 
-        assert projects == []
+    def test_delete_many_sends_each_delete_and_reraises(self, manager, mock_client):
+        mock_client.delete.side_effect = [make_response(EMPTY), TickTickAPIError(500)]
+        manager._cache.put({"projectProfiles": []})
 
-    def test_get_all_handles_missing_project_profiles_key(self, manager, mock_client):
-        mock_client.batch.check.return_value = {}
-        projects = manager.get_all()
-        assert projects == []
+        # Run from a saturated one-worker pool, as client.submit(client.project.delete_many, ...) would
+        with ThreadPoolExecutor(1) as outer, pytest.raises(TickTickAPIError):
+            outer.submit(manager.delete_many, ["p1", "p2"]).result(timeout=5)
+
+        mock_client.submit.assert_not_called()
+
+        urls = sorted(c.args[0] for c in mock_client.delete.call_args_list)
+        assert urls == ["/api/v2/project/p1", "/api/v2/project/p2"]
+        assert manager._cache.get("projectProfiles") is None
+
+    # -- batch updates ------------------------------------------------------
+
+    def test_archive_many_fetches_once_and_posts_once(self, manager, mock_client):
+        profiles = [{"id": "p1", "name": "A"}, {"id": "p2", "name": "B"}, {"id": "p3", "name": "C"}]
+        mock_client.batch.check.return_value = {"projectProfiles": profiles}
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        manager.archive_many(["p1", "p3"])
 
-    def test_get_all_uses_checkpoint_zero(self, manager, mock_client):
-        """get_all() must do a full sync (checkpoint=0)."""
-        mock_client.batch.check.return_value = {"projectProfiles": []}
-        manager.get_all()
         mock_client.batch.check.assert_called_once_with(0)
+        mock_client.post.assert_called_once()
+        call = mock_client.post.call_args
+        assert call.args == ("/api/v2/batch/project",)
+        assert [(p["id"], p["closed"]) for p in call.kwargs["json"]["update"]] == [("p1", True), ("p3", True)]
+
+    def test_move_many_to_group_none_sends_ungroup_value(self, manager, mock_client):
+        profiles = [{"id": "p1", "name": "A", "groupId": "g1"}, {"id": "p2", "name": "B", "groupId": "g1"}]
+        mock_client.batch.check.return_value = {"projectProfiles": profiles}
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        manager.move_many_to_group(["p1", "p2"], None)
+
+        sent = mock_client.post.call_args.kwargs["json"]["update"]
+        assert [(p["id"], p["groupId"]) for p in sent] == [("p1", "NONE"), ("p2", "NONE")]
+
+    def test_rename_many_sets_each_name(self, manager, mock_client):
+        profiles = [{"id": "p1", "name": "A"}, {"id": "p2", "name": "B"}]
+        mock_client.batch.check.return_value = {"projectProfiles": profiles}
+        mock_client.post.return_value = make_response(EMPTY_BATCH_RESP)
+
+        manager.rename_many({"p2": "Beta", "p1": "Alpha"})
+
+        updated = mock_client.post.call_args.kwargs["json"]["update"]
+        assert [(p["id"], p["name"]) for p in updated] == [("p2", "Beta"), ("p1", "Alpha")]
+
+    @pytest.mark.parametrize("verify,syncs", [(False, 0), (True, 1)])
+    def test_update_with_empty_body_refetches_only_when_verifying(self, manager, mock_client, verify, syncs):
+        mock_client.put.return_value = make_response(text="")
+        mock_client.batch.check.return_value = {"projectProfiles": [{"id": "p1", "name": "Server"}]}
+        project = Project(id="p1", name="Local")
+
+        result = manager.update(project, verify=verify)
+
+        assert result.name == ("Server" if verify else "Local")
+        assert mock_client.batch.check.call_count == syncs
 
     # -- create() -----------------------------------------------------------
 
@@ -496,25 +846,25 @@ class TestProjectManager:
         manager.create("New List")
 
         mock_client.post.assert_called_once()
-        endpoint = mock_client.post.call_args[0][0]
+        endpoint = mock_client.post.call_args.args[0]
         assert endpoint == "/api/v2/project"
 
     def test_create_includes_optional_color(self, manager, mock_client):
         mock_client.post.return_value = make_response({"id": "p1", "name": "Colored"})
         manager.create("Colored", color="#FF5733")
-        payload = mock_client.post.call_args[1]["json"]
+        payload = mock_client.post.call_args.kwargs["json"]
         assert payload["color"] == "#FF5733"
 
     def test_create_omits_color_when_none(self, manager, mock_client):
         mock_client.post.return_value = make_response({"id": "p1", "name": "Plain"})
         manager.create("Plain")
-        payload = mock_client.post.call_args[1]["json"]
+        payload = mock_client.post.call_args.kwargs["json"]
         assert "color" not in payload
 
     # -- delete() -----------------------------------------------------------
 
     def test_delete_calls_delete_endpoint(self, manager, mock_client):
-        mock_client.delete.return_value = make_response({})
+        mock_client.delete.return_value = make_response(EMPTY)
         manager.delete("proj123")
         mock_client.delete.assert_called_once_with("/api/v2/project/proj123")
 
@@ -547,6 +897,61 @@ class TestHabitManager:
     def manager(self, mock_client):
         return HabitManager(mock_client)
 
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _frozen_date(cls):
+        """Pin date.today() for the whole class with a single patcher."""
+        with patch("ticktick_sdk.managers.habit.date") as mock_date:
+            mock_date.today.return_value.strftime.return_value = "20240315"
+            yield mock_date
+
+    # -- listing cache ------------------------------------------------------
+
+    def test_get_active_and_archived_share_one_fetch(self, manager, mock_client):
+        mock_client.get.return_value = make_response([{"id": "h1", "status": 0}, {"id": "h2", "status": 1}])
+        assert [h.id for h in manager.get_active()] == ["h1"]
+        assert [h.id for h in manager.get_archived()] == ["h2"]
+        mock_client.get.assert_called_once_with("/api/v2/habits")
+
+    def test_partitioned_splits_one_listing(self, manager, mock_client):
+        habits = [{"id": "h1", "status": 0}, {"id": "h2", "status": 1}, {"id": "h3"}]
+        mock_client.get.return_value = make_response(habits)
+        active, archived = manager.partitioned()
+        assert [h.id for h in active] == ["h1", "h3"]
+        assert [h.id for h in archived] == ["h2"]
+        mock_client.get.assert_called_once_with("/api/v2/habits")
+
+    def test_archive_run_shares_one_listing_fetch(self, manager, mock_client):
+        mock_client.get.return_value = make_response([{"id": "h1", "status": 0}, {"id": "h2", "status": 0}])
+        mock_client.put.side_effect = lambda endpoint, json: make_response(json)
+
+        manager.archive("h1")
+        manager.archive("h2")
+
+        mock_client.get.assert_called_once_with("/api/v2/habits")
+        assert [h.id for h in manager.get_archived()] == ["h1", "h2"]
+
+    def test_get_looks_up_cached_listing_by_id(self, manager, mock_client):
+        mock_client.get.return_value = make_response([{"id": "h1", "name": "Read"}, {"id": "h2", "name": "Run"}])
+        with patch("ticktick_sdk.managers.habit.Habit.from_dict", wraps=Habit.from_dict) as from_dict:
+            assert manager.get("h2").name == "Run"
+            assert manager.get("missing") is None
+        from_dict.assert_called_once()
+        mock_client.get.assert_called_once_with("/api/v2/habits")
+
+    def test_cached_habits_do_not_share_lists(self, manager, mock_client):
+        mock_client.get.return_value = make_response([{"id": "h1", "reminders": ["09:00"]}])
+        manager.get("h1").reminders.append("21:00")
+        assert manager.get("h1").reminders == ["09:00"]
+
+    def test_checkin_invalidates_cache(self, manager, mock_client):
+        mock_client.get.return_value = make_response([{"id": "h1"}])
+        mock_client.post.return_value = make_response({"id": "c1", "habitId": "h1"})
+        manager.get_all()
+        manager.checkin("h1")
+        manager.get_all()
+        assert mock_client.get.call_count == 2
+
     # -- get_checkins() with dict-of-lists response -------------------------
 
     def test_get_checkins_handles_flat_list_response(self, manager, mock_client):
@@ -591,33 +996,25 @@ class TestHabitManager:
     def test_get_checkins_posts_to_correct_endpoint(self, manager, mock_client):
         mock_client.post.return_value = make_response([])
         manager.get_checkins(["h1"])
-        endpoint = mock_client.post.call_args[0][0]
+        endpoint = mock_client.post.call_args.args[0]
         assert endpoint == "/api/v2/habitCheckins/query"
 
-    def test_get_checkins_includes_habit_ids_in_payload(self, manager, mock_client):
-        mock_client.post.return_value = make_response([])
-        manager.get_checkins(["h1", "h2"])
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["habitIds"] == ["h1", "h2"]
-
-    def test_get_checkins_excludes_habit_ids_when_none(self, manager, mock_client):
-        """When habit_ids is None, it should not appear in the payload."""
-        mock_client.post.return_value = make_response([])
-        manager.get_checkins(None)
-        payload = mock_client.post.call_args[1]["json"]
-        assert "habitIds" not in payload
-
-    def test_get_checkins_includes_after_stamp_when_set(self, manager, mock_client):
+    @pytest.mark.parametrize(
+        "args,kwargs,key,present,value",
+        [
+            ((["h1", "h2"],), {}, "habitIds", True, ["h1", "h2"]),
+            ((None,), {}, "habitIds", False, None),
+            ((None,), {"after_stamp": "20240301"}, "afterStamp", True, "20240301"),
+            ((None,), {"after_stamp": ""}, "afterStamp", False, None),
+        ],
+    )
+    def test_get_checkins_payload_fields(self, manager, mock_client, args, kwargs, key, present, value):
         mock_client.post.return_value = make_response([])
-        manager.get_checkins(None, after_stamp="20240301")
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["afterStamp"] == "20240301"
-
-    def test_get_checkins_excludes_after_stamp_when_empty(self, manager, mock_client):
-        mock_client.post.return_value = make_response([])
-        manager.get_checkins(None, after_stamp="")
-        payload = mock_client.post.call_args[1]["json"]
-        assert "afterStamp" not in payload
+        manager.get_checkins(*args, **kwargs)
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert (key in payload) is present
+        if present:
+            assert payload[key] == value
 
     # -- get_all() ----------------------------------------------------------
 
@@ -645,27 +1042,39 @@ class TestHabitManager:
         habit_data = {"id": "h_new", "name": "Exercise"}
         mock_client.post.return_value = make_response(habit_data)
 
-        with patch("ticktick_sdk.managers.habit.date") as mock_date:
-            mock_date.today.return_value.strftime.return_value = "20240315"
-            manager.create("Exercise")
+        manager.create("Exercise")
 
-        endpoint = mock_client.post.call_args[0][0]
+        endpoint = mock_client.post.call_args.args[0]
         assert endpoint == "/api/v2/habits"
 
     def test_create_includes_required_fields(self, manager, mock_client):
         mock_client.post.return_value = make_response({"id": "h1", "name": "Test"})
 
-        with patch("ticktick_sdk.managers.habit.date") as mock_date:
-            mock_date.today.return_value.strftime.return_value = "20240315"
-            manager.create("Test")
-
-        payload = mock_client.post.call_args[1]["json"]
-        assert payload["name"] == "Test"
-        assert "type" in payload
-        assert "goal" in payload
-        assert "repeatRule" in payload
-        assert "status" in payload
-        assert payload["status"] == 0
+        manager.create("Test")
+
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert {"name": "Test", "status": 0}.items() <= payload.items()
+        assert {"type", "goal", "repeatRule"} <= payload.keys()
+
+
+def _column_post(col_ids, endpoint, json):
+    col_ids.append(json["id"])
+    return make_response({"id2etag": {json["id"]: "etag1"}, "id2error": {}})
+
+
+def _column_get(col_ids, project_id, name, endpoint):
+    cols = [{"id": cid, "projectId": project_id, "name": name, "sortOrder": 0} for cid in col_ids]
+    return make_response(cols)
+
+
+def make_column_side_effects(project_id, name):
+    """Side effects for a column create round trip.
+
+    POST /column records the generated id and later GETs return it.
+    Returns ``(post, get, col_ids)``.
+    """
+    col_ids: list[str] = []
+    return partial(_column_post, col_ids), partial(_column_get, col_ids, project_id, name), col_ids
 
 
 # ---------------------------------------------------------------------------
@@ -707,50 +1116,33 @@ class TestColumnManager:
         manager.get_by_project("proj1")
         mock_client.get.assert_called_once_with("/api/v2/column/project/proj1")
 
-    def test_create_posts_then_fetches_column(self, manager, mock_client):
-        # First call: POST to create, returns id2etag
-        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {}})
-
-        # get_by_project call returns a column with the generated id
-        # We need to capture the generated id from the POST call
-        created_column = None
+    def test_create_posts_then_fetches_column_when_verifying(self, manager, mock_client):
+        mock_client.post.side_effect, mock_client.get.side_effect, col_ids = make_column_side_effects(
+            "proj1", "Backlog"
+        )
 
-        def fake_get(endpoint):
-            # Return the column that was "created"
-            nonlocal created_column
-            if created_column is None:
-                return make_response([])
-            return make_response([created_column])
+        col = manager.create("proj1", "Backlog", verify=True)
 
-        # Simulate: after post, get_by_project returns a column
-        col_id_holder = []
+        assert col.id == col_ids[0]
+        assert col.name == "Backlog"
+        assert col.project_id == "proj1"
+        mock_client.get.assert_called_once_with("/api/v2/column/project/proj1")
 
-        def fake_post(endpoint, json):
-            col_id_holder.append(json["id"])
-            return make_response({"id2etag": {json["id"]: "etag1"}, "id2error": {}})
+    def test_create_trusts_id2etag_echo(self, manager, mock_client):
+        mock_client.post.side_effect, _, col_ids = make_column_side_effects("proj1", "Backlog")
 
-        mock_client.post.side_effect = fake_post
+        col = manager.create("proj1", "Backlog", sort_order=3)
 
-        def fake_get_project(endpoint):
-            if col_id_holder:
-                return make_response(
-                    [
-                        {
-                            "id": col_id_holder[0],
-                            "projectId": "proj1",
-                            "name": "Backlog",
-                            "sortOrder": 0,
-                        }
-                    ]
-                )
-            return make_response([])
+        assert (col.id, col.name, col.sort_order, col.etag) == (col_ids[0], "Backlog", 3, "etag1")
+        mock_client.get.assert_not_called()
 
-        mock_client.get.side_effect = fake_get_project
+    def test_update_refetches_on_id2error(self, manager, mock_client):
+        mock_client.post.return_value = make_response({"id2etag": {}, "id2error": {"c1": "ERR"}})
+        mock_client.get.return_value = make_response([{"id": "c1", "projectId": "p1", "name": "Server"}])
 
-        col = manager.create("proj1", "Backlog")
+        col = manager.update(Column(id="c1", project_id="p1", name="Local"))
 
-        assert col.name == "Backlog"
-        assert col.project_id == "proj1"
+        assert col.name == "Server"
 
     def test_delete_raises_not_implemented(self, manager):
         with pytest.raises(NotImplementedError):
@@ -763,6 +1155,12 @@ class TestColumnManager:
 
 
 class TestBatchManager:
+    @pytest.fixture
+    def mock_client(self, strict_mock_client):
+        # BatchManager talks to the raw HTTP helpers, so hold it to the real
+        # client interface.
+        return strict_mock_client
+
     @pytest.fixture
     def manager(self, mock_client):
         return BatchManager(mock_client)
@@ -770,7 +1168,7 @@ class TestBatchManager:
     def test_check_calls_correct_endpoint(self, manager, mock_client):
         mock_client.get.return_value = make_response({"checkPoint": 12345})
         manager.check(0)
-        mock_client.get.assert_called_once_with("/api/v3/batch/check/0")
+        mock_client.get.assert_called_once_with("/api/v3/batch/check/0", cacheable=True)
 
     def test_check_updates_checkpoint(self, manager, mock_client):
         mock_client.get.return_value = make_response({"checkPoint": 99999})
@@ -787,20 +1185,84 @@ class TestBatchManager:
         manager.check(0)
         assert mock_client.inbox_id == "inbox_from_sync"
 
-    def test_check_uses_last_checkpoint_when_none_given(self, manager, mock_client):
-        mock_client.get.return_value = make_response({"checkPoint": 500})
-        manager._checkpoint = 300
-        manager.check()  # no arg -> uses stored checkpoint
-        mock_client.get.assert_called_once_with("/api/v3/batch/check/300")
-
-    def test_full_sync_resets_checkpoint_to_zero(self, manager, mock_client):
+    @pytest.mark.parametrize(
+        "method,ckpt,expected",
+        [
+            ("check", 300, "/api/v3/batch/check/300"),  # no arg -> stored checkpoint
+            ("full_sync", 999, "/api/v3/batch/check/0"),  # always from scratch
+            ("delta_sync", 100, "/api/v3/batch/check/100"),
+        ],
+    )
+    def test_checkpoint_routing(self, manager, mock_client, method, ckpt, expected):
         mock_client.get.return_value = make_response({"checkPoint": 1})
-        manager._checkpoint = 999
-        manager.full_sync()
-        mock_client.get.assert_called_with("/api/v3/batch/check/0")
-
-    def test_delta_sync_uses_stored_checkpoint(self, manager, mock_client):
-        mock_client.get.return_value = make_response({"checkPoint": 200})
-        manager._checkpoint = 100
-        manager.delta_sync()
-        mock_client.get.assert_called_with("/api/v3/batch/check/100")
+        manager._checkpoint = ckpt
+        getattr(manager, method)()
+        mock_client.get.assert_called_once_with(expected, cacheable=True)
+
+    def test_snapshot_reuses_last_full_sync(self, manager, mock_client):
+        mock_client.get.return_value = make_response({"checkPoint": 1, "tags": []})
+        data = manager.check(0)
+        assert manager.snapshot() == data
+        mock_client.get.assert_called_once()
+
+        manager.invalidate()
+        manager.snapshot()
+        assert mock_client.get.call_count == 2
+
+    def test_check_returns_a_copy_of_the_snapshot(self, manager, mock_client):
+        mock_client.get.return_value = make_response({"checkPoint": 1, "tags": [{"name": "home"}]})
+        data = manager.check(0)
+        data["tags"] = []
+        assert manager.snapshot()["tags"] == [{"name": "home"}]
+
+    def test_snapshot_serves_project_and_tag_listings(self, manager, mock_client):
+        mock_client.get.return_value = make_response(
+            {"projectProfiles": [{"id": "p1", "name": "Work"}], "tags": [{"name": "home"}]}
+        )
+        mock_client.batch = manager
+        ProjectManager(mock_client).get_all()
+        TagManager(mock_client).get_all()
+        mock_client.get.assert_called_once_with("/api/v3/batch/check/0", cacheable=True)
+
+    def test_check_partial_narrows_full_response_without_ijson(self, manager, mock_client):
+        mock_client.get.return_value = make_response(
+            {"checkPoint": 7, "filters": [{"id": "f1"}], "tags": [{"name": "t"}]}
+        )
+        with patch("ticktick_sdk.managers.batch.ijson", None):
+            data = manager.check_partial({"filters"}, 0)
+        assert data == {"checkPoint": 7, "filters": [{"id": "f1"}]}
+        assert manager.checkpoint == 7
+
+    def test_check_partial_streams_requested_keys_with_ijson(self, manager, mock_client):
+        resp = MagicMock()
+        mock_client.get.return_value = resp
+        items = [("checkPoint", 8), ("syncTaskBean", {"update": []}), ("filters", [])]
+        with patch("ticktick_sdk.managers.batch.ijson") as ijson:
+            ijson.kvitems.return_value = iter(items)
+            data = manager.check_partial({"filters"}, 0)
+        mock_client.get.assert_called_once_with("/api/v3/batch/check/0", stream=True)
+        ijson.kvitems.assert_called_once_with(resp.raw, "", use_float=True)
+        assert data == {"checkPoint": 8, "filters": []}
+        assert manager.checkpoint == 0  # a projected read leaves the stored checkpoint alone
+
+    def test_check_partial_uses_fresh_snapshot(self, manager, mock_client):
+        mock_client.get.return_value = make_response({"checkPoint": 7, "filters": [{"id": "f1"}], "tags": []})
+        manager.check(0)
+        with patch("ticktick_sdk.managers.batch.ijson") as ijson:
+            data = manager.check_partial({"filters"}, 0)
+        ijson.kvitems.assert_not_called()
+        mock_client.get.assert_called_once()
+        assert data == {"checkPoint": 7, "filters": [{"id": "f1"}]}
+
+    def test_snapshot_returns_a_copy(self, manager, mock_client):
+        mock_client.get.return_value = make_response({"checkPoint": 1, "tags": [{"name": "home"}]})
+        manager.check(0)
+        manager.snapshot().pop("tags")
+        assert manager.snapshot()["tags"] == [{"name": "home"}]
+
+    def test_check_partial_decodes_whole_body_without_raw_stream(self, manager, mock_client):
+        mock_client.get.return_value = make_response({"checkPoint": 9, "filters": [], "tags": []})
+        with patch("ticktick_sdk.managers.batch.ijson") as ijson:
+            data = manager.check_partial({"filters"}, 0)
+        ijson.kvitems.assert_not_called()
+        assert data == {"checkPoint": 9, "filters": []}
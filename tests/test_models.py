@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone, timedelta
+import json
+import sys
+from datetime import date, datetime, timezone, timedelta
 
+import pytest
 
 from ticktick_sdk.models import (
     _format_dt,
@@ -50,6 +53,14 @@ def test_format_dt_offset_aware():
     assert result == "2024-03-15T10:30:00.000+0000"
 
 
+def test_format_dt_cache_treats_equal_instants_alike():
+    """Cached results are shared between equal instants, whatever the offset."""
+    utc = datetime(2024, 3, 15, 10, 30, 0, tzinfo=timezone.utc)
+    plus5 = utc.astimezone(timezone(timedelta(hours=5)))
+    assert _format_dt(utc) == _format_dt(plus5) == "2024-03-15T10:30:00.000+0000"
+    assert _format_dt(datetime(2024, 3, 15, 15, 30, 0)) == "2024-03-15T15:30:00.000+0000"
+
+
 def test_parse_dt_with_milliseconds_and_tz():
     """Parse TickTick's primary datetime format."""
     val = "2024-03-15T10:30:00.000+0000"
@@ -79,6 +90,24 @@ def test_parse_dt_no_tz():
     assert result.minute == 30
 
 
+def test_parse_dt_matches_strptime():
+    """The fromisoformat fast path agrees with the strptime formats."""
+    val = "2024-03-15T10:30:00.123+0000"
+    assert _parse_dt(val) == datetime.strptime(val, "%Y-%m-%dT%H:%M:%S.%f%z")
+    assert _parse_dt(val).utcoffset() == timedelta(0)
+
+
+def test_parse_dt_reuses_parsed_value():
+    val = "2024-03-15T10:30:00.000+0000"
+    assert _parse_dt(val) is _parse_dt(val)
+
+
+def test_parse_dt_passes_datetime_through():
+    dt = datetime(2024, 3, 15, 10, 30, tzinfo=timezone.utc)
+    assert _parse_dt(dt) is dt
+    assert Task.from_dict({"id": "t1", "projectId": "p1", "dueDate": dt}).due_date is dt
+
+
 def test_parse_dt_none():
     assert _parse_dt(None) is None
 
@@ -304,6 +333,37 @@ def test_task_from_dict_null_fields():
     assert task.column_id == ""
 
 
+def test_task_from_dict_copies_list_fields():
+    raw = {"id": "t1", "tags": ["work"], "attachments": [{"id": "a1"}], "childIds": ["c1"]}
+    task = Task.from_dict(raw)
+    task.tags.append("home")
+    task.attachments.clear()
+    task.child_ids.append("c2")
+    assert raw == {"id": "t1", "tags": ["work"], "attachments": [{"id": "a1"}], "childIds": ["c1"]}
+
+
+def test_task_from_dicts():
+    tasks = Task.from_dicts([TASK_DICT, {"id": "t2", "projectId": "p1", "title": "Second"}])
+    assert [t.id for t in tasks] == [TASK_DICT["id"], "t2"]
+    assert tasks[0] == Task.from_dict(TASK_DICT)
+
+
+def test_task_from_dict_interns_small_domain_strings():
+    # Decoded separately, so each dict holds its own copies of the strings
+    raw = '{"id": "t1", "projectId": "p1", "kind": "CHECKLIST", "timeZone": "Europe/Berlin"}'
+    a, b = Task.from_dict(json.loads(raw)), Task.from_dict(json.loads(raw))
+    assert a.kind is b.kind is sys.intern("CHECKLIST")
+    assert a.time_zone is b.time_zone
+
+
+def test_task_rejects_unknown_attributes():
+    """Models are slotted, so typos in attribute names fail loudly."""
+    task = Task.from_dict({"id": "t1", "projectId": "p1", "title": "Test"})
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.titel = "Typo"
+
+
 def test_task_to_dict_basic():
     task = Task.from_dict(TASK_DICT)
     d = task.to_dict()
@@ -846,6 +906,16 @@ def test_habit_checkin_round_trip():
     assert c2.checkin_stamp == c.checkin_stamp
 
 
+def test_checkin_date_from_stamp():
+    assert HabitCheckin.from_dict(CHECKIN_DICT).checkin_date == date(2024, 3, 15)
+    assert HabitCheckin(id="c1", habit_id="h1").checkin_date is None
+
+
+@pytest.mark.parametrize("stamp", ["2024-03-15", "2024315", "20241315", 2024315])
+def test_checkin_date_malformed_stamp_is_none(stamp):
+    assert HabitCheckin(id="c1", habit_id="h1", checkin_stamp=stamp).checkin_date is None
+
+
 # ---------------------------------------------------------------------------
 # Column
 # ---------------------------------------------------------------------------
@@ -893,3 +963,162 @@ def test_column_round_trip():
     assert col2.project_id == col.project_id
     assert col2.name == col.name
     assert col2.sort_order == col.sort_order
+
+
+# ---------------------------------------------------------------------------
+# Generated to_dict
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "obj,expected",
+    [
+        (
+            Subtask.from_dict(SUBTASK_DICT),
+            {
+                "id": "sub123",
+                "title": "Write tests",
+                "status": 0,
+                "sortOrder": 1099511627776,
+                "startDate": "2024-03-15T09:00:00.000+0000",
+                "isAllDay": False,
+                "timeZone": "America/New_York",
+            },
+        ),
+        (
+            Task.from_dict(TASK_DICT),
+            {
+                "id": "task001",
+                "projectId": "proj001",
+                "title": "Buy groceries",
+                "content": "- Milk\n- Eggs",
+                "desc": "shopping list",
+                "priority": 3,
+                "status": 0,
+                "isAllDay": False,
+                "isFloating": False,
+                "kind": "TEXT",
+                "sortOrder": 5000,
+                "items": [{"id": "sub001", "title": "Get milk", "status": 0, "sortOrder": 0, "isAllDay": False}],
+                "reminders": [{"id": "rem001", "trigger": "TRIGGER:P0DT9H0M0S"}],
+                "tags": ["personal", "errands"],
+                "progress": 0,
+                "timeZone": "America/New_York",
+                "startDate": "2024-03-15T09:00:00.000+0000",
+                "dueDate": "2024-03-15T18:00:00.000+0000",
+                "repeatFlag": "RRULE:FREQ=WEEKLY;INTERVAL=1",
+                "repeatFrom": "1",
+                "etag": "abc123etag",
+            },
+        ),
+        (
+            Task(id="t1", project_id="p1", title="x"),
+            {
+                "id": "t1",
+                "projectId": "p1",
+                "title": "x",
+                "content": "",
+                "desc": "",
+                "priority": 0,
+                "status": 0,
+                "isAllDay": False,
+                "isFloating": False,
+                "kind": "TEXT",
+                "sortOrder": 0,
+                "items": [],
+                "reminders": [],
+                "tags": [],
+                "progress": 0,
+            },
+        ),
+        (
+            Project.from_dict(PROJECT_DICT),
+            {
+                "id": "proj001",
+                "name": "Work",
+                "sortOrder": 0,
+                "sortType": "sortOrder",
+                "sortOption": {"groupBy": "sortOrder", "orderBy": "sortOrder", "order": None},
+                "viewMode": "list",
+                "kind": "TASK",
+                "inAll": True,
+                "color": "#FF5733",
+            },
+        ),
+        (
+            Project.from_dict({**PROJECT_DICT, "closed": False}),
+            {
+                "id": "proj001",
+                "name": "Work",
+                "sortOrder": 0,
+                "sortType": "sortOrder",
+                "sortOption": {"groupBy": "sortOrder", "orderBy": "sortOrder", "order": None},
+                "viewMode": "list",
+                "kind": "TASK",
+                "inAll": True,
+                "color": "#FF5733",
+                "closed": False,
+            },
+        ),
+        (
+            ProjectGroup.from_dict(GROUP_DICT),
+            {"id": "grp001", "name": "My Folder", "showAll": True, "sortOrder": 100},
+        ),
+        (
+            Tag.from_dict(TAG_DICT),
+            {"name": "work", "label": "Work", "sortOrder": 0, "sortType": "sortOrder", "color": "#3FBDDD"},
+        ),
+        (
+            Filter.from_dict(FILTER_DICT),
+            {
+                "id": "filt001",
+                "name": "High Priority",
+                "rule": '{"type":0,"and":[]}',
+                "sortOrder": 0,
+                "sortType": "priority",
+                "viewMode": "list",
+            },
+        ),
+        (
+            Habit.from_dict(HABIT_DICT),
+            {
+                "id": "habit001",
+                "name": "Morning Run",
+                "iconRes": "habit_running",
+                "color": "#7BC4FA",
+                "sortOrder": 0,
+                "status": 0,
+                "encouragement": "Keep it up!",
+                "type": "Boolean",
+                "goal": 1,
+                "step": 1,
+                "unit": "Count",
+                "repeatRule": "RRULE:FREQ=DAILY;INTERVAL=1",
+                "reminders": [],
+                "recordEnable": False,
+                "sectionId": "-1",
+                "targetDays": 30,
+                "targetStartDate": 20240301,
+            },
+        ),
+        (
+            HabitCheckin.from_dict(CHECKIN_DICT),
+            {
+                "id": "checkin001",
+                "habitId": "habit001",
+                "status": 2,
+                "value": 1.0,
+                "checkinStamp": "20240315",
+                "goal": 1.0,
+                "checkinTime": "2024-03-15T07:30:00.000+0000",
+            },
+        ),
+        (
+            Column.from_dict(COLUMN_DICT),
+            {"id": "col001", "projectId": "proj001", "name": "In Progress", "sortOrder": 100},
+        ),
+    ],
+)
+def test_generated_to_dict(obj, expected):
+    """The compiled to_dict emits exactly the expected keys, in order."""
+    assert list(obj.to_dict().items()) == list(expected.items())
@@ -14,26 +14,67 @@ Usage:
     task = client.task.create("My task", project_id="inbox")
 """
 
-from ticktick_sdk.client import TickTickClient
-from ticktick_sdk.exceptions import (
-    TickTickError,
-    TickTickAuthError,
-    TickTickAPIError,
-    TickTickRateLimitError,
-)
-from ticktick_sdk.models import (
-    Task,
-    Project,
-    Tag,
-    Filter,
-    Habit,
-    HabitCheckin,
-    Subtask,
-    Column,
-    ProjectGroup,
-    Reminder,
-    SortOption,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ticktick_sdk.client import TickTickClient
+    from ticktick_sdk.exceptions import (
+        TickTickError,
+        TickTickAuthError,
+        TickTickAPIError,
+        TickTickRateLimitError,
+    )
+    from ticktick_sdk.models import (
+        Task,
+        Project,
+        Tag,
+        Filter,
+        Habit,
+        HabitCheckin,
+        Subtask,
+        Column,
+        ProjectGroup,
+        Reminder,
+        SortOption,
+    )
+
+# Public names are imported on first access (PEP 562), so importing the
+# package does not load client.py and requests until the client is used.
+_LAZY = {
+    "TickTickClient": "ticktick_sdk.client",
+    "TickTickError": "ticktick_sdk.exceptions",
+    "TickTickAuthError": "ticktick_sdk.exceptions",
+    "TickTickAPIError": "ticktick_sdk.exceptions",
+    "TickTickRateLimitError": "ticktick_sdk.exceptions",
+    "Task": "ticktick_sdk.models",
+    "Project": "ticktick_sdk.models",
+    "Tag": "ticktick_sdk.models",
+    "Filter": "ticktick_sdk.models",
+    "Habit": "ticktick_sdk.models",
+    "HabitCheckin": "ticktick_sdk.models",
+    "Subtask": "ticktick_sdk.models",
+    "Column": "ticktick_sdk.models",
+    "ProjectGroup": "ticktick_sdk.models",
+    "Reminder": "ticktick_sdk.models",
+    "SortOption": "ticktick_sdk.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
+
 
 __all__ = [
     "TickTickClient",
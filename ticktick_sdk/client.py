@@ -2,11 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import json
 import logging
+import math
+import os
+import random
+import re
+import sys
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
 from ticktick_sdk.exceptions import (
     TickTickAuthError,
@@ -16,24 +39,218 @@ from ticktick_sdk.exceptions import (
     TickTickAPIError,
 )
 
-from ticktick_sdk.managers.task import TaskManager
-from ticktick_sdk.managers.project import ProjectManager
-from ticktick_sdk.managers.tag import TagManager
-from ticktick_sdk.managers.filter import FilterManager
-from ticktick_sdk.managers.habit import HabitManager
-from ticktick_sdk.managers.search import SearchManager
-from ticktick_sdk.managers.user import UserManager
-from ticktick_sdk.managers.batch import BatchManager
-from ticktick_sdk.managers.column import ColumnManager
+if TYPE_CHECKING:
+    import httpx
+    from typing_extensions import Self
+
+    from ticktick_sdk.managers.batch import BatchManager
+    from ticktick_sdk.managers.column import ColumnManager
+    from ticktick_sdk.managers.filter import FilterManager
+    from ticktick_sdk.managers.habit import HabitManager
+    from ticktick_sdk.managers.project import ProjectManager
+    from ticktick_sdk.managers.search import SearchManager
+    from ticktick_sdk.managers.tag import TagManager
+    from ticktick_sdk.managers.task import TaskManager
+    from ticktick_sdk.managers.user import UserManager
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.ticktick.com"
 
 _SENSITIVE_ENDPOINTS = frozenset({"/api/v2/user/signon", "/api/v2/user/sign/mfa/code/verify"})
+# Catches sign-on/MFA routes the set misses: other MFA paths, query strings,
+# absolute URLs and endpoints given without a leading slash
+_SENSITIVE_PREFIX_RE = re.compile(r"(?:^|/)api/v2/user/sign(?:on|/mfa)(?=[/?#]|$)")
 
 MAX_RETRIES = 3
 RETRY_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+
+# Transient gateway errors retried with backoff, for methods safe to replay
+_RETRYABLE_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Burst allowance for the optional client-side rate limiter (rate_limit=)
+RATE_LIMIT_BURST = 10
+
+# Worker threads behind submit(), created on first use
+EXECUTOR_WORKERS = 8
+
+# Keep-alive pool sizes for the session the client creates itself
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Number of ETag-validated GET responses kept for conditional requests
+ETAG_CACHE_SIZE = 128
+
+# Browser-like device descriptor the web API expects, sent as compact JSON
+_X_DEVICE = {
+    "platform": "web",
+    "os": "macOS 10.15.7",
+    "device": "Chrome 120.0.0.0",
+    "name": "",
+    "version": 6010,
+    "id": "web_client",
+    "channel": "website",
+    "campaign": "",
+    "websocket": "",
+}
+
+# Headers applied to every session, built once at import
+_DEFAULT_HEADERS = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Content-Type": "application/json",
+        "x-device": json.dumps(_X_DEVICE, separators=(",", ":")),
+        "Origin": "https://ticktick.com",
+        "Referer": "https://ticktick.com/",
+    }
+)
+
+# On-disk GET cache used with cache=True. Only the endpoints listed here are
+# stored, for this many seconds; everything else always hits the API. A TTL
+# of 0 stores the response but revalidates it with its ETag on every use, so
+# a new process can get the full sync as a 304 without risking stale data.
+DISK_CACHE_PATH = "~/.cache/ticktick"
+DISK_CACHE_TTLS = {
+    "*/api/v2/column/*": 600,
+    "*/api/v2/user/preferences/*": 3600,
+    "*/api/v3/batch/check/0": 0,
+}
+
+
+def _orjson_decoder(resp: requests.Response) -> Callable[..., Any]:
+    """Return a drop-in for ``resp.json`` that parses the raw bytes with orjson.
+
+    Decode failures surface as ``requests.exceptions.JSONDecodeError``, the
+    error callers of ``resp.json()`` already catch.
+    """
+
+    def json(**_: Any) -> Any:
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    return json
+
+
+def _is_httpx_client(session: Any) -> bool:
+    """True for an httpx.Client; any other session is driven like requests.Session."""
+    # Only an already-imported httpx can have built the session
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(session, httpx.Client)
+
+
+def _encode_body(json: Any) -> bytes | None:
+    """Serialise a JSON request body with orjson, or None to leave it to the HTTP library.
+
+    Returns None without orjson and for payloads orjson rejects, such as
+    integers wider than 64 bits.
+    """
+    if orjson is None or json is None:
+        return None
+    try:
+        return orjson.dumps(json)
+    except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+        return None
+
+
+def _parse_retry_after(raw: str | None) -> int | None:
+    """Seconds to wait from a Retry-After header, in delay-seconds or HTTP-date form."""
+    if raw is None:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0, math.ceil((when - datetime.now(timezone.utc)).total_seconds()))
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with jitter, so concurrent clients don't retry in lockstep."""
+    return min(MAX_BACKOFF, RETRY_BACKOFF * 2**attempt) * (0.5 + random.random())
+
+
+class _TokenBucket:
+    """Client-side request shaping with an AIMD-adjusted rate.
+
+    Each 429 halves the refill rate; every ``burst`` consecutive successes
+    add back a tenth of the configured maximum.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def record(self, status: int) -> None:
+        with self._lock:
+            if status == 429:
+                self.rate = max(self.max_rate / 16, self.rate / 2)
+                self._successes = 0
+            elif status < 400:
+                self._successes += 1
+                if self._successes >= self.burst:
+                    self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+                    self._successes = 0
+
+
+M = TypeVar("M")
+T = TypeVar("T")
+
+
+class _LazyManager(Generic[M]):
+    """Import and build a manager on first access, then cache it on the client.
+
+    This is a non-data descriptor, so once the manager sits in the instance
+    ``__dict__`` later lookups bypass ``__get__`` entirely.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self._module = module
+        self._class_name = class_name
+        self._attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = name
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> _LazyManager[M]: ...
+
+    @overload
+    def __get__(self, obj: TickTickClient, objtype: type | None = None) -> M: ...
+
+    def __get__(self, obj: TickTickClient | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        with obj._manager_lock:
+            manager = obj.__dict__.get(self._attr)
+            if manager is None:
+                cls = getattr(importlib.import_module(self._module), self._class_name)
+                manager = obj.__dict__[self._attr] = cls(obj)
+        return manager
 
 
 class TickTickClient:
@@ -51,49 +268,110 @@ class TickTickClient:
         client.user     - User profile and preferences
         client.batch    - Batch sync operations
         client.column   - Kanban columns / sections
+
+    Managers are imported and created the first time they are accessed.
+
+    One HTTP session is created per client and reused for every request, so
+    consecutive calls share pooled keep-alive connections; pool_size caps how
+    many are kept per host for multi-threaded callers. rate_limit (requests
+    per second) paces calls locally and slows down further after each 429.
+    Pass http2=True to multiplex requests over a single HTTP/2 connection
+    instead (needs httpx), or cache=True to keep rarely-changing GETs such
+    as columns and preferences in an on-disk cache (needs requests-cache).
+
+    The a-prefixed methods (arequest(), client.habit.aget_all(), ...) run on
+    an httpx.AsyncClient created on first use, so independent calls can be
+    overlapped with client.gather(). Call aclose() when done with them.
     """
 
+    task: _LazyManager[TaskManager] = _LazyManager("ticktick_sdk.managers.task", "TaskManager")
+    project: _LazyManager[ProjectManager] = _LazyManager("ticktick_sdk.managers.project", "ProjectManager")
+    tag: _LazyManager[TagManager] = _LazyManager("ticktick_sdk.managers.tag", "TagManager")
+    filter: _LazyManager[FilterManager] = _LazyManager("ticktick_sdk.managers.filter", "FilterManager")
+    habit: _LazyManager[HabitManager] = _LazyManager("ticktick_sdk.managers.habit", "HabitManager")
+    search: _LazyManager[SearchManager] = _LazyManager("ticktick_sdk.managers.search", "SearchManager")
+    user: _LazyManager[UserManager] = _LazyManager("ticktick_sdk.managers.user", "UserManager")
+    batch: _LazyManager[BatchManager] = _LazyManager("ticktick_sdk.managers.batch", "BatchManager")
+    column: _LazyManager[ColumnManager] = _LazyManager("ticktick_sdk.managers.column", "ColumnManager")
+
     def __init__(
         self,
         base_url: str = BASE_URL,
         session: requests.Session | None = None,
         token: str | None = None,
+        *,
+        http2: bool = False,
+        pool_size: int = POOL_MAXSIZE,
+        rate_limit: float | None = None,
+        cache: bool = False,
     ):
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self.session = session or self._new_session(http2, pool_size, cache)
+        # Cleared after every successful write, so reads after a change
+        # never come from the disk cache.
+        self._disk_cache: Any = getattr(self.session, "cache", None) if cache else None
+        # An httpx.Client (http2=True) takes raw bodies as content= and has
+        # no stream= argument.
+        self._httpx = _is_httpx_client(self.session)
+        self._etag_cache: OrderedDict[str, tuple[str, requests.Response]] = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._manager_lock = threading.Lock()
+        self._inflight: dict[str, Future[requests.Response]] = {}
+        self._inflight_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._aclient: httpx.AsyncClient | None = None
+        # Keyed by event loop as well, since a future belongs to one loop
+        self._ainflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future[httpx.Response]] = {}
+        self._bucket = _TokenBucket(rate_limit, RATE_LIMIT_BURST) if rate_limit else None
         self.inbox_id: str = ""
         self._setup_session()
         if token:
             self.set_token(token)
 
-        # Wire up managers
-        self.task = TaskManager(self)
-        self.project = ProjectManager(self)
-        self.tag = TagManager(self)
-        self.filter = FilterManager(self)
-        self.habit = HabitManager(self)
-        self.search = SearchManager(self)
-        self.user = UserManager(self)
-        self.batch = BatchManager(self)
-        self.column = ColumnManager(self)
+    @staticmethod
+    def _new_session(http2: bool, pool_size: int, cache: bool = False) -> requests.Session | httpx.Client:
+        if http2 and cache:
+            raise ValueError("cache=True is not supported together with http2=True")
+        if http2:
+            try:
+                import httpx
+            except ImportError as exc:
+                raise ImportError("http2=True requires httpx: pip install 'ticktick-sdk[http2]'") from exc
+            return httpx.Client(http2=True, limits=httpx.Limits(max_keepalive_connections=pool_size))
+        if cache:
+            try:
+                import requests_cache
+            except ImportError as exc:
+                raise ImportError("cache=True requires requests-cache: pip install 'ticktick-sdk[cache]'") from exc
+            session = requests_cache.CachedSession(
+                cache_name=os.path.expanduser(DISK_CACHE_PATH),
+                backend="sqlite",
+                allowable_methods=("GET",),
+                expire_after=requests_cache.DO_NOT_CACHE,
+                urls_expire_after=DISK_CACHE_TTLS,
+                cache_control=True,
+                # Keyed on the auth cookie so accounts never see each other's data
+                match_headers=["Cookie"],
+            )
+        else:
+            session = requests.Session()
+        # Only failed connection attempts are retried here, since nothing has
+        # been sent yet; status-based retries stay in request().
+        retry = Retry(total=MAX_RETRIES, read=False, status=0, backoff_factor=RETRY_BACKOFF)
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _setup_session(self) -> None:
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Content-Type": "application/json",
-                "x-device": '{"platform":"web","os":"macOS 10.15.7","device":"Chrome 120.0.0.0",'
-                '"name":"","version":6010,"id":"web_client","channel":"website","campaign":"","websocket":""}',
-                "Origin": "https://ticktick.com",
-                "Referer": "https://ticktick.com/",
-            }
-        )
+        self.session.headers.update(_DEFAULT_HEADERS)
 
     def set_token(self, token: str) -> None:
         """Set the authentication cookie directly (t=<token>)."""
         self.session.cookies.set("t", token, domain="ticktick.com", path="/")
+        if self._aclient is not None:
+            self._aclient.cookies.set("t", token, domain="ticktick.com", path="/")
 
     # ── Authentication ────────────────────────────────────────────────
 
@@ -139,53 +417,154 @@ class TickTickClient:
         params: dict | None = None,
         json: Any = None,
         data: Any = None,
+        cacheable: bool = False,
         **kwargs: Any,
     ) -> requests.Response:
-        """Make an authenticated HTTP request to the TickTick API."""
+        """Make an authenticated HTTP request to the TickTick API.
+
+        With cacheable=True, a GET whose response carried an ETag is
+        revalidated with If-None-Match next time, and a 304 returns the
+        previously received response instead of downloading the body again.
+
+        A plain GET issued while an identical one is still in flight on
+        another thread waits for it and shares its response.
+        """
+        if method != "GET" or json is not None or data is not None or kwargs:
+            return self._send(method, endpoint, params, json, data, cacheable, kwargs)
+        key = f"{self.base_url}{endpoint}?{urlencode(sorted((params or {}).items()))}"
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._inflight[key] = Future()
+        if not leader:
+            return flight.result()
+        try:
+            resp = self._send(method, endpoint, params, json, data, cacheable, kwargs)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(resp)
+            return resp
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None,
+        json: Any,
+        data: Any,
+        cacheable: bool,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
         url = f"{self.base_url}{endpoint}"
+        # Pre-encoded bodies go out as data=; the session already sends
+        # Content-Type: application/json.
+        body = _encode_body(json) if data is None else None
+        if body is not None:
+            json = None
+            if self._httpx:
+                kwargs["content"] = body
+            else:
+                data = body
+        if self._httpx:
+            kwargs.pop("stream", None)
+        cache_key = None
+        cached = None
+        if cacheable and method == "GET":
+            cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+            with self._etag_lock:
+                cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
         for attempt in range(MAX_RETRIES):
+            if self._bucket is not None and (wait := self._bucket.reserve()):
+                time.sleep(wait)
             resp = self.session.request(method, url, params=params, json=json, data=data, **kwargs)
-            if resp.ok:
-                return resp
-
             status = resp.status_code
-            if endpoint in _SENSITIVE_ENDPOINTS:
-                logger.error("HTTP %s %s -> %s: <redacted>", method, endpoint, status)
-            else:
-                logger.error("HTTP %s %s -> %s: %s", method, endpoint, status, resp.text[:500])
+            if self._bucket is not None:
+                self._bucket.record(status)
+            if status == 304 and cached is not None:
+                return cached[1]
+            if status < 400:
+                if orjson is not None and (type(resp) is requests.Response or self._httpx):
+                    resp.json = _orjson_decoder(resp)  # type: ignore[method-assign]
+                if cache_key is not None:
+                    self._remember_etag(cache_key, resp)
+                self._on_success(method)
+                return resp
 
-            if status == 429:
-                retry_after_raw = resp.headers.get("Retry-After")
-                retry_after = int(retry_after_raw) if retry_after_raw is not None else None
-                if attempt < MAX_RETRIES - 1:
-                    sleep_secs = retry_after if retry_after is not None else RETRY_BACKOFF * (2**attempt)
-                    logger.warning(
-                        "Rate limited; retrying in %.1f s (attempt %d/%d)", sleep_secs, attempt + 1, MAX_RETRIES
-                    )
-                    time.sleep(sleep_secs)
-                    continue
-                raise TickTickRateLimitError(retry_after=retry_after)
-
-            if status == 401:
-                raise TickTickAuthError(f"Authentication failed: {resp.text[:200]}")
-            if status == 403:
-                raise TickTickForbiddenError(f"Access denied: {resp.text[:200]}")
-            if status == 404:
-                raise TickTickNotFoundError(f"Resource not found: {resp.text[:200]}")
-
-            # All other 4xx / 5xx
-            try:
-                body = resp.json()
-                error_code = body.get("errorCode", "")
-                error_message = body.get("errorMessage", "")
-            except Exception:
-                error_code = ""
-                error_message = resp.text[:200]
-            raise TickTickAPIError(status, error_code=error_code, error_message=error_message)
+            time.sleep(self._handle_error(method, endpoint, resp, attempt))
 
         # Should not be reached, but satisfies type checkers
         raise TickTickAPIError(0, error_message="Unexpected exit from retry loop")
 
+    def _on_success(self, method: str) -> None:
+        """Bookkeeping shared by request() and arequest() after a successful response."""
+        if self._disk_cache is not None and method != "GET":
+            # A write may change what the cached reads would return
+            self._disk_cache.clear()
+
+    @staticmethod
+    def _handle_error(method: str, endpoint: str, resp: Any, attempt: int) -> float:
+        """Log a failed response and raise, or return the delay before retrying it.
+
+        429s are retried for every method; 502/503/504 only for idempotent ones.
+        """
+        status = resp.status_code
+        if endpoint in _SENSITIVE_ENDPOINTS or _SENSITIVE_PREFIX_RE.search(endpoint):
+            logger.error("HTTP %s %s -> %s: <redacted>", method, endpoint, status)
+        else:
+            logger.error("HTTP %s %s -> %s: %s", method, endpoint, status, resp.text[:500])
+
+        if status == 429:
+            retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+            if attempt < MAX_RETRIES - 1:
+                sleep_secs = retry_after if retry_after is not None else _backoff(attempt)
+                logger.warning("Rate limited; retrying in %.1f s (attempt %d/%d)", sleep_secs, attempt + 1, MAX_RETRIES)
+                return sleep_secs
+            raise TickTickRateLimitError(retry_after=retry_after)
+
+        if status in _RETRYABLE_STATUSES and method in _IDEMPOTENT_METHODS and attempt < MAX_RETRIES - 1:
+            sleep_secs = _backoff(attempt)
+            logger.warning("HTTP %s; retrying in %.1f s (attempt %d/%d)", status, sleep_secs, attempt + 1, MAX_RETRIES)
+            return sleep_secs
+
+        if status == 401:
+            raise TickTickAuthError(f"Authentication failed: {resp.text[:200]}")
+        if status == 403:
+            raise TickTickForbiddenError(f"Access denied: {resp.text[:200]}")
+        if status == 404:
+            raise TickTickNotFoundError(f"Resource not found: {resp.text[:200]}")
+
+        # All other 4xx / 5xx; decoder errors subclass ValueError in both
+        # requests and httpx, so nothing else is swallowed here.
+        try:
+            body = resp.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            raise TickTickAPIError(status, error_message=resp.text[:200])
+        raise TickTickAPIError(
+            status,
+            error_code=body.get("errorCode", ""),
+            error_message=body.get("errorMessage", resp.text[:200]),
+        )
+
+    def _remember_etag(self, key: str, resp: requests.Response) -> None:
+        etag = resp.headers.get("ETag")
+        if not etag:
+            return
+        with self._etag_lock:
+            self._etag_cache[key] = (etag, resp)
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
     def get(self, endpoint: str, **kwargs: Any) -> requests.Response:
         return self.request("GET", endpoint, **kwargs)
 
@@ -197,3 +576,145 @@ class TickTickClient:
 
     def delete(self, endpoint: str, **kwargs: Any) -> requests.Response:
         return self.request("DELETE", endpoint, **kwargs)
+
+    def prefetch(self) -> None:
+        """Run one full sync now, e.g. right after logging in.
+
+        Project, group and tag listings requested while it is fresh (see
+        BatchManager.snapshot()) are then served without another sync.
+        """
+        self.batch.check(0)
+
+    # ── Background calls ──────────────────────────────────────────────
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        """Run a blocking call on the client's worker threads.
+
+        Rate-limit waits and retries then happen on a worker, so the caller
+        can keep dispatching other calls, e.g.
+        ``client.submit(client.habit.get_active)`` or
+        ``client.submit(client.get, "/api/v2/habits")``.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(EXECUTOR_WORKERS, thread_name_prefix="ticktick")
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def close(self) -> None:
+        """Flush batched task updates and wait for submitted calls, then close the HTTP session."""
+        task = self.__dict__.get("task")
+        if task is not None:
+            task.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ── Async HTTP layer ──────────────────────────────────────────────
+
+    def _async_session(self) -> httpx.AsyncClient:
+        if self._aclient is None:
+            try:
+                import httpx
+            except ImportError as exc:
+                raise ImportError("async requests require httpx: pip install 'ticktick-sdk[http2]'") from exc
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                headers=dict(self.session.headers),
+                cookies=self.session.cookies,
+                limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_CONNECTIONS),
+            )
+        return self._aclient
+
+    async def arequest(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict | None = None,
+        json: Any = None,
+        data: Any = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Async counterpart of request(), with the same retry and error handling.
+
+        Like request(), a plain GET awaits an identical one already in
+        flight instead of sending its own. The shared request runs in its
+        own task, so cancelling one caller never cancels the others.
+        """
+        if method != "GET" or json is not None or data is not None or kwargs:
+            return await self._asend(method, endpoint, params, json, data, kwargs)
+        loop = asyncio.get_running_loop()
+        key = (loop, f"{self.base_url}{endpoint}?{urlencode(sorted((params or {}).items()))}")
+        flight = self._ainflight.get(key)
+        if flight is None:
+            flight = self._ainflight[key] = asyncio.ensure_future(self._asend(method, endpoint, params, None, None, {}))
+            flight.add_done_callback(lambda done: self._aland(key, done))
+        return await asyncio.shield(flight)
+
+    def _aland(self, key: tuple[asyncio.AbstractEventLoop, str], flight: asyncio.Future[httpx.Response]) -> None:
+        if self._ainflight.get(key) is flight:
+            del self._ainflight[key]
+        if not flight.cancelled():
+            flight.exception()  # mark retrieved when every waiter was cancelled
+
+    async def _asend(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None,
+        json: Any,
+        data: Any,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        session = self._async_session()
+        url = f"{self.base_url}{endpoint}"
+        body = _encode_body(json) if data is None else None
+        if body is not None:
+            json = None
+            kwargs["content"] = body
+        for attempt in range(MAX_RETRIES):
+            if self._bucket is not None and (wait := self._bucket.reserve()):
+                await asyncio.sleep(wait)
+            resp = await session.request(method, url, params=params, json=json, data=data, **kwargs)
+            if self._bucket is not None:
+                self._bucket.record(resp.status_code)
+            if resp.status_code < 400:
+                if orjson is not None and isinstance(resp.content, bytes):
+                    resp.json = _orjson_decoder(resp)  # type: ignore[method-assign]
+                self._on_success(method)
+                return resp
+            await asyncio.sleep(self._handle_error(method, endpoint, resp, attempt))
+
+        # Should not be reached, but satisfies type checkers
+        raise TickTickAPIError(0, error_message="Unexpected exit from retry loop")
+
+    async def aget(self, endpoint: str, **kwargs: Any) -> httpx.Response:
+        return await self.arequest("GET", endpoint, **kwargs)
+
+    async def apost(self, endpoint: str, **kwargs: Any) -> httpx.Response:
+        return await self.arequest("POST", endpoint, **kwargs)
+
+    async def aput(self, endpoint: str, **kwargs: Any) -> httpx.Response:
+        return await self.arequest("PUT", endpoint, **kwargs)
+
+    async def adelete(self, endpoint: str, **kwargs: Any) -> httpx.Response:
+        return await self.arequest("DELETE", endpoint, **kwargs)
+
+    @staticmethod
+    async def gather(*calls: Awaitable[Any]) -> list[Any]:
+        """Run independent async calls concurrently and return their results in order."""
+        return list(await asyncio.gather(*calls))
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
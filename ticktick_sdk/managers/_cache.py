@@ -0,0 +1,58 @@
+"""Short-lived caching of the listings managers read over and over."""
+
+from __future__ import annotations
+
+import time
+
+
+class ListingCache:
+    """Raw listing dicts kept for ``ttl`` seconds, with lookup indexes built on demand.
+
+    Projects, groups, tags, filters and habits change rarely, but a script
+    tends to read them many times (every get() is a lookup in the listing),
+    so managers keep the last listing rather than fetching it per call.
+    Writes made through the owning manager clear it; after changing the
+    data any other way, call that manager's invalidate().
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, list[dict]]] = {}
+        self._indexes: dict[str, dict[str, dict]] = {}
+
+    def get(self, key: str) -> list[dict] | None:
+        """The stored listing for ``key``, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def put(self, listings: dict[str, list[dict]]) -> None:
+        """Store listings by key, all expiring ``ttl`` seconds from now."""
+        expires_at = time.monotonic() + self.ttl
+        for key, items in listings.items():
+            self._entries[key] = (expires_at, items)
+            self._indexes.pop(key, None)
+
+    def replace(self, key: str, items: list[dict]) -> bool:
+        """Swap in a new listing for ``key``, keeping its expiry.
+
+        Returns False, storing nothing, when no fresh listing is held.
+        """
+        if self.get(key) is None:
+            return False
+        self._entries[key] = (self._entries[key][0], items)
+        self._indexes.pop(key, None)
+        return True
+
+    def index(self, key: str, items: list[dict], field: str) -> dict[str, dict]:
+        """``items`` (the listing stored under ``key``) keyed by ``field``, built once per listing."""
+        found = self._indexes.get(key)
+        if found is None:
+            found = self._indexes[key] = {i.get(field, ""): i for i in items}
+        return found
+
+    def clear(self) -> None:
+        """Drop every stored listing."""
+        self._entries.clear()
+        self._indexes.clear()
@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+try:
+    import ijson
+except ImportError:  # optional, see the "stream" extra
+    ijson = None
+
 if TYPE_CHECKING:
     from ticktick_sdk.client import TickTickClient
 
+# Seconds a full sync is shared between managers through snapshot()
+SNAPSHOT_TTL = 5.0
+
 
 class BatchManager:
     """Batch sync: the primary mechanism TickTick uses to sync data.
 
     The batch/check endpoint returns all user data (tasks, projects, tags,
     filters, etc.) that has changed since the last checkpoint.
+
+    The latest full sync (checkpoint=0) is kept for SNAPSHOT_TTL seconds
+    and handed out by snapshot(), so the project, group and tag listings
+    can all be filled from one request.
     """
 
     def __init__(self, client: TickTickClient):
         self._c = client
         self._checkpoint: int = 0
+        self._snapshot: tuple[float, dict] | None = None
 
     def check(self, checkpoint: int | None = None) -> dict:
         """Fetch all data since the given checkpoint.
@@ -37,15 +52,101 @@ class BatchManager:
                 - syncTaskOrderBean: Task ordering data
                 - inboxId: Inbox project ID
                 - remindChanges: Reminder changes
+
+            A full sync (checkpoint=0) also becomes the snapshot(). The
+            returned dict is a copy, but the lists in it are shared with
+            the snapshot for SNAPSHOT_TTL seconds, so copy them before
+            changing them in place.
         """
         cp = checkpoint if checkpoint is not None else self._checkpoint
-        resp = self._c.get(f"/api/v3/batch/check/{cp}")
-        data = resp.json()
+        # Revalidated with If-None-Match, so an unchanged sync is answered
+        # with a 304 instead of the whole dataset again.
+        resp = self._c.get(f"/api/v3/batch/check/{cp}", cacheable=True)
+        return self._absorb(resp.json(), cp)
+
+    def check_partial(self, keys: Iterable[str], checkpoint: int | None = None) -> dict:
+        """Fetch only the given top-level keys of a sync response.
+
+        A full sync (checkpoint=0) is answered from snapshot() while that
+        is fresh. Otherwise, with ijson installed (the "stream" extra), the
+        response is parsed as it streams in and values under other keys are
+        never materialised, which keeps memory flat on large accounts. Such
+        a projected read does not move the stored checkpoint. Without ijson
+        this is check() with the result narrowed to ``keys``.
+
+        Args:
+            keys: Top-level keys to keep, e.g. {"filters"}. checkPoint and
+                  inboxId are always included.
+            checkpoint: As for check().
+        """
+        wanted = {"checkPoint", "inboxId", *keys}
+        cp = checkpoint if checkpoint is not None else self._checkpoint
+        entry = self._snapshot
+        if cp == 0 and entry is not None and entry[0] > time.monotonic():
+            return {k: entry[1][k] for k in wanted if k in entry[1]}
+        if ijson is None:
+            data = self.check(checkpoint)
+            return {k: data[k] for k in wanted if k in data}
+        resp = self._c.get(f"/api/v3/batch/check/{cp}", stream=True)
+        raw = getattr(resp, "raw", None)
+        if raw is None:  # httpx session: no file-like body to stream from
+            full = resp.json()
+            data = {k: full[k] for k in wanted if k in full}
+        else:
+            with resp:
+                raw.decode_content = True
+                data = {}
+                for k, v in ijson.kvitems(raw, "", use_float=True):
+                    if k in wanted:
+                        data[k] = v
+        self._note_inbox(data)
+        return data
+
+    async def acheck(self, checkpoint: int | None = None) -> dict:
+        """Async counterpart of check()."""
+        cp = checkpoint if checkpoint is not None else self._checkpoint
+        resp = await self._c.aget(f"/api/v3/batch/check/{cp}")
+        return self._absorb(resp.json(), cp)
+
+    def snapshot(self) -> dict:
+        """Return the latest full sync, fetching one if it has expired.
+
+        Like check(), this hands out a shallow copy whose lists are shared
+        with other callers, so treat them as read-only.
+        """
+        entry = self._snapshot
+        if entry is not None and entry[0] > time.monotonic():
+            return dict(entry[1])
+        return self.check(0)
+
+    async def asnapshot(self) -> dict:
+        """Async counterpart of snapshot()."""
+        entry = self._snapshot
+        if entry is not None and entry[0] > time.monotonic():
+            return dict(entry[1])
+        return await self.acheck(0)
+
+    def invalidate(self) -> None:
+        """Drop the shared full-sync snapshot."""
+        self._snapshot = None
+
+    def _absorb(self, data: dict, checkpoint: int | None = None) -> dict:
+        """Record the checkpoint and inbox ID carried by a sync response.
+
+        Complete responses to a full sync also become the new snapshot;
+        callers then get a shallow copy so the stored dict stays private.
+        """
+        if checkpoint == 0:
+            self._snapshot = (time.monotonic() + SNAPSHOT_TTL, data)
+            data = dict(data)
         new_cp = data.get("checkPoint", self._checkpoint)
         self._checkpoint = new_cp
+        self._note_inbox(data)
+        return data
+
+    def _note_inbox(self, data: dict) -> None:
         if "inboxId" in data and data["inboxId"]:
             self._c.inbox_id = data["inboxId"]
-        return data
 
     def full_sync(self) -> dict:
         """Perform a full sync from scratch (checkpoint=0)."""
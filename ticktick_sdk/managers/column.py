@@ -45,6 +45,7 @@ class ColumnManager:
         name: str,
         *,
         sort_order: int = 0,
+        verify: bool = False,
     ) -> Column:
         """Create a new column/section in a project.
 
@@ -52,35 +53,41 @@ class ColumnManager:
             project_id: The project to add the column to.
             name: Column display name.
             sort_order: Sort position.
+            verify: Re-fetch the project's columns and return the server's
+                copy, even when the API confirmed the write.
         """
-        column_id = os.urandom(12).hex()
-        payload = {
-            "id": column_id,
-            "projectId": project_id,
-            "name": name,
-            "sortOrder": sort_order,
-        }
-        self._c.post("/api/v2/column", json=payload)
-        # The endpoint returns {"id2etag": ..., "id2error": ...} rather than
-        # the column object.  Fetch columns for the project and return ours.
-        for col in self.get_by_project(project_id):
-            if col.id == column_id:
-                return col
-        # Fallback: construct locally if the API didn't persist it.
-        return Column(id=column_id, project_id=project_id, name=name, sort_order=sort_order)
+        column = Column(id=os.urandom(12).hex(), project_id=project_id, name=name, sort_order=sort_order)
+        return self._save(column, verify)
 
     # ── Update ────────────────────────────────────────────────────────
 
-    def update(self, column: Column) -> Column:
+    def update(self, column: Column, *, verify: bool = False) -> Column:
         """Update a column.
 
         Uses the same POST endpoint as create — the API identifies
         existing columns by ``id`` and applies the update.
+
+        Args:
+            column: The modified column.
+            verify: Re-fetch the project's columns and return the server's copy.
         """
-        self._c.post("/api/v2/column", json=column.to_dict())
-        for c in self.get_by_project(column.project_id):
-            if c.id == column.id:
-                return c
+        return self._save(column, verify)
+
+    def _save(self, column: Column, verify: bool) -> Column:
+        data = self._c.post("/api/v2/column", json=column.to_dict()).json()
+        # The endpoint returns {"id2etag": ..., "id2error": ...} rather than
+        # the column object. A clean echo of our ID means the column is
+        # stored as sent, so only look it up again when that is in doubt.
+        etag = None
+        if isinstance(data, dict) and not data.get("id2error"):
+            etag = (data.get("id2etag") or {}).get(column.id)
+        if etag and not verify:
+            column.etag = etag
+            return column
+        for col in self.get_by_project(column.project_id):
+            if col.id == column.id:
+                return col
+        # Fallback: return the local copy if the API didn't list it.
         return column
 
     def rename(self, column_id: str, project_id: str, new_name: str) -> Column:
@@ -3,36 +3,65 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+import logging
+from typing import TYPE_CHECKING, Any
 
+from ticktick_sdk.exceptions import TickTickAPIError
+from ticktick_sdk.managers._cache import ListingCache
 from ticktick_sdk.models import Filter
 
 if TYPE_CHECKING:
     from ticktick_sdk.client import TickTickClient
 
+logger = logging.getLogger(__name__)
+
+# Seconds the filter listing is reused before another full sync
+CACHE_TTL = 5.0
+
 
 class FilterManager:
-    """Manage saved filters (smart lists) with rule-based criteria."""
+    """Manage saved filters (smart lists) with rule-based criteria.
+
+    The filter listing is held in a ListingCache for CACHE_TTL seconds.
+    """
 
     def __init__(self, client: TickTickClient):
         self._c = client
+        self._cache = ListingCache(CACHE_TTL)
 
     # ── Read ──────────────────────────────────────────────────────────
 
+    def _store(self, data: dict) -> list[dict]:
+        filters = data.get("filters") or []
+        self._cache.put({"filters": filters})
+        return filters
+
+    def _listing(self) -> list[dict]:
+        raw = self._cache.get("filters")
+        return raw if raw is not None else self._store(self._c.batch.check_partial({"filters"}, 0))
+
+    def invalidate(self) -> None:
+        """Drop the cached filter listing."""
+        self._cache.clear()
+
     def get_all(self) -> list[Filter]:
         """Get all saved filters via full sync (checkpoint=0).
 
         Delta sync may omit unchanged filters, so a full sync is used.
         """
-        data = self._c.batch.check(0)
-        return [Filter.from_dict(f) for f in data.get("filters") or []]
+        return [Filter.from_dict(f) for f in self._listing()]
+
+    async def aget_all(self) -> list[Filter]:
+        """Async counterpart of get_all()."""
+        raw = self._cache.get("filters")
+        if raw is None:
+            raw = self._store(await self._c.batch.acheck(0))
+        return [Filter.from_dict(f) for f in raw]
 
     def get(self, filter_id: str) -> Filter | None:
         """Get a filter by ID."""
-        for f in self.get_all():
-            if f.id == filter_id:
-                return f
-        return None
+        found = self._cache.index("filters", self._listing(), "id").get(filter_id)
+        return Filter.from_dict(found) if found is not None else None
 
     # ── Create ────────────────────────────────────────────────────────
 
@@ -44,6 +73,7 @@ class FilterManager:
         sort_type: str = "sortOrder",
         view_mode: str = "list",
         sort_order: int = 0,
+        refresh: bool = False,
     ) -> dict:
         """Create a saved filter (smart list).
 
@@ -53,44 +83,119 @@ class FilterManager:
             sort_type: Sort type for results ("sortOrder", "priority", "dueDate", etc).
             view_mode: "list", "kanban", or "timeline".
             sort_order: Sort position in sidebar.
+            refresh: Re-read the filter from a full sync to pick up
+                server-populated fields, instead of echoing the payload.
 
         Returns:
-            Raw API response dict.
+            Without ``refresh``, the sent payload plus the ``id`` the server
+            assigned (no server-populated fields); with it, the filter as
+            stored. The raw batch response if the API reported no new ID.
+
+        Raises:
+            TickTickAPIError: If the API rejected the filter.
         """
-        rule_str = json.dumps(rule) if isinstance(rule, dict) else rule
-        payload = {
-            "name": name,
-            "rule": rule_str,
-            "sortType": sort_type,
-            "sortOrder": sort_order,
-            "viewMode": view_mode,
-        }
-        resp = self._c.post("/api/v2/batch/filter", json={"add": [payload]})
-        batch_resp = resp.json()
-        # Batch returns {"id2etag": {"<id>": "<etag>"}, "id2error": {}}.
-        # Extract the created filter ID and fetch full object via sync.
-        id2etag = batch_resp.get("id2etag", {})
-        if id2etag:
-            filt_id = next(iter(id2etag))
-            data = self._c.batch.full_sync()
-            for f in data.get("filters") or []:
-                if f.get("id") == filt_id:
-                    return f
-            return {"id": filt_id, **payload}
-        return batch_resp
+        spec = {"name": name, "rule": rule, "sortType": sort_type, "sortOrder": sort_order, "viewMode": view_mode}
+        batch_resp, created, errors = self._add([spec], refresh)
+        if errors:
+            raise _rejected(next(iter(errors.values())), f"filter {name!r} not created")
+        return created[0] if created else batch_resp
+
+    def bulk_create(self, specs: list[dict], *, refresh: bool = False) -> list[dict]:
+        """Create several filters in one request.
+
+        The API answers only with the new IDs, so when more than one filter
+        is created they are read back with one full sync and matched to
+        ``specs`` by name and rule; the results are then stored filters.
+
+        Args:
+            specs: Filter dicts with API keys (``name``, ``rule``, and
+                optionally ``sortType``, ``sortOrder``, ``viewMode``).
+                ``rule`` may be a dict or a JSON string.
+            refresh: Re-read a single created filter too.
+
+        Returns:
+            The created filter dicts, in the order of ``specs``. Filters the
+            API rejected are left out and logged; call bulk() for the raw
+            ``id2error`` map.
+        """
+        _, created, errors = self._add(specs, refresh)
+        for key, err in errors.items():
+            logger.warning("Filter %s not created: %s", key, err)
+        return created
+
+    def _add(self, specs: list[dict], refresh: bool) -> tuple[dict, list[dict], dict]:
+        payloads = [
+            {
+                "sortType": "sortOrder",
+                "sortOrder": 0,
+                "viewMode": "list",
+                **spec,
+                "rule": json.dumps(spec["rule"]) if isinstance(spec["rule"], dict) else spec["rule"],
+            }
+            for spec in specs
+        ]
+        batch_resp = self.bulk(add=payloads)
+        # Batch returns {"id2etag": {"<id>": "<etag>"}, "id2error": {...}}
+        new_ids = list(batch_resp.get("id2etag") or {})
+        errors = batch_resp.get("id2error") or {}
+        if not new_ids:
+            return batch_resp, [], errors
+        if len(payloads) == 1 and len(new_ids) == 1:
+            echo = {"id": new_ids[0], **payloads[0]}
+            if refresh:
+                echo = next((f for f in self._listing() if f.get("id") == new_ids[0]), echo)
+            return batch_resp, [echo], errors
+        # IDs can't be told apart from the reply alone, so match the stored
+        # copies back to their payloads
+        synced = {f.get("id"): f for f in self._listing()}
+        stored: dict[tuple, list[dict]] = {}
+        for filt_id in new_ids:
+            if filt_id in synced:
+                stored.setdefault(_identity(synced[filt_id]), []).append(synced[filt_id])
+        created = [stored[k].pop(0) for p in payloads if stored.get(k := _identity(p))]
+        return batch_resp, created, errors
 
     # ── Update ────────────────────────────────────────────────────────
 
     def update(self, filter_obj: Filter) -> dict:
         """Update a filter."""
-        payload = filter_obj.to_dict()
-        return self._c.post("/api/v2/batch/filter", json={"update": [payload]}).json()
+        return self.bulk(update=[filter_obj])
 
     # ── Delete ────────────────────────────────────────────────────────
 
     def delete(self, filter_id: str) -> None:
         """Delete a saved filter."""
-        self._c.post("/api/v2/batch/filter", json={"delete": [filter_id]})
+        self.bulk(delete=[filter_id])
+
+    # ── Batch ─────────────────────────────────────────────────────────
+
+    def bulk(
+        self,
+        *,
+        add: list[dict] | None = None,
+        update: list[Filter | dict] | None = None,
+        delete: list[str] | None = None,
+    ) -> dict:
+        """Apply adds, updates and deletes in a single batch request.
+
+        Args:
+            add: Filter payload dicts to create (``rule`` as a JSON string).
+            update: Filters to update, as Filter objects or API dicts.
+            delete: IDs of filters to delete.
+
+        Returns:
+            Raw API response dict.
+        """
+        body: dict[str, list] = {}
+        if add:
+            body["add"] = add
+        if update:
+            body["update"] = [f.to_dict() if isinstance(f, Filter) else f for f in update]
+        if delete:
+            body["delete"] = delete
+        resp = self._c.post("/api/v2/batch/filter", json=body)
+        self.invalidate()
+        return resp.json()
 
     # ── Rule helpers ──────────────────────────────────────────────────
 
@@ -169,3 +274,20 @@ class FilterManager:
         )
 
         return {"type": 0, "and": conditions, "version": 3}
+
+
+def _identity(filt: dict) -> tuple:
+    """(name, rule) of a filter dict, with the rule JSON normalised for comparison."""
+    rule = filt.get("rule") or ""
+    try:
+        rule = json.dumps(json.loads(rule), sort_keys=True)
+    except (TypeError, ValueError):
+        pass
+    return filt.get("name", ""), rule
+
+
+def _rejected(err: Any, message: str) -> TickTickAPIError:
+    """TickTickAPIError for an ``id2error`` entry, which may be a code or an error object."""
+    if isinstance(err, dict):
+        return TickTickAPIError(200, err.get("errorCode", ""), err.get("errorMessage") or message)
+    return TickTickAPIError(200, str(err), message)
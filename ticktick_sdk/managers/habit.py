@@ -5,39 +5,74 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING, Any
 
+from ticktick_sdk.managers._cache import ListingCache
 from ticktick_sdk.models import Habit, HabitCheckin
 
 if TYPE_CHECKING:
     from ticktick_sdk.client import TickTickClient
 
+# Seconds the habit listing is reused, so get()/get_active() bursts share one fetch
+CACHE_TTL = 5.0
+
 
 class HabitManager:
-    """Manage habits, check-ins, sections, and archival."""
+    """Manage habits, check-ins, sections, and archival.
+
+    The habit listing is held in a ListingCache for CACHE_TTL seconds.
+    """
 
     def __init__(self, client: TickTickClient):
         self._c = client
+        self._cache = ListingCache(CACHE_TTL)
 
     # ── Read ──────────────────────────────────────────────────────────
 
+    def _store(self, habits: list[dict]) -> list[dict]:
+        self._cache.put({"habits": habits})
+        return habits
+
+    def _listing(self) -> list[dict]:
+        raw = self._cache.get("habits")
+        return raw if raw is not None else self._store(self._c.get("/api/v2/habits").json())
+
+    def invalidate(self) -> None:
+        """Drop the cached habit listing."""
+        self._cache.clear()
+
     def get_all(self) -> list[Habit]:
         """Get all habits (active and archived)."""
-        resp = self._c.get("/api/v2/habits")
-        return [Habit.from_dict(h) for h in resp.json()]
+        return Habit.from_dicts(self._listing())
+
+    async def aget_all(self) -> list[Habit]:
+        """Async counterpart of get_all()."""
+        raw = self._cache.get("habits")
+        if raw is None:
+            raw = self._store((await self._c.aget("/api/v2/habits")).json())
+        return Habit.from_dicts(raw)
 
     def get_active(self) -> list[Habit]:
         """Get only active (non-archived) habits."""
-        return [h for h in self.get_all() if h.status == 0]
+        return Habit.from_dicts(h for h in self._listing() if h.get("status", 0) == 0)
 
     def get_archived(self) -> list[Habit]:
         """Get only archived habits."""
-        return [h for h in self.get_all() if h.status == 1]
+        return Habit.from_dicts(h for h in self._listing() if h.get("status", 0) == 1)
+
+    def partitioned(self) -> tuple[list[Habit], list[Habit]]:
+        """Get ``(active, archived)`` habits from a single listing."""
+        active: list[Habit] = []
+        archived: list[Habit] = []
+        for h in self.get_all():
+            if h.status == 0:
+                active.append(h)
+            elif h.status == 1:
+                archived.append(h)
+        return active, archived
 
     def get(self, habit_id: str) -> Habit | None:
         """Get a habit by ID."""
-        for h in self.get_all():
-            if h.id == habit_id:
-                return h
-        return None
+        found = self._cache.index("habits", self._listing(), "id").get(habit_id)
+        return Habit.from_dict(found) if found is not None else None
 
     def get_checkins(
         self,
@@ -71,7 +106,7 @@ class HabitManager:
 
     def get_preferences(self) -> dict:
         """Get habit preferences (calendar/today visibility, etc)."""
-        return self._c.get("/api/v2/user/preferences/habit", params={"platform": "web"}).json()
+        return self._c.get("/api/v2/user/preferences/habit", params={"platform": "web"}, cacheable=True).json()
 
     # ── Create ────────────────────────────────────────────────────────
 
@@ -127,14 +162,29 @@ class HabitManager:
             "status": 0,
         }
         resp = self._c.post("/api/v2/habits", json=payload)
+        self.invalidate()
         return Habit.from_dict(resp.json())
 
     # ── Update ────────────────────────────────────────────────────────
 
     def update(self, habit: Habit) -> Habit:
-        """Update a habit."""
+        """Update a habit.
+
+        The returned habit replaces its entry in the cached listing, so a run
+        of archive()/unarchive() calls shares a single listing fetch.
+        """
         resp = self._c.put(f"/api/v2/habits/{habit.id}", json=habit.to_dict())
-        return Habit.from_dict(resp.json())
+        raw = resp.json()
+        self._replace(raw)
+        return Habit.from_dict(raw)
+
+    def _replace(self, raw: dict) -> None:
+        """Swap an updated habit into the cached listing, keeping its expiry."""
+        habits = self._cache.get("habits")
+        if habits is None or not raw.get("id"):
+            self.invalidate()
+            return
+        self._cache.replace("habits", [raw if h.get("id") == raw["id"] else h for h in habits])
 
     def archive(self, habit_id: str) -> Habit:
         """Archive a habit."""
@@ -157,6 +207,7 @@ class HabitManager:
     def delete(self, habit_id: str) -> None:
         """Delete a habit permanently."""
         self._c.delete(f"/api/v2/habits/{habit_id}")
+        self.invalidate()
 
     # ── Check-ins ─────────────────────────────────────────────────────
 
@@ -185,6 +236,7 @@ class HabitManager:
             "status": status,
         }
         resp = self._c.post("/api/v2/habitCheckins", json=payload)
+        self.invalidate()
         return HabitCheckin.from_dict(resp.json())
 
     def batch_checkin(self, checkins: list[dict[str, Any]]) -> list[dict]:
@@ -193,4 +245,6 @@ class HabitManager:
         Args:
             checkins: List of check-in dicts with habitId, checkinStamp, value, status.
         """
-        return self._c.post("/api/v2/habits/batch", json={"checkins": checkins}).json()
+        resp = self._c.post("/api/v2/habits/batch", json={"checkins": checkins})
+        self.invalidate()
+        return resp.json()
@@ -2,43 +2,97 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
+from ticktick_sdk.managers._cache import ListingCache
 from ticktick_sdk.models import Project, ProjectGroup
 
 if TYPE_CHECKING:
     from ticktick_sdk.client import TickTickClient
 
+# Seconds a full-sync project/group listing is reused before re-fetching
+CACHE_TTL = 300.0
+# Threads delete_many() sends its DELETEs from
+DELETE_MANY_WORKERS = 8
+# groupId that takes a project out of its folder; a missing groupId leaves it unchanged
+UNGROUPED = "NONE"
+
 
 class ProjectManager:
-    """Manage projects (lists), project groups (folders), and archive."""
+    """Manage projects (lists), project groups (folders), and archive.
+
+    Project and group listings are held in a ListingCache for CACHE_TTL
+    seconds, long because they change least of all.
+    """
 
     def __init__(self, client: TickTickClient):
         self._c = client
+        self._cache = ListingCache(CACHE_TTL)
 
     # ── Read ──────────────────────────────────────────────────────────
 
+    def _listing(self, key: str) -> list[dict]:
+        """Raw ``projectProfiles``/``projectGroups`` dicts from a cached full sync."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        return self._store(self._c.batch.snapshot(), key)
+
+    async def _alisting(self, key: str) -> list[dict]:
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        return self._store(await self._c.batch.asnapshot(), key)
+
+    def _store(self, data: dict, key: str) -> list[dict]:
+        listings = {k: data.get(k) or [] for k in ("projectProfiles", "projectGroups")}
+        self._cache.put(listings)
+        return listings[key]
+
+    def invalidate(self) -> None:
+        """Drop cached project and group listings."""
+        self._cache.clear()
+        self._c.batch.invalidate()
+
     def get_all(self) -> list[Project]:
         """Get all projects via full sync (checkpoint=0).
 
         Delta sync may omit unchanged projects, so a full sync is used
         to guarantee the complete list is returned.
         """
-        data = self._c.batch.check(0)
-        return [Project.from_dict(p) for p in data.get("projectProfiles") or []]
+        return Project.from_dicts(self._listing("projectProfiles"))
+
+    async def aget_all(self) -> list[Project]:
+        """Async counterpart of get_all()."""
+        return Project.from_dicts(await self._alisting("projectProfiles"))
+
+    def _index(self) -> dict[str, dict]:
+        return self._cache.index("projectProfiles", self._listing("projectProfiles"), "id")
 
     def get(self, project_id: str) -> Project:
         """Get a single project by ID."""
-        projects = self.get_all()
-        for p in projects:
-            if p.id == project_id:
-                return p
-        raise ValueError(f"Project {project_id} not found")
+        found = self._index().get(project_id)
+        if found is None:
+            raise ValueError(f"Project {project_id} not found")
+        return Project.from_dict(found)
+
+    def get_many(self, project_ids: Iterable[str]) -> dict[str, Project]:
+        """Get several projects by ID from one listing.
+
+        Returns a dict keyed by ID; IDs that don't exist are left out.
+        """
+        index = self._index()
+        return {pid: Project.from_dict(index[pid]) for pid in project_ids if pid in index}
 
     def get_groups(self) -> list[ProjectGroup]:
         """Get all project groups (folders)."""
-        data = self._c.batch.check(0)
-        return [ProjectGroup.from_dict(g) for g in data.get("projectGroups") or []]
+        return [ProjectGroup.from_dict(g) for g in self._listing("projectGroups")]
+
+    async def aget_groups(self) -> list[ProjectGroup]:
+        """Async counterpart of get_groups()."""
+        return [ProjectGroup.from_dict(g) for g in await self._alisting("projectGroups")]
 
     # ── Create ────────────────────────────────────────────────────────
 
@@ -73,17 +127,24 @@ class ProjectManager:
         if group_id:
             payload["groupId"] = group_id
         resp = self._c.post("/api/v2/project", json=payload)
+        self.invalidate()
         return Project.from_dict(resp.json())
 
     # ── Update ────────────────────────────────────────────────────────
 
-    def update(self, project: Project) -> Project:
-        """Update a project. Pass a modified Project object."""
+    def update(self, project: Project, *, verify: bool = False) -> Project:
+        """Update a project. Pass a modified Project object.
+
+        Args:
+            project: The project to save.
+            verify: When the API answers with an empty body, re-fetch the
+                project (a full sync) instead of returning ``project``.
+        """
         resp = self._c.put(f"/api/v2/project/{project.id}", json=project.to_dict())
-        # The API may return an empty body on success; re-fetch in that case.
+        self.invalidate()
         if resp.text.strip():
             return Project.from_dict(resp.json())
-        return self.get(project.id)
+        return self.get(project.id) if verify else project
 
     def rename(self, project_id: str, new_name: str) -> Project:
         """Rename a project."""
@@ -91,11 +152,51 @@ class ProjectManager:
         project.name = new_name
         return self.update(project)
 
+    def batch_update(self, projects: list[Project]) -> dict:
+        """Update several projects in one request.
+
+        Returns:
+            Raw API response dict (``id2etag`` / ``id2error``).
+        """
+        resp = self._c.post("/api/v2/batch/project", json={"update": [p.to_dict() for p in projects]})
+        self.invalidate()
+        return resp.json()
+
+    def rename_many(self, names: dict[str, str]) -> dict:
+        """Rename several projects in one request, given ``{project_id: new_name}``."""
+        projects = [self.get(pid) for pid in names]
+        for p in projects:
+            p.name = names[p.id]
+        return self.batch_update(projects)
+
+    def _set_many(self, project_ids: list[str], field: str, value: Any) -> dict:
+        projects = [self.get(pid) for pid in project_ids]
+        for p in projects:
+            setattr(p, field, value)
+        return self.batch_update(projects)
+
     # ── Delete / Archive ──────────────────────────────────────────────
 
     def delete(self, project_id: str) -> None:
         """Delete a project and all its tasks."""
         self._c.delete(f"/api/v2/project/{project_id}")
+        self.invalidate()
+
+    def delete_many(self, project_ids: Iterable[str]) -> None:
+        """Delete several projects, sending the deletes concurrently.
+
+        The API has no batch delete for projects, so the DELETEs run on a
+        short-lived pool of up to DELETE_MANY_WORKERS threads. The first
+        failure is re-raised once every delete has finished.
+        """
+        ids = list(project_ids)
+        # Not client.submit(): this call may itself be running on one of its
+        # workers, and waiting there for more workers can deadlock the pool
+        with ThreadPoolExecutor(min(len(ids), DELETE_MANY_WORKERS) or 1) as pool:
+            futures = [pool.submit(self._c.delete, f"/api/v2/project/{pid}") for pid in ids]
+        self.invalidate()
+        for future in futures:
+            future.result()
 
     def archive(self, project_id: str) -> None:
         """Archive a project (soft close)."""
@@ -109,6 +210,14 @@ class ProjectManager:
         project.closed = False
         self.update(project)
 
+    def archive_many(self, project_ids: list[str]) -> dict:
+        """Archive several projects in one request."""
+        return self._set_many(project_ids, "closed", True)
+
+    def unarchive_many(self, project_ids: list[str]) -> dict:
+        """Unarchive several projects in one request."""
+        return self._set_many(project_ids, "closed", False)
+
     # ── Project Groups (Folders) ──────────────────────────────────────
 
     def create_group(self, name: str, *, sort_order: int = 0) -> ProjectGroup:
@@ -120,29 +229,36 @@ class ProjectManager:
                 "sortOrder": sort_order,
             },
         )
+        self.invalidate()
         return ProjectGroup.from_dict(resp.json())
 
     def update_group(self, group: ProjectGroup) -> ProjectGroup:
         """Update a project group."""
         resp = self._c.put(f"/api/v2/projectGroup/{group.id}", json=group.to_dict())
+        self.invalidate()
         return ProjectGroup.from_dict(resp.json())
 
     def delete_group(self, group_id: str) -> None:
         """Delete a project group."""
         self._c.delete(f"/api/v2/projectGroup/{group_id}")
+        self.invalidate()
 
     def move_to_group(self, project_id: str, group_id: str | None) -> Project:
         """Move a project into a group, or out of a group (group_id=None)."""
         project = self.get(project_id)
-        project.group_id = group_id
+        project.group_id = group_id or UNGROUPED
         return self.update(project)
 
+    def move_many_to_group(self, project_ids: list[str], group_id: str | None) -> dict:
+        """Move several projects into a group (or out of one, group_id=None) in one request."""
+        return self._set_many(project_ids, "group_id", group_id or UNGROUPED)
+
     # ── Templates ─────────────────────────────────────────────────────
 
     def get_templates(self) -> list[dict]:
         """Get available project templates."""
-        return self._c.get("/api/v2/templates").json()
+        return self._c.get("/api/v2/templates", cacheable=True).json()
 
     def get_project_templates(self, timestamp: int = 0) -> list[dict]:
         """Get user's project templates."""
-        return self._c.get("/api/v2/projectTemplates/all", params={"timestamp": timestamp}).json()
+        return self._c.get("/api/v2/projectTemplates/all", params={"timestamp": timestamp}, cacheable=True).json()
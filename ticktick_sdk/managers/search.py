@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ticktick_sdk.managers.task import _open_tasks
 from ticktick_sdk.models import Task
 
 if TYPE_CHECKING:
@@ -31,7 +32,7 @@ class SearchManager:
         """Search for tasks by keywords. Returns Task objects."""
         data = self.search(keywords)
         tasks = data if isinstance(data, list) else data.get("tasks", [])
-        return [Task.from_dict(t) for t in tasks]
+        return Task.from_dicts(tasks)
 
     def filter_tasks(
         self,
@@ -44,7 +45,9 @@ class SearchManager:
     ) -> list[Task]:
         """Filter tasks from the local batch data using criteria.
 
-        This is a client-side filter over the batch sync data.
+        This is a client-side filter over the batch sync data. Criteria
+        are checked on the raw task dicts, so only matching tasks are
+        turned into Task objects.
 
         Args:
             project_id: Filter to a specific project.
@@ -53,17 +56,42 @@ class SearchManager:
             status: Filter by status (0=open, 2=completed).
             has_due_date: Filter tasks with/without due dates.
         """
-        tasks = self._c.task.get_all()
-        if project_id is not None:
-            tasks = [t for t in tasks if t.project_id == project_id]
-        if tag is not None:
-            tasks = [t for t in tasks if tag in t.tags]
-        if priority is not None:
-            tasks = [t for t in tasks if t.priority == priority]
-        if status is not None:
-            tasks = [t for t in tasks if t.status == status]
-        if has_due_date is True:
-            tasks = [t for t in tasks if t.due_date is not None]
-        elif has_due_date is False:
-            tasks = [t for t in tasks if t.due_date is None]
-        return tasks
+        return _narrow(_open_tasks(self._c.batch.check(0)), project_id, tag, priority, status, has_due_date)
+
+    async def afilter_tasks(
+        self,
+        *,
+        project_id: str | None = None,
+        tag: str | None = None,
+        priority: int | None = None,
+        status: int | None = None,
+        has_due_date: bool | None = None,
+    ) -> list[Task]:
+        """Async counterpart of filter_tasks()."""
+        return _narrow(_open_tasks(await self._c.batch.acheck(0)), project_id, tag, priority, status, has_due_date)
+
+
+def _narrow(
+    raw: list[dict],
+    project_id: str | None,
+    tag: str | None,
+    priority: int | None,
+    status: int | None,
+    has_due_date: bool | None,
+) -> list[Task]:
+    """Apply filter_tasks() criteria to raw task dicts, parsing only the matches."""
+    if project_id is not None:
+        raw = [t for t in raw if t.get("projectId", "") == project_id]
+    if tag is not None:
+        raw = [t for t in raw if tag in (t.get("tags") or ())]
+    if priority is not None:
+        raw = [t for t in raw if t.get("priority", 0) == priority]
+    if status is not None:
+        raw = [t for t in raw if t.get("status", 0) == status]
+    tasks = Task.from_dicts(raw)
+    # Checked after parsing, since an unparseable dueDate counts as none
+    if has_due_date is True:
+        tasks = [t for t in tasks if t.due_date is not None]
+    elif has_due_date is False:
+        tasks = [t for t in tasks if t.due_date is None]
+    return tasks
@@ -2,46 +2,83 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
+from ticktick_sdk.managers._cache import ListingCache
 from ticktick_sdk.models import Tag, Task
 
 if TYPE_CHECKING:
     from ticktick_sdk.client import TickTickClient
 
+# Seconds the tag listing is reused before another full sync. Kept short
+# because creating a task with a new tag name adds that tag server-side.
+CACHE_TTL = 5.0
+
 
 class TagManager:
-    """Manage tags, sub-tags (hierarchical), and tag-based queries."""
+    """Manage tags, sub-tags (hierarchical), and tag-based queries.
+
+    The tag listing is held in a ListingCache for CACHE_TTL seconds.
+    """
 
     def __init__(self, client: TickTickClient):
         self._c = client
+        self._cache = ListingCache(CACHE_TTL)
 
     # ── Read ──────────────────────────────────────────────────────────
 
+    def _listing(self) -> list[dict]:
+        raw = self._cache.get("tags")
+        return raw if raw is not None else self._store(self._c.batch.snapshot())
+
+    def _store(self, data: dict) -> list[dict]:
+        tags = data.get("tags") or []
+        self._cache.put({"tags": tags})
+        return tags
+
+    def invalidate(self) -> None:
+        """Drop the cached tag listing."""
+        self._cache.clear()
+        self._c.batch.invalidate()
+
     def get_all(self) -> list[Tag]:
         """Get all tags via full sync (checkpoint=0).
 
         Delta sync may omit unchanged tags, so a full sync is used.
         """
-        data = self._c.batch.check(0)
-        return [Tag.from_dict(t) for t in data.get("tags") or []]
+        return [Tag.from_dict(t) for t in self._listing()]
+
+    async def aget_all(self) -> list[Tag]:
+        """Async counterpart of get_all()."""
+        raw = self._cache.get("tags")
+        if raw is None:
+            raw = self._store(await self._c.batch.asnapshot())
+        return [Tag.from_dict(t) for t in raw]
+
+    def _index(self) -> dict[str, dict]:
+        return self._cache.index("tags", self._listing(), "name")
 
     def get(self, tag_name: str) -> Tag | None:
         """Get a tag by name."""
-        tags = self.get_all()
-        for t in tags:
-            if t.name == tag_name:
-                return t
-        return None
+        found = self._index().get(tag_name)
+        return Tag.from_dict(found) if found is not None else None
+
+    def get_many(self, tag_names: Iterable[str]) -> dict[str, Tag]:
+        """Get several tags by name from one listing.
+
+        Returns a dict keyed by name; names that don't exist are left out.
+        """
+        index = self._index()
+        return {name: Tag.from_dict(index[name]) for name in tag_names if name in index}
 
     def get_children(self, parent_name: str) -> list[Tag]:
         """Get sub-tags of a parent tag.
 
         Tags are hierarchical via naming convention: "parent/child".
         """
-        tags = self.get_all()
-        return [t for t in tags if t.parent == parent_name]
+        return [Tag.from_dict(t) for t in self._listing() if t.get("name", "").rpartition("/")[0] == parent_name]
 
     def get_completed_tasks(
         self,
@@ -65,7 +102,7 @@ class TagManager:
                 "limit": limit,
             },
         )
-        return [Task.from_dict(t) for t in resp.json()]
+        return Task.from_dicts(resp.json())
 
     # ── Create ────────────────────────────────────────────────────────
 
@@ -100,9 +137,9 @@ class TagManager:
         if sort_type:
             payload["sortType"] = sort_type
         self._c.post("/api/v2/batch/tag", json={"add": [payload]})
-        # Batch endpoint returns id2etag, not the tag object; fetch via sync.
-        data = self._c.batch.full_sync()
-        for t in data.get("tags") or []:
+        # Batch endpoint returns id2etag, not the tag object; fetch via sync,
+        # which also refreshes the cached listing.
+        for t in self._store(self._c.batch.full_sync()):
             if t.get("name", "").lower() == name.lower():
                 return Tag.from_dict(t)
         return Tag(name=name, label=label or name, color=color, sort_order=sort_order)
@@ -111,17 +148,21 @@ class TagManager:
 
     def rename(self, old_name: str, new_name: str) -> dict:
         """Rename a tag across all tasks."""
-        return self._c.put(
+        resp = self._c.put(
             "/api/v2/tag/rename",
             json={
                 "name": old_name,
                 "newName": new_name,
             },
-        ).json()
+        )
+        self.invalidate()
+        return resp.json()
 
     def update(self, tag: Tag) -> dict:
         """Update tag properties (color, sort, etc)."""
-        return self._c.post("/api/v2/batch/tag", json={"update": [tag.to_dict()]}).json()
+        resp = self._c.post("/api/v2/batch/tag", json={"update": [tag.to_dict()]})
+        self.invalidate()
+        return resp.json()
 
     # ── Delete ────────────────────────────────────────────────────────
 
@@ -134,6 +175,7 @@ class TagManager:
             self._c.post("/api/v2/batch/tag", json={"delete": [tag_name]})
         else:
             self._c.delete(f"/api/v2/tag/{quote(tag_name, safe='')}")
+        self.invalidate()
 
     # ── Sub-tag helpers ───────────────────────────────────────────────
 
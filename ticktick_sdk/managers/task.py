@@ -3,20 +3,80 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
-from ticktick_sdk.models import Task, Subtask
+from ticktick_sdk.exceptions import TickTickAPIError
+from ticktick_sdk.models import Task, Subtask, _format_dt
 
 if TYPE_CHECKING:
     from ticktick_sdk.client import TickTickClient
 
+# update_batched() sends the queue as soon as this many updates are waiting
+BATCH_MAX_SIZE = 50
+
+# complete_many() reads one full sync instead of per-task GETs from this many tasks up
+COMPLETE_MANY_SYNC_MIN = 20
+# Threads complete_many() fetches smaller runs with
+COMPLETE_MANY_WORKERS = 8
+
+
+class _UpdateBatcher:
+    """Collect single-task updates and send them as one batch/task request.
+
+    Nothing runs in the background: the queue is sent on the caller's
+    thread when it fills up or when flush() is called.
+    """
+
+    def __init__(self, manager: TaskManager, max_size: int):
+        self._m = manager
+        self._max_size = max_size
+        self._pending: list[tuple[dict[str, Any], Future[dict]]] = []
+        self._lock = threading.Lock()
+
+    def submit(self, payload: dict[str, Any]) -> Future[dict]:
+        fut: Future[dict] = Future()
+        with self._lock:
+            self._pending.append((payload, fut))
+            full = len(self._pending) >= self._max_size
+        if full:
+            self.flush()
+        return fut
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        # Futures cancelled while queued are dropped from the batch
+        self._send([item for item in pending if item[1].set_running_or_notify_cancel()])
+
+    def _send(self, pending: list[tuple[dict[str, Any], Future[dict]]]) -> None:
+        if not pending:
+            return
+        try:
+            result = self._m.batch_update([payload for payload, _ in pending])
+        except Exception as exc:
+            for _, fut in pending:
+                fut.set_exception(exc)
+            raise
+        errors = result.get("id2error") or {}
+        for payload, fut in pending:
+            err = errors.get(payload.get("id"))
+            if err:
+                fut.set_exception(TickTickAPIError(200, str(err), f"task {payload.get('id')} not updated"))
+            else:
+                fut.set_result(result)
+
 
 class TaskManager:
     """Manage tasks, subtasks, completion, and trash."""
 
     def __init__(self, client: TickTickClient):
         self._c = client
+        self._batcher: _UpdateBatcher | None = None
+        self._batcher_lock = threading.Lock()
 
     # ── Read ──────────────────────────────────────────────────────────
 
@@ -30,16 +90,25 @@ class TaskManager:
         resp = self._c.get(f"/api/v2/task/{task_id}", params={"projectId": project_id})
         return Task.from_dict(resp.json())
 
+    def _sync_tasks(self) -> list[dict]:
+        """Raw open-task dicts from a full sync (checkpoint=0)."""
+        return _open_tasks(self._c.batch.check(0))
+
     def get_all(self) -> list[Task]:
         """Get all tasks via batch sync (returns open tasks from all projects)."""
-        data = self._c.batch.full_sync()
-        tasks_raw = data.get("syncTaskBean", {}).get("update", [])
-        return [Task.from_dict(t) for t in tasks_raw]
+        return Task.from_dicts(self._sync_tasks())
+
+    async def aget_all(self) -> list[Task]:
+        """Async counterpart of get_all()."""
+        return Task.from_dicts(_open_tasks(await self._c.batch.acheck(0)))
 
     def get_by_project(self, project_id: str) -> list[Task]:
-        """Get all open tasks in a project."""
-        all_tasks = self.get_all()
-        return [t for t in all_tasks if t.project_id == project_id]
+        """Get all open tasks in a project.
+
+        Filters the raw sync data first, so tasks from other projects are
+        never turned into Task objects.
+        """
+        return Task.from_dicts(t for t in self._sync_tasks() if t.get("projectId") == project_id)
 
     def get_completed(
         self,
@@ -57,17 +126,22 @@ class TaskManager:
             to_date: End date as "YYYY-MM-DD HH:MM:SS" (inclusive).
             limit: Maximum number of results.
         """
-        if project_id:
-            endpoint = f"/api/v2/project/{project_id}/completed/"
-        else:
-            endpoint = "/api/v2/project/all/completed/"
-        params: dict[str, Any] = {"limit": limit}
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
-        resp = self._c.get(endpoint, params=params)
-        return [Task.from_dict(t) for t in resp.json()]
+        endpoint, params = _completed_query(project_id, from_date, to_date, limit)
+        resp = self._c.get(endpoint, params=params, cacheable=True)
+        return Task.from_dicts(resp.json())
+
+    async def aget_completed(
+        self,
+        project_id: str | None = None,
+        *,
+        from_date: str = "",
+        to_date: str = "",
+        limit: int = 50,
+    ) -> list[Task]:
+        """Async counterpart of get_completed()."""
+        endpoint, params = _completed_query(project_id, from_date, to_date, limit)
+        resp = await self._c.aget(endpoint, params=params)
+        return Task.from_dicts(resp.json())
 
     def get_completed_in_all(
         self,
@@ -81,15 +155,15 @@ class TaskManager:
             params["from"] = from_date
         if to_date:
             params["to"] = to_date
-        resp = self._c.get("/api/v2/project/all/completedInAll/", params=params)
-        return [Task.from_dict(t) for t in resp.json()]
+        resp = self._c.get("/api/v2/project/all/completedInAll/", params=params, cacheable=True)
+        return Task.from_dicts(resp.json())
 
     def get_trash(self, limit: int = 50) -> list[Task]:
         """Get tasks in trash."""
         resp = self._c.get("/api/v2/project/all/trash/pagination", params={"limit": limit})
         data = resp.json()
         tasks = data if isinstance(data, list) else data.get("tasks", [])
-        return [Task.from_dict(t) for t in tasks]
+        return Task.from_dicts(tasks)
 
     # ── Create ────────────────────────────────────────────────────────
 
@@ -138,7 +212,8 @@ class TaskManager:
         Returns:
             The created Task object.
         """
-        task_id = os.urandom(12).hex()
+        ids = _new_ids(1 + len(items or ()))
+        task_id = ids[0]
         if project_id is None:
             project_id = self._c.inbox_id or "inbox"
 
@@ -160,9 +235,9 @@ class TaskManager:
         if time_zone:
             payload["timeZone"] = time_zone
         if start_date:
-            payload["startDate"] = start_date.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+            payload["startDate"] = _format_dt(start_date)
         if due_date:
-            payload["dueDate"] = due_date.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+            payload["dueDate"] = _format_dt(due_date)
         if repeat_flag:
             payload["repeatFlag"] = repeat_flag
         if parent_id:
@@ -171,10 +246,9 @@ class TaskManager:
             payload["columnId"] = column_id
         if items:
             for i, item in enumerate(items):
-                item_id = item.get("id", os.urandom(12).hex())
                 payload["items"].append(
                     {
-                        "id": item_id,
+                        "id": item.get("id") or ids[i + 1],
                         "title": item["title"],
                         "status": item.get("status", 0),
                         "sortOrder": item.get("sortOrder", i * 1099511627776),
@@ -201,6 +275,38 @@ class TaskManager:
         )
         return Task.from_dict(resp.json())
 
+    def update_batched(self, task: Task) -> Future[dict]:
+        """Queue an update to be sent together with other pending updates.
+
+        The queue goes out as one batch/task request once BATCH_MAX_SIZE
+        updates are waiting, on the call that fills it. Call flush_batched()
+        to send a partial queue; close() does so too. Updates still queued
+        when the program exits are never sent.
+
+        Returns:
+            A Future resolving to the batch response ({"id2etag", "id2error"})
+            once its batch is sent, or raising TickTickAPIError if the server
+            rejected this task.
+        """
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    self._batcher = _UpdateBatcher(self, BATCH_MAX_SIZE)
+        return self._batcher.submit(task.to_dict())
+
+    def flush_batched(self) -> None:
+        """Send every update queued by update_batched() now.
+
+        Raises the batch request's error, if any, after failing the
+        affected futures with it.
+        """
+        if self._batcher is not None:
+            self._batcher.flush()
+
+    def close(self) -> None:
+        """Send any updates still queued by update_batched()."""
+        self.flush_batched()
+
     def update_fields(self, task_id: str, project_id: str, **fields: Any) -> dict:
         """Partial update - fetch the task, merge fields, and save.
 
@@ -226,6 +332,36 @@ class TaskManager:
         task.status = 0
         return self.update(task)
 
+    def complete_many(self, tasks: list[tuple[str, str]]) -> dict:
+        """Mark several tasks as completed in one batch request.
+
+        Fewer than COMPLETE_MANY_SYNC_MIN tasks are fetched concurrently on
+        a short-lived pool of its own. Larger runs take open tasks from one
+        full sync instead; that response carries every open task in the
+        account, so it only pays off when many tasks are completed at once.
+        Any task not in the sync is fetched individually.
+
+        Args:
+            tasks: ``(task_id, project_id)`` pairs.
+
+        Returns:
+            Raw batch response dict (``id2etag`` / ``id2error``).
+        """
+        if len(tasks) < COMPLETE_MANY_SYNC_MIN:
+            # Not client.submit(): this call may itself be running on one of its
+            # workers, and waiting there for more workers can deadlock the pool
+            with ThreadPoolExecutor(min(len(tasks), COMPLETE_MANY_WORKERS) or 1) as pool:
+                fetched = list(pool.map(lambda pair: self.get(*pair), tasks))
+            return self.batch_update([{**t.to_dict(), "status": 2} for t in fetched])
+        open_tasks = {t.get("id"): t for t in self._sync_tasks()}
+        updates = []
+        for task_id, project_id in tasks:
+            raw = open_tasks.get(task_id)
+            if raw is None:
+                raw = self.get(task_id, project_id).to_dict()
+            updates.append({**raw, "status": 2})
+        return self.batch_update(updates)
+
     # ── Delete ────────────────────────────────────────────────────────
 
     def delete(self, task_id: str, project_id: str) -> None:
@@ -247,48 +383,88 @@ class TaskManager:
 
     # ── Subtask helpers ───────────────────────────────────────────────
 
-    def add_subtask(self, task_id: str, project_id: str, title: str, **kwargs: Any) -> Task:
-        """Add a subtask (checklist item) to a task.
+    def mutate_subtasks(
+        self,
+        task_id: str,
+        project_id: str,
+        *,
+        complete_ids: Iterable[str] = (),
+        remove_ids: Iterable[str] = (),
+        add_titles: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> Task:
+        """Apply several subtask edits with one fetch and one update.
+
+        Args:
+            task_id: Parent task ID.
+            project_id: Parent task's project ID.
+            complete_ids: Subtask IDs to mark completed.
+            remove_ids: Subtask IDs to remove.
+            add_titles: Titles of new subtasks, appended in order.
+            **kwargs: Extra Subtask fields applied to every added subtask.
 
         Returns the updated parent task.
         """
         task = self.get(task_id, project_id)
-        item_id = os.urandom(12).hex()
+        complete = set(complete_ids)
+        if complete:
+            now = datetime.now(timezone.utc)
+            for item in task.items:
+                if item.id in complete:
+                    item.status = 2
+                    item.completed_time = now
+        remove = set(remove_ids)
+        if remove:
+            task.items = [i for i in task.items if i.id not in remove]
+        titles = list(add_titles)
+        ids = _new_ids(len(titles))
         max_order = max((i.sort_order for i in task.items), default=-1099511627776)
-        new_item = Subtask(
-            id=item_id,
-            title=title,
-            sort_order=max_order + 1099511627776,
-            **kwargs,
-        )
-        task.items.append(new_item)
+        for n, title in enumerate(titles, 1):
+            task.items.append(
+                Subtask(
+                    id=ids[n - 1],
+                    title=title,
+                    sort_order=max_order + n * 1099511627776,
+                    **kwargs,
+                )
+            )
         return self.update(task)
 
+    def add_subtask(self, task_id: str, project_id: str, title: str, **kwargs: Any) -> Task:
+        """Add a subtask (checklist item) to a task.
+
+        Returns the updated parent task.
+        """
+        return self.mutate_subtasks(task_id, project_id, add_titles=(title,), **kwargs)
+
     def complete_subtask(self, task_id: str, project_id: str, subtask_id: str) -> Task:
         """Mark a subtask as completed."""
-        task = self.get(task_id, project_id)
-        for item in task.items:
-            if item.id == subtask_id:
-                item.status = 2
-                item.completed_time = datetime.now(timezone.utc)
-                break
-        return self.update(task)
+        return self.mutate_subtasks(task_id, project_id, complete_ids=(subtask_id,))
 
     def remove_subtask(self, task_id: str, project_id: str, subtask_id: str) -> Task:
         """Remove a subtask from a task."""
-        task = self.get(task_id, project_id)
-        task.items = [i for i in task.items if i.id != subtask_id]
-        return self.update(task)
+        return self.mutate_subtasks(task_id, project_id, remove_ids=(subtask_id,))
 
     # ── Batch operations ──────────────────────────────────────────────
 
     def batch_create(self, tasks: list[dict[str, Any]]) -> dict:
         """Create multiple tasks in one request.
 
+        The endpoint only answers with ``id2etag``, so a task dict without an
+        ``id`` is sent as a copy with a client-generated one; the given dicts
+        are left untouched. To map each spec to its created task without
+        re-fetching, set ids from generate_ids() before calling.
+
         Args:
             tasks: List of task dicts (same format as create() payload).
         """
-        return self._c.post("/api/v2/batch/task", json={"add": tasks}).json()
+        ids = iter(_new_ids(sum(1 for t in tasks if not t.get("id"))))
+        payload = [t if t.get("id") else {**t, "id": next(ids)} for t in tasks]
+        return self._c.post("/api/v2/batch/task", json={"add": payload}).json()
+
+    def generate_ids(self, n: int) -> list[str]:
+        """Return ``n`` new task/subtask IDs in the format the API expects."""
+        return _new_ids(n)
 
     def batch_update(self, tasks: list[dict[str, Any]]) -> dict:
         """Update multiple tasks in one request."""
@@ -306,3 +482,28 @@ class TaskManager:
             "/api/v2/batch/taskParent",
             json=[{"taskId": task_id, "projectId": project_id, "parentId": parent_id}],
         ).json()
+
+
+def _new_ids(n: int) -> list[str]:
+    """``n`` random 24-character hex IDs, drawn from one urandom() call."""
+    buf = os.urandom(12 * n).hex()
+    return [buf[i : i + 24] for i in range(0, 24 * n, 24)]
+
+
+def _open_tasks(data: dict) -> list[dict]:
+    """Raw open-task dicts carried by a sync response."""
+    return data.get("syncTaskBean", {}).get("update") or []
+
+
+def _completed_query(project_id: str | None, from_date: str, to_date: str, limit: int) -> tuple[str, dict[str, Any]]:
+    """Endpoint and query parameters for a completed-tasks listing."""
+    if project_id:
+        endpoint = f"/api/v2/project/{project_id}/completed/"
+    else:
+        endpoint = "/api/v2/project/all/completed/"
+    params: dict[str, Any] = {"limit": limit}
+    if from_date:
+        params["from"] = from_date
+    if to_date:
+        params["to"] = to_date
+    return endpoint, params
@@ -18,15 +18,23 @@ class UserManager:
 
     def get_profile(self) -> dict:
         """Get the current user's profile."""
-        return self._c.get("/api/v2/user/profile").json()
+        return self._c.get("/api/v2/user/profile", cacheable=True).json()
+
+    async def aget_profile(self) -> dict:
+        """Async counterpart of get_profile()."""
+        return (await self._c.aget("/api/v2/user/profile")).json()
 
     def get_status(self) -> dict:
         """Get user account status (subscription, limits, etc)."""
         return self._c.get("/api/v2/user/status").json()
 
+    async def aget_status(self) -> dict:
+        """Async counterpart of get_status()."""
+        return (await self._c.aget("/api/v2/user/status")).json()
+
     def get_binding_info(self) -> dict:
         """Get account binding info (linked services)."""
-        return self._c.get("/api/v2/user/userBindingInfo").json()
+        return self._c.get("/api/v2/user/userBindingInfo", cacheable=True).json()
 
     # ── Preferences ───────────────────────────────────────────────────
 
@@ -35,33 +43,60 @@ class UserManager:
         return self._c.get(
             "/api/v2/user/preferences/settings",
             params={"includeWeb": str(include_web).lower()},
+            cacheable=True,
         ).json()
 
+    async def aget_settings(self, include_web: bool = True) -> dict:
+        """Async counterpart of get_settings()."""
+        resp = await self._c.aget(
+            "/api/v2/user/preferences/settings",
+            params={"includeWeb": str(include_web).lower()},
+        )
+        return resp.json()
+
     def update_settings(self, settings: dict) -> dict:
         """Update user preferences / settings."""
         return self._c.post("/api/v2/user/preferences/settings", json=settings).json()
 
     def get_daily_reminder(self) -> dict:
         """Get daily reminder settings."""
-        return self._c.get("/api/v2/user/preferences/dailyReminder").json()
+        return self._c.get("/api/v2/user/preferences/dailyReminder", cacheable=True).json()
 
     def get_feature_prompts(self) -> dict:
         """Get feature prompt preferences (onboarding, tips)."""
-        return self._c.get("/api/v2/user/preferences/featurePrompt").json()
+        return self._c.get("/api/v2/user/preferences/featurePrompt", cacheable=True).json()
 
     def get_habit_preferences(self, platform: str = "web") -> dict:
         """Get habit display preferences."""
-        return self._c.get("/api/v2/user/preferences/habit", params={"platform": platform}).json()
+        return self._c.get("/api/v2/user/preferences/habit", params={"platform": platform}, cacheable=True).json()
 
     def get_ext_preferences(self, mtime: int = 0) -> dict:
         """Get extension/integration preferences."""
-        return self._c.get("/api/v2/user/preferences/ext", params={"mtime": mtime}).json()
+        return self._c.get("/api/v2/user/preferences/ext", params={"mtime": mtime}, cacheable=True).json()
 
     # ── Account limits ────────────────────────────────────────────────
 
     def get_limits(self) -> dict:
         """Get account limits (max tasks, projects, etc)."""
-        return self._c.get("/api/v2/configs/limits").json()
+        return self._c.get("/api/v2/configs/limits", cacheable=True).json()
+
+    async def aget_limits(self) -> dict:
+        """Async counterpart of get_limits()."""
+        return (await self._c.aget("/api/v2/configs/limits")).json()
+
+    async def aget_dashboard(self) -> dict:
+        """Fetch profile, status, settings and limits concurrently.
+
+        Over the async client's HTTP/2 connection the four requests share
+        one connection instead of queueing behind each other.
+
+        Returns:
+            Dict with ``profile``, ``status``, ``settings`` and ``limits``.
+        """
+        profile, status, settings, limits = await self._c.gather(
+            self.aget_profile(), self.aget_status(), self.aget_settings(), self.aget_limits()
+        )
+        return {"profile": profile, "status": status, "settings": settings, "limits": limits}
 
     def get_attachment_quota(self) -> bool:
         """Check if attachment quota is available."""
@@ -83,11 +118,11 @@ class UserManager:
 
     def get_calendar_accounts(self) -> list[dict]:
         """Get linked third-party calendar accounts."""
-        return self._c.get("/api/v2/calendar/third/accounts").json()
+        return self._c.get("/api/v2/calendar/third/accounts", cacheable=True).json()
 
     def get_calendar_subscriptions(self) -> list[dict]:
         """Get calendar subscriptions."""
-        return self._c.get("/api/v2/calendar/subscription").json()
+        return self._c.get("/api/v2/calendar/subscription", cacheable=True).json()
 
     def get_calendar_events(self) -> list[dict]:
         """Get all bound calendar events."""
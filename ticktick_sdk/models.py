@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
+# strptime fallbacks for shapes fromisoformat rejects
+_DT_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S")
 
+
+# Payloads built from parsed models reuse the same (cached) datetimes, so the
+# formatted strings are worth keeping too. Equal datetimes denote the same
+# instant, and so always format to the same UTC string.
+@lru_cache(maxsize=4096)
 def _format_dt(dt: datetime) -> str:
     """Format a datetime for the TickTick API (UTC, millisecond precision)."""
-    utc = dt.astimezone(timezone.utc) if dt.tzinfo else dt
-    return utc.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+    utc = dt.astimezone(timezone.utc) if dt.utcoffset() else dt
+    # Plain field formatting is cheaper than interpreting a strftime pattern
+    return f"{utc.year:04d}-{utc.month:02d}-{utc.day:02d}T{utc.hour:02d}:{utc.minute:02d}:{utc.second:02d}.000+0000"
 
 
-def _parse_dt(val: str | None) -> datetime | None:
+# Sync payloads repeat the same timestamps many times over; datetimes are
+# immutable, so parsed values can be shared between models.
+@lru_cache(maxsize=4096)
+def _parse_dt(val: str | datetime | None) -> datetime | None:
     if not val:
         return None
-    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S"):
+    if isinstance(val, datetime):  # dict built by hand with parsed values
+        return val
+    # fromisoformat is much faster than strptime; before 3.11 it only takes
+    # colon offsets, so rewrite TickTick's usual UTC suffix.
+    iso = val[:-5] + "+00:00" if val[-5:] in ("+0000", "-0000") else val
+    try:
+        return datetime.fromisoformat(iso)
+    except ValueError:
+        pass
+    for fmt in _DT_FORMATS:
         try:
             return datetime.strptime(val, fmt)
         except ValueError:
@@ -24,8 +47,88 @@ def _parse_dt(val: str | None) -> datetime | None:
     return None
 
 
-@dataclass
-class Subtask:
+def _intern(val: Any) -> Any:
+    """Intern small-domain strings (kinds, view modes, time zones) shared by many records."""
+    return sys.intern(val) if type(val) is str else val
+
+
+# ── Serialisation ─────────────────────────────────────────────────────
+#
+# Each model describes its API payload in a ``_FIELDS`` table of
+# (json_key, attribute, encoder, omit) rows, in output order. The encoder
+# (None = value as-is) converts the attribute; omit decides when the key
+# is left out entirely.
+
+_KEEP = 0  # always emitted
+_IF_SET = 1  # omitted when falsy
+_IF_NOT_NONE = 2  # omitted when None
+
+_Field = tuple[str, str, "Callable[[Any], Any] | None", int]
+
+
+def _dump(obj: Any) -> dict:
+    return obj.to_dict()
+
+
+def _dump_all(objs: list) -> list[dict]:
+    return [o.to_dict() for o in objs]
+
+
+class _Model:
+    """Base of the API models; each gets a to_dict() from _compile_to_dict()."""
+
+    __slots__ = ()
+
+    _FIELDS: ClassVar[tuple[_Field, ...]]
+
+    if TYPE_CHECKING:
+
+        def to_dict(self) -> dict: ...
+
+
+_M = TypeVar("_M", bound=_Model)
+
+
+def _compile_to_dict(cls: type[_M]) -> type[_M]:
+    """Install a to_dict generated from ``cls._FIELDS``.
+
+    The generated function is a dict literal for the leading always-emitted
+    keys plus one guarded assignment per remaining row, so no table is
+    interpreted per call.
+    """
+    ns: dict[str, Any] = {}
+
+    def value(i: int, src: str, encode: Callable[[Any], Any] | None) -> str:
+        if encode is None:
+            return src
+        ns[f"_enc{i}"] = encode
+        return f"_enc{i}({src})"
+
+    rows = list(enumerate(cls._FIELDS))
+    head = []
+    while rows and rows[0][1][3] == _KEEP:
+        i, (key, attr, encode, _) = rows.pop(0)
+        head.append(f"{key!r}: {value(i, f'self.{attr}', encode)}")
+    lines = ["def to_dict(self):", f"    d = {{{', '.join(head)}}}"]
+    for i, (key, attr, encode, omit) in rows:
+        if omit == _KEEP:
+            lines.append(f"    d[{key!r}] = {value(i, f'self.{attr}', encode)}")
+            continue
+        test = "v is not None" if omit == _IF_NOT_NONE else "v"
+        lines += [f"    v = self.{attr}", f"    if {test}:", f"        d[{key!r}] = {value(i, 'v', encode)}"]
+    lines.append("    return d")
+    # Source is built only from the class's own _FIELDS table
+    exec(compile("\n".join(lines), f"<{cls.__name__}.to_dict>", "exec"), ns)  # noqa: S102
+    fn = ns["to_dict"]
+    fn.__qualname__ = f"{cls.__name__}.to_dict"
+    fn.__doc__ = f"Serialise to the API's {cls.__name__} payload."
+    cls.to_dict = fn  # type: ignore[method-assign]
+    return cls
+
+
+@_compile_to_dict
+@dataclass(slots=True)
+class Subtask(_Model):
     id: str
     title: str
     status: int = 0  # 0=open, 2=completed
@@ -35,46 +138,52 @@ class Subtask:
     time_zone: str = ""
     completed_time: datetime | None = None
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("title", "title", None, _KEEP),
+        ("status", "status", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+        ("startDate", "start_date", _format_dt, _IF_SET),
+        ("isAllDay", "is_all_day", None, _KEEP),
+        ("timeZone", "time_zone", None, _IF_SET),
+        ("completedTime", "completed_time", _format_dt, _IF_SET),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Subtask:
+        get = d.get
+        parse = _parse_dt
         return cls(
             id=d["id"],
-            title=d.get("title", ""),
-            status=d.get("status", 0),
-            sort_order=d.get("sortOrder", 0),
-            start_date=_parse_dt(d.get("startDate")),
-            is_all_day=d.get("isAllDay", False),
-            time_zone=d.get("timeZone", ""),
-            completed_time=_parse_dt(d.get("completedTime")),
+            title=get("title", ""),
+            status=get("status", 0),
+            sort_order=get("sortOrder", 0),
+            start_date=parse(get("startDate")),
+            is_all_day=get("isAllDay", False),
+            time_zone=_intern(get("timeZone", "")),
+            completed_time=parse(get("completedTime")),
         )
 
-    def to_dict(self) -> dict:
-        d: dict[str, Any] = {"id": self.id, "title": self.title, "status": self.status, "sortOrder": self.sort_order}
-        if self.start_date:
-            d["startDate"] = _format_dt(self.start_date)
-        d["isAllDay"] = self.is_all_day
-        if self.time_zone:
-            d["timeZone"] = self.time_zone
-        if self.completed_time:
-            d["completedTime"] = _format_dt(self.completed_time)
-        return d
 
-
-@dataclass
-class Reminder:
+@_compile_to_dict
+@dataclass(slots=True)
+class Reminder(_Model):
     id: str
     trigger: str  # iCal TRIGGER format, e.g. "TRIGGER:P0DT9H0M0S"
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("trigger", "trigger", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Reminder:
         return cls(id=d["id"], trigger=d.get("trigger", ""))
 
-    def to_dict(self) -> dict:
-        return {"id": self.id, "trigger": self.trigger}
 
-
-@dataclass
-class Task:
+@_compile_to_dict
+@dataclass(slots=True)
+class Task(_Model):
     id: str
     project_id: str
     title: str
@@ -106,106 +215,112 @@ class Task:
     attachments: list[dict] = field(default_factory=list)
     child_ids: list[str] = field(default_factory=list)
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("projectId", "project_id", None, _KEEP),
+        ("title", "title", None, _KEEP),
+        ("content", "content", None, _KEEP),
+        ("desc", "desc", None, _KEEP),
+        ("priority", "priority", None, _KEEP),
+        ("status", "status", None, _KEEP),
+        ("isAllDay", "is_all_day", None, _KEEP),
+        ("isFloating", "is_floating", None, _KEEP),
+        ("kind", "kind", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+        ("items", "items", _dump_all, _KEEP),
+        ("reminders", "reminders", _dump_all, _KEEP),
+        ("tags", "tags", None, _KEEP),
+        ("progress", "progress", None, _KEEP),
+        ("timeZone", "time_zone", None, _IF_SET),
+        ("startDate", "start_date", _format_dt, _IF_SET),
+        ("dueDate", "due_date", _format_dt, _IF_SET),
+        ("repeatFlag", "repeat_flag", None, _IF_SET),
+        ("repeatFrom", "repeat_from", None, _IF_SET),
+        ("parentId", "parent_id", None, _IF_SET),
+        ("columnId", "column_id", None, _IF_SET),
+        ("etag", "etag", None, _IF_SET),
+        ("attachments", "attachments", None, _IF_SET),
+        ("childIds", "child_ids", None, _IF_SET),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Task:
-        items = [Subtask.from_dict(i) for i in d.get("items", []) or []]
-        reminders = [Reminder.from_dict(r) for r in d.get("reminders", []) or []]
+        # Local aliases: LOAD_FAST instead of repeated attribute/global lookups
+        get = d.get
+        parse = _parse_dt
+        subtask = Subtask.from_dict
+        reminder = Reminder.from_dict
+        raw_items = get("items")
+        raw_reminders = get("reminders")
+        items = list(map(subtask, raw_items)) if raw_items else []
+        reminders = list(map(reminder, raw_reminders)) if raw_reminders else []
         return cls(
             id=d["id"],
-            project_id=d.get("projectId", ""),
-            title=d.get("title", ""),
-            content=d.get("content", ""),
-            desc=d.get("desc", ""),
-            priority=d.get("priority", 0),
-            status=d.get("status", 0),
-            tags=d.get("tags") or [],
+            project_id=get("projectId", ""),
+            title=get("title", ""),
+            content=get("content", ""),
+            desc=get("desc", ""),
+            priority=get("priority", 0),
+            status=get("status", 0),
+            tags=list(get("tags") or ()),
             items=items,
             reminders=reminders,
-            start_date=_parse_dt(d.get("startDate")),
-            due_date=_parse_dt(d.get("dueDate")),
-            is_all_day=d.get("isAllDay", False),
-            is_floating=d.get("isFloating", False),
-            time_zone=d.get("timeZone", ""),
-            repeat_flag=d.get("repeatFlag", "") or "",
-            repeat_from=d.get("repeatFrom", "") or "",
-            sort_order=d.get("sortOrder", 0),
-            progress=d.get("progress", 0),
-            kind=d.get("kind", "TEXT"),
-            parent_id=d.get("parentId", "") or "",
-            column_id=d.get("columnId", "") or "",
-            etag=d.get("etag", ""),
-            deleted=d.get("deleted", 0),
-            created_time=_parse_dt(d.get("createdTime")),
-            modified_time=_parse_dt(d.get("modifiedTime")),
-            creator=d.get("creator", 0),
-            comment_count=d.get("commentCount", 0),
-            attachments=d.get("attachments") or [],
-            child_ids=d.get("childIds") or [],
+            start_date=parse(get("startDate")),
+            due_date=parse(get("dueDate")),
+            is_all_day=get("isAllDay", False),
+            is_floating=get("isFloating", False),
+            time_zone=_intern(get("timeZone", "")),
+            repeat_flag=get("repeatFlag") or "",
+            repeat_from=get("repeatFrom") or "",
+            sort_order=get("sortOrder", 0),
+            progress=get("progress", 0),
+            kind=_intern(get("kind", "TEXT")),
+            parent_id=get("parentId") or "",
+            column_id=get("columnId") or "",
+            etag=get("etag", ""),
+            deleted=get("deleted", 0),
+            created_time=parse(get("createdTime")),
+            modified_time=parse(get("modifiedTime")),
+            creator=get("creator", 0),
+            comment_count=get("commentCount", 0),
+            attachments=list(get("attachments") or ()),
+            child_ids=list(get("childIds") or ()),
         )
 
-    def to_dict(self) -> dict:
-        d: dict[str, Any] = {
-            "id": self.id,
-            "projectId": self.project_id,
-            "title": self.title,
-            "content": self.content,
-            "desc": self.desc,
-            "priority": self.priority,
-            "status": self.status,
-            "isAllDay": self.is_all_day,
-            "isFloating": self.is_floating,
-            "kind": self.kind,
-            "sortOrder": self.sort_order,
-            "items": [i.to_dict() for i in self.items],
-            "reminders": [r.to_dict() for r in self.reminders],
-            "tags": self.tags,
-            "progress": self.progress,
-        }
-        if self.time_zone:
-            d["timeZone"] = self.time_zone
-        if self.start_date:
-            d["startDate"] = _format_dt(self.start_date)
-        if self.due_date:
-            d["dueDate"] = _format_dt(self.due_date)
-        if self.repeat_flag:
-            d["repeatFlag"] = self.repeat_flag
-        if self.repeat_from:
-            d["repeatFrom"] = self.repeat_from
-        if self.parent_id:
-            d["parentId"] = self.parent_id
-        if self.column_id:
-            d["columnId"] = self.column_id
-        if self.etag:
-            d["etag"] = self.etag
-        if self.attachments:
-            d["attachments"] = self.attachments
-        if self.child_ids:
-            d["childIds"] = self.child_ids
-        return d
-
-
-@dataclass
-class SortOption:
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> list[Task]:
+        """Build tasks from a list of API dicts."""
+        from_dict = cls.from_dict
+        return [from_dict(d) for d in items]
+
+
+@_compile_to_dict
+@dataclass(slots=True)
+class SortOption(_Model):
     group_by: str = "sortOrder"
     order_by: str = "sortOrder"
     order: str | None = None
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("groupBy", "group_by", None, _KEEP),
+        ("orderBy", "order_by", None, _KEEP),
+        ("order", "order", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict | None) -> SortOption:
         if not d:
             return cls()
         return cls(
-            group_by=d.get("groupBy", "sortOrder"),
-            order_by=d.get("orderBy", "sortOrder"),
+            group_by=_intern(d.get("groupBy", "sortOrder")),
+            order_by=_intern(d.get("orderBy", "sortOrder")),
             order=d.get("order"),
         )
 
-    def to_dict(self) -> dict:
-        return {"groupBy": self.group_by, "orderBy": self.order_by, "order": self.order}
-
 
-@dataclass
-class Project:
+@_compile_to_dict
+@dataclass(slots=True)
+class Project(_Model):
     id: str
     name: str
     is_owner: bool = True
@@ -227,6 +342,20 @@ class Project:
     source: int = 0
     background: str | None = None
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("name", "name", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+        ("sortType", "sort_type", None, _KEEP),
+        ("sortOption", "sort_option", _dump, _KEEP),
+        ("viewMode", "view_mode", None, _KEEP),
+        ("kind", "kind", None, _KEEP),
+        ("inAll", "in_all", None, _KEEP),
+        ("color", "color", None, _IF_SET),
+        ("groupId", "group_id", None, _IF_SET),
+        ("closed", "closed", None, _IF_NOT_NONE),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Project:
         return cls(
@@ -235,7 +364,7 @@ class Project:
             is_owner=d.get("isOwner", True),
             color=d.get("color"),
             sort_order=d.get("sortOrder", 0),
-            sort_type=d.get("sortType", "sortOrder"),
+            sort_type=_intern(d.get("sortType", "sortOrder")),
             sort_option=SortOption.from_dict(d.get("sortOption")),
             user_count=d.get("userCount", 1),
             etag=d.get("etag", ""),
@@ -245,35 +374,23 @@ class Project:
             muted=d.get("muted", False),
             closed=d.get("closed"),
             group_id=d.get("groupId"),
-            view_mode=d.get("viewMode", "list"),
-            kind=d.get("kind", "TASK"),
+            view_mode=_intern(d.get("viewMode", "list")),
+            kind=_intern(d.get("kind", "TASK")),
             team_id=d.get("teamId"),
             source=d.get("source", 0),
             background=d.get("background"),
         )
 
-    def to_dict(self) -> dict:
-        d: dict[str, Any] = {
-            "id": self.id,
-            "name": self.name,
-            "sortOrder": self.sort_order,
-            "sortType": self.sort_type,
-            "sortOption": self.sort_option.to_dict(),
-            "viewMode": self.view_mode,
-            "kind": self.kind,
-            "inAll": self.in_all,
-        }
-        if self.color:
-            d["color"] = self.color
-        if self.group_id:
-            d["groupId"] = self.group_id
-        if self.closed is not None:
-            d["closed"] = self.closed
-        return d
-
-
-@dataclass
-class ProjectGroup:
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> list[Project]:
+        """Build projects from a list of API dicts."""
+        from_dict = cls.from_dict
+        return [from_dict(d) for d in items]
+
+
+@_compile_to_dict
+@dataclass(slots=True)
+class ProjectGroup(_Model):
     id: str
     name: str
     show_all: bool = True
@@ -282,6 +399,13 @@ class ProjectGroup:
     sort_type: str | None = None
     etag: str = ""
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("name", "name", None, _KEEP),
+        ("showAll", "show_all", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> ProjectGroup:
         return cls(
@@ -289,22 +413,15 @@ class ProjectGroup:
             name=d.get("name", ""),
             show_all=d.get("showAll", True),
             sort_order=d.get("sortOrder", 0),
-            view_mode=d.get("viewMode"),
-            sort_type=d.get("sortType"),
+            view_mode=_intern(d.get("viewMode")),
+            sort_type=_intern(d.get("sortType")),
             etag=d.get("etag", ""),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "showAll": self.show_all,
-            "sortOrder": self.sort_order,
-        }
 
-
-@dataclass
-class Tag:
+@_compile_to_dict
+@dataclass(slots=True)
+class Tag(_Model):
     name: str
     raw_name: str = ""
     label: str = ""
@@ -316,38 +433,34 @@ class Tag:
     parent: str = ""  # parent tag name for sub-tags (name is "parent/child")
     sort_option: SortOption = field(default_factory=SortOption)
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("name", "name", None, _KEEP),
+        ("label", "label", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+        ("sortType", "sort_type", None, _KEEP),
+        ("color", "color", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Tag:
         name = d.get("name", "")
-        parent = ""
-        if "/" in name:
-            parts = name.rsplit("/", 1)
-            parent = parts[0]
         return cls(
             name=name,
             raw_name=d.get("rawName", ""),
             label=d.get("label", ""),
             sort_order=d.get("sortOrder", 0),
-            sort_type=d.get("sortType", ""),
+            sort_type=_intern(d.get("sortType", "")),
             color=d.get("color", ""),
             etag=d.get("etag", ""),
             type=d.get("type", 0),
-            parent=parent,
+            parent=name.rpartition("/")[0],
             sort_option=SortOption.from_dict(d.get("sortOption")),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "label": self.label,
-            "sortOrder": self.sort_order,
-            "sortType": self.sort_type,
-            "color": self.color,
-        }
 
-
-@dataclass
-class Filter:
+@_compile_to_dict
+@dataclass(slots=True)
+class Filter(_Model):
     id: str
     name: str
     rule: str = ""  # JSON string defining filter criteria
@@ -359,6 +472,15 @@ class Filter:
     modified_time: datetime | None = None
     sort_option: SortOption = field(default_factory=SortOption)
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("name", "name", None, _KEEP),
+        ("rule", "rule", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+        ("sortType", "sort_type", None, _KEEP),
+        ("viewMode", "view_mode", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Filter:
         return cls(
@@ -366,27 +488,18 @@ class Filter:
             name=d.get("name", ""),
             rule=d.get("rule", ""),
             sort_order=d.get("sortOrder", 0),
-            sort_type=d.get("sortType", ""),
-            view_mode=d.get("viewMode", "list"),
+            sort_type=_intern(d.get("sortType", "")),
+            view_mode=_intern(d.get("viewMode", "list")),
             etag=d.get("etag", ""),
             created_time=_parse_dt(d.get("createdTime")),
             modified_time=_parse_dt(d.get("modifiedTime")),
             sort_option=SortOption.from_dict(d.get("sortOption")),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "rule": self.rule,
-            "sortOrder": self.sort_order,
-            "sortType": self.sort_type,
-            "viewMode": self.view_mode,
-        }
 
-
-@dataclass
-class Habit:
+@_compile_to_dict
+@dataclass(slots=True)
+class Habit(_Model):
     id: str
     name: str
     icon_res: str = ""
@@ -411,6 +524,26 @@ class Habit:
     archived_time: datetime | None = None
     etag: str = ""
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("name", "name", None, _KEEP),
+        ("iconRes", "icon_res", None, _KEEP),
+        ("color", "color", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+        ("status", "status", None, _KEEP),
+        ("encouragement", "encouragement", None, _KEEP),
+        ("type", "type", None, _KEEP),
+        ("goal", "goal", None, _KEEP),
+        ("step", "step", None, _KEEP),
+        ("unit", "unit", None, _KEEP),
+        ("repeatRule", "repeat_rule", None, _KEEP),
+        ("reminders", "reminders", None, _KEEP),
+        ("recordEnable", "record_enable", None, _KEEP),
+        ("sectionId", "section_id", None, _KEEP),
+        ("targetDays", "target_days", None, _KEEP),
+        ("targetStartDate", "target_start_date", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Habit:
         return cls(
@@ -420,14 +553,14 @@ class Habit:
             color=d.get("color", ""),
             sort_order=d.get("sortOrder", 0),
             status=d.get("status", 0),
-            encouragement=d.get("encouragement", "") or "",
+            encouragement=d.get("encouragement") or "",
             total_check_ins=d.get("totalCheckIns", 0),
-            type=d.get("type", "Boolean"),
+            type=_intern(d.get("type", "Boolean")),
             goal=d.get("goal", 1),
             step=d.get("step", 1),
-            unit=d.get("unit", "Count"),
+            unit=_intern(d.get("unit", "Count")),
             repeat_rule=d.get("repeatRule", ""),
-            reminders=d.get("reminders") or [],
+            reminders=list(d.get("reminders") or ()),
             record_enable=d.get("recordEnable", False),
             section_id=d.get("sectionId", ""),
             target_days=d.get("targetDays", 0),
@@ -439,30 +572,16 @@ class Habit:
             etag=d.get("etag", ""),
         )
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "iconRes": self.icon_res,
-            "color": self.color,
-            "sortOrder": self.sort_order,
-            "status": self.status,
-            "encouragement": self.encouragement,
-            "type": self.type,
-            "goal": self.goal,
-            "step": self.step,
-            "unit": self.unit,
-            "repeatRule": self.repeat_rule,
-            "reminders": self.reminders,
-            "recordEnable": self.record_enable,
-            "sectionId": self.section_id,
-            "targetDays": self.target_days,
-            "targetStartDate": self.target_start_date,
-        }
-
-
-@dataclass
-class HabitCheckin:
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> list[Habit]:
+        """Build habits from a list of API dicts."""
+        from_dict = cls.from_dict
+        return [from_dict(d) for d in items]
+
+
+@_compile_to_dict
+@dataclass(slots=True)
+class HabitCheckin(_Model):
     id: str
     habit_id: str
     status: int = 0
@@ -472,6 +591,16 @@ class HabitCheckin:
     goal: float = 1
     etag: str = ""
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("habitId", "habit_id", None, _KEEP),
+        ("status", "status", None, _KEEP),
+        ("value", "value", None, _KEEP),
+        ("checkinStamp", "checkin_stamp", None, _KEEP),
+        ("goal", "goal", None, _IF_SET),
+        ("checkinTime", "checkin_time", _format_dt, _IF_SET),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> HabitCheckin:
         return cls(
@@ -485,23 +614,24 @@ class HabitCheckin:
             etag=d.get("etag", ""),
         )
 
-    def to_dict(self) -> dict:
-        d: dict[str, Any] = {
-            "id": self.id,
-            "habitId": self.habit_id,
-            "status": self.status,
-            "value": self.value,
-            "checkinStamp": self.checkin_stamp,
-        }
-        if self.goal:
-            d["goal"] = self.goal
-        if self.checkin_time:
-            d["checkinTime"] = _format_dt(self.checkin_time)
-        return d
-
-
-@dataclass
-class Column:
+    @property
+    def checkin_date(self) -> date | None:
+        """checkin_stamp as a date, or None when it is unset or not a valid YYYYMMDD stamp."""
+        if not self.checkin_stamp:
+            return None
+        # Plain digit arithmetic; no need to run YYYYMMDD through strptime
+        try:
+            n = int(self.checkin_stamp)
+            if not 10_000_000 <= n <= 99_999_999:
+                return None
+            return date(n // 10000, n // 100 % 100, n % 100)
+        except (TypeError, ValueError):
+            return None
+
+
+@_compile_to_dict
+@dataclass(slots=True)
+class Column(_Model):
     """Kanban column (section within a project)."""
 
     id: str
@@ -510,6 +640,13 @@ class Column:
     sort_order: int = 0
     etag: str = ""
 
+    _FIELDS: ClassVar[tuple[_Field, ...]] = (
+        ("id", "id", None, _KEEP),
+        ("projectId", "project_id", None, _KEEP),
+        ("name", "name", None, _KEEP),
+        ("sortOrder", "sort_order", None, _KEEP),
+    )
+
     @classmethod
     def from_dict(cls, d: dict) -> Column:
         return cls(
@@ -519,11 +656,3 @@ class Column:
             sort_order=d.get("sortOrder", 0),
             etag=d.get("etag", ""),
         )
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "projectId": self.project_id,
-            "name": self.name,
-            "sortOrder": self.sort_order,
-        }